@@ -0,0 +1,20 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Airspeed velocity benchmarks for IMPROVER.
+
+Plugin benchmarks time and measure the peak memory of the most expensive
+plugins on inputs with realistic grid and ensemble sizes, built with
+improver.synthetic_data (see :mod:`.data`).
+
+Run from the benchmarks directory with, for example::
+
+    asv run master^!
+    asv continuous master HEAD
+    asv run --bench "Threshold|NeighbourhoodProcessing" HEAD^!
+
+Results are stored under .asv/results for each commit benchmarked, so that
+they can be compared across commits with ``asv compare`` or browsed with
+``asv publish`` and ``asv preview``.
+"""
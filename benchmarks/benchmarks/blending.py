@@ -0,0 +1,40 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the blending plugins."""
+
+from datetime import timedelta
+
+from .data import FRT, GRIDS, probability_cube
+
+THRESHOLDS = [268.15, 273.15, 278.15, 283.15]
+CYCLES = 4
+
+
+class WeightAndBlend:
+    """Linearly weighted blending of temperature probabilities from four
+    hourly cycles."""
+
+    params = [list(GRIDS)]
+    param_names = ["grid"]
+    timeout = 600
+
+    def setup(self, grid):
+        from improver.blending.calculate_weights_and_blend import WeightAndBlend
+
+        frts = [FRT + timedelta(hours=hour) for hour in range(CYCLES)]
+        self.cubes = [
+            probability_cube(grid, THRESHOLDS, frt=frt, mean=268.0 + i)
+            for i, frt in enumerate(frts)
+        ]
+        self.cycletime = frts[-1].strftime("%Y%m%dT%H%MZ")
+        self.plugin = WeightAndBlend(
+            "forecast_reference_time", "linear", y0val=1, ynval=1
+        )
+
+    def time_process(self, grid):
+        self.plugin([cube.copy() for cube in self.cubes], cycletime=self.cycletime)
+
+    def peakmem_process(self, grid):
+        self.plugin([cube.copy() for cube in self.cubes], cycletime=self.cycletime)
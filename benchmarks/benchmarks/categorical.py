@@ -0,0 +1,81 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the categorical plugins."""
+
+from .data import GRIDS, probability_cube
+
+# Precipitation rate thresholds of 0.03, 0.1 and 1 mm/hr in m/s
+RATE_THRESHOLDS = [8.33333333e-09, 2.77777778e-08, 2.77777778e-07]
+
+
+def _probability_node(if_true, if_false, field, threshold, units):
+    """Decision tree node testing whether a probability is at least 0.5."""
+    return {
+        "if_true": if_true,
+        "if_false": if_false,
+        "probability_thresholds": [0.5],
+        "threshold_condition": ">=",
+        "condition_combination": "",
+        "diagnostic_fields": [f"probability_of_{field}_above_threshold"],
+        "diagnostic_thresholds": [[threshold, units]],
+        "diagnostic_conditions": ["above"],
+    }
+
+
+def precipitation_decision_tree():
+    """Decision tree categorising precipitation intensity and cloud cover."""
+    rate = "lwe_precipitation_rate"
+    cloud = "cloud_area_fraction"
+    return {
+        "meta": {"name": "precipitation_category"},
+        "heavy": _probability_node("heavy_rain", "moderate", rate, 1.0, "mm hr-1"),
+        "moderate": _probability_node("moderate_rain", "light", rate, 0.1, "mm hr-1"),
+        "light": _probability_node("light_rain", "cloud", rate, 0.03, "mm hr-1"),
+        "cloud": _probability_node("overcast", "clear", cloud, 0.8125, 1),
+        "clear": {"leaf": 0},
+        "overcast": {"leaf": 1},
+        "light_rain": {"leaf": 2},
+        "moderate_rain": {"leaf": 3},
+        "heavy_rain": {"leaf": 4},
+    }
+
+
+class ApplyDecisionTree:
+    """Categorisation of precipitation rate and cloud cover probabilities."""
+
+    params = [list(GRIDS)]
+    param_names = ["grid"]
+    timeout = 600
+
+    def setup(self, grid):
+        from improver.categorical.decision_tree import ApplyDecisionTree
+
+        self.cubes = [
+            probability_cube(
+                grid,
+                RATE_THRESHOLDS,
+                variable_name="lwe_precipitation_rate",
+                threshold_units="m s-1",
+                mean=0.0,
+                amplitude=5.0e-7,
+                scale=1.0e-7,
+            ),
+            probability_cube(
+                grid,
+                [0.8125],
+                variable_name="cloud_area_fraction",
+                threshold_units="1",
+                mean=0.3,
+                amplitude=1.0,
+                scale=0.1,
+            ),
+        ]
+        self.plugin = ApplyDecisionTree(precipitation_decision_tree())
+
+    def time_process(self, grid):
+        self.plugin(self.cubes)
+
+    def peakmem_process(self, grid):
+        self.plugin(self.cubes)
@@ -0,0 +1,50 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the start-up time of the improver CLI.
+
+Each benchmark is timed in a fresh interpreter so that import costs are
+included. `timeraw_import_all_subcommands` gives the cost of eagerly importing
+every CLI, for comparison with the lazy dispatch of a single command.
+"""
+
+
+class CliStartup:
+    """Time the start-up of the improver command line interface."""
+
+    timeout = 120
+
+    def timeraw_import_cli(self):
+        """Import the CLI package, building the subcommand dispatcher."""
+        return "import improver.cli"
+
+    def timeraw_help(self):
+        """List all subcommands with `improver help`."""
+        return """
+        import contextlib, io
+        from clize import run
+        from improver.cli import main
+        with contextlib.redirect_stdout(io.StringIO()):
+            run(main, args=["improver", "help"], exit=False)
+        """
+
+    def timeraw_subcommand_help(self):
+        """Dispatch to a single subcommand, which must then be imported."""
+        return """
+        import contextlib, io
+        from clize import run
+        from improver.cli import main
+        with contextlib.redirect_stdout(io.StringIO()):
+            run(main, args=["improver", "threshold", "--help"], exit=False)
+        """
+
+    def timeraw_import_all_subcommands(self):
+        """Import and clizefy every CLI module, as an eager dispatcher would."""
+        return """
+        import importlib
+        from improver.cli import _cli_module_names, clizefy
+        for mod_name in _cli_module_names():
+            mcli = importlib.import_module("improver.cli." + mod_name)
+            clizefy(mcli.process)
+        """
@@ -0,0 +1,157 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Realistically sized benchmark inputs built with improver.synthetic_data.
+
+Fields are smooth large-scale patterns, with independent noise added to each
+realization, on equal area grids with the number of points of the UK 2 km
+domain and of a global 10 km domain.
+"""
+
+from datetime import datetime
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+# Number of (y, x) points and grid spacing in metres of each benchmark grid
+GRIDS: Dict[str, Tuple[Tuple[int, int], float]] = {
+    "uk_2km": ((970, 1042), 2000.0),
+    "global_10km": ((1920, 2560), 10000.0),
+}
+
+# Ensemble sizes of the benchmark realization cubes
+REALIZATIONS = [18, 50]
+
+TIME = datetime(2017, 11, 10, 12, 0)
+FRT = datetime(2017, 11, 10, 6, 0)
+
+
+def grid_spacing(grid: str) -> float:
+    """Grid spacing of a benchmark grid in metres."""
+    return GRIDS[grid][1]
+
+
+def grid_kwargs(grid: str) -> Dict:
+    """Keyword arguments setting up cubes on a benchmark grid."""
+    _, spacing = GRIDS[grid]
+    return {
+        "spatial_grid": "equalarea",
+        "x_grid_spacing": spacing,
+        "y_grid_spacing": spacing,
+    }
+
+
+def base_field(grid: str) -> np.ndarray:
+    """Smooth field between 0 and 1 with several features across the grid."""
+    (ny, nx), _ = GRIDS[grid]
+    y = np.linspace(0, 8 * np.pi, ny, dtype=np.float32)[:, np.newaxis]
+    x = np.linspace(0, 10 * np.pi, nx, dtype=np.float32)[np.newaxis, :]
+    field = np.sin(x) * np.cos(y) + np.sin(0.3 * x + 1) * np.cos(0.5 * y)
+    return (0.5 + 0.25 * field).astype(np.float32)
+
+
+def ensemble_data(
+    grid: str,
+    realizations: int,
+    mean: float,
+    amplitude: float,
+    spread: float,
+    seed: int = 0,
+) -> np.ndarray:
+    """Realizations of a smooth field with independent noise added to each.
+
+    Args:
+        grid:
+            Name of the benchmark grid.
+        realizations:
+            Number of realizations.
+        mean:
+            Value of the field where the base field is zero.
+        amplitude:
+            Range of the smooth part of the field.
+        spread:
+            Standard deviation of the noise added to each realization.
+        seed:
+            Random seed for the noise.
+
+    Returns:
+        Array of the realizations, ordered realization-y-x.
+    """
+    (ny, nx), _ = GRIDS[grid]
+    rng = np.random.default_rng(seed)
+    data = rng.standard_normal((realizations, ny, nx), dtype=np.float32)
+    data *= spread
+    data += mean + amplitude * base_field(grid)
+    return data
+
+
+def variable_cube(
+    grid: str,
+    realizations: int,
+    name: str = "air_temperature",
+    units: str = "K",
+    mean: float = 270.0,
+    amplitude: float = 20.0,
+    spread: float = 1.0,
+    **kwargs,
+):
+    """Realization cube of a variable on a benchmark grid. See
+    :func:`ensemble_data` for the arguments describing the field, with
+    further keyword arguments passed to set_up_variable_cube."""
+    from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+
+    data = ensemble_data(grid, realizations, mean, amplitude, spread)
+    kwargs.setdefault("time", TIME)
+    kwargs.setdefault("frt", FRT)
+    return set_up_variable_cube(
+        data, name=name, units=units, **grid_kwargs(grid), **kwargs
+    )
+
+
+def probability_cube(
+    grid: str,
+    thresholds: Sequence[float],
+    variable_name: str = "air_temperature",
+    threshold_units: str = "K",
+    mean: float = 270.0,
+    amplitude: float = 20.0,
+    scale: float = 2.0,
+    **kwargs,
+):
+    """Cube of probabilities of a smooth field exceeding each threshold.
+
+    Probabilities decrease smoothly with increasing threshold, following a
+    logistic curve of the given scale centred on the value of the field.
+    Further keyword arguments are passed to set_up_probability_cube.
+    """
+    from improver.synthetic_data.set_up_test_cubes import set_up_probability_cube
+
+    field = mean + amplitude * base_field(grid)
+    thresholds = np.array(thresholds, dtype=np.float32)
+    data = 1 / (1 + np.exp((thresholds[:, np.newaxis, np.newaxis] - field) / scale))
+    kwargs.setdefault("time", TIME)
+    kwargs.setdefault("frt", FRT)
+    return set_up_probability_cube(
+        data.astype(np.float32),
+        thresholds,
+        variable_name=variable_name,
+        threshold_units=threshold_units,
+        **grid_kwargs(grid),
+        **kwargs,
+    )
+
+
+def percentile_cube(grid: str, realizations: int, **kwargs):
+    """Cube of evenly spaced percentiles of a temperature ensemble, with as
+    many percentiles as realizations. Keyword arguments are passed to
+    set_up_percentile_cube."""
+    from improver.synthetic_data.set_up_test_cubes import set_up_percentile_cube
+
+    data = np.sort(ensemble_data(grid, realizations, 271.0, 20.0, 1.0, seed=1), 0)
+    percentiles = (np.arange(realizations, dtype=np.float32) + 0.5) * (
+        100 / realizations
+    )
+    kwargs.setdefault("time", TIME)
+    kwargs.setdefault("frt", FRT)
+    return set_up_percentile_cube(data, percentiles, **grid_kwargs(grid), **kwargs)
@@ -0,0 +1,56 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the ensemble copula coupling plugins."""
+
+import numpy as np
+
+from .data import GRIDS, REALIZATIONS, percentile_cube, probability_cube, variable_cube
+
+
+class ConvertProbabilitiesToPercentiles:
+    """Conversion of temperature probabilities at twenty thresholds to as
+    many percentiles as there would be realizations."""
+
+    params = [list(GRIDS), REALIZATIONS]
+    param_names = ["grid", "realizations"]
+    timeout = 600
+
+    def setup(self, grid, realizations):
+        from improver.ensemble_copula_coupling.ensemble_copula_coupling import (
+            ConvertProbabilitiesToPercentiles,
+        )
+
+        self.cube = probability_cube(grid, list(np.arange(250.0, 310.0, 3.0)))
+        self.plugin = ConvertProbabilitiesToPercentiles()
+
+    def time_process(self, grid, realizations):
+        self.plugin(self.cube, no_of_percentiles=realizations)
+
+    def peakmem_process(self, grid, realizations):
+        self.plugin(self.cube, no_of_percentiles=realizations)
+
+
+class EnsembleReordering:
+    """Reordering of temperature percentiles to the rank order of the raw
+    ensemble."""
+
+    params = [list(GRIDS), REALIZATIONS]
+    param_names = ["grid", "realizations"]
+    timeout = 600
+
+    def setup(self, grid, realizations):
+        from improver.ensemble_copula_coupling.ensemble_copula_coupling import (
+            EnsembleReordering,
+        )
+
+        self.percentiles = percentile_cube(grid, realizations)
+        self.raw = variable_cube(grid, realizations)
+        self.plugin = EnsembleReordering()
+
+    def time_process(self, grid, realizations):
+        self.plugin(self.percentiles, self.raw, random_seed=0)
+
+    def peakmem_process(self, grid, realizations):
+        self.plugin(self.percentiles, self.raw, random_seed=0)
@@ -0,0 +1,66 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the neighbourhood processing plugins."""
+
+import numpy as np
+
+from .data import GRIDS, grid_kwargs, grid_spacing, probability_cube
+
+THRESHOLDS = [268.15, 273.15, 278.15, 283.15]
+
+
+class NeighbourhoodProcessing:
+    """Neighbourhood processing of temperature probabilities, with a radius
+    of ten grid lengths."""
+
+    params = [list(GRIDS), ["square", "circular"]]
+    param_names = ["grid", "method"]
+    timeout = 600
+
+    def setup(self, grid, method):
+        from improver.nbhood.nbhood import NeighbourhoodProcessing
+
+        self.cube = probability_cube(grid, THRESHOLDS)
+        self.plugin = NeighbourhoodProcessing(method, 10 * grid_spacing(grid))
+
+    def time_process(self, grid, method):
+        self.plugin(self.cube)
+
+    def peakmem_process(self, grid, method):
+        self.plugin(self.cube)
+
+
+class RecursiveFilter:
+    """Recursive filtering of temperature probabilities with uniform
+    smoothing coefficients."""
+
+    params = [list(GRIDS)]
+    param_names = ["grid"]
+    timeout = 600
+
+    def setup(self, grid):
+        from improver.nbhood.recursive_filter import RecursiveFilter
+        from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+
+        self.cube = probability_cube(grid, THRESHOLDS)
+        (ny, nx), _ = GRIDS[grid]
+        # the benchmark grids are centred on the origin, so grids one point
+        # shorter have points midway between those of the full grid
+        self.coefficients = [
+            set_up_variable_cube(
+                np.full(shape, 0.4, dtype=np.float32),
+                name=f"smoothing_coefficient_{axis}",
+                units="1",
+                **grid_kwargs(grid),
+            )
+            for axis, shape in (("x", (ny, nx - 1)), ("y", (ny - 1, nx)))
+        ]
+        self.plugin = RecursiveFilter(iterations=2)
+
+    def time_process(self, grid):
+        self.plugin(self.cube, list(self.coefficients))
+
+    def peakmem_process(self, grid):
+        self.plugin(self.cube, list(self.coefficients))
@@ -0,0 +1,44 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the nowcasting plugins."""
+
+from datetime import timedelta
+
+import numpy as np
+
+from .data import TIME, base_field, grid_kwargs
+
+
+class OpticalFlow:
+    """Optical flow between two radar-like precipitation rate fields 15
+    minutes apart, on the UK domain for which nowcasts are produced."""
+
+    params = [["uk_2km"]]
+    param_names = ["grid"]
+    timeout = 600
+
+    def setup(self, grid):
+        from improver.nowcasting.optical_flow import OpticalFlow
+        from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+
+        rain = np.clip(40 * base_field(grid) - 22, 0, None).astype(np.float32)
+        self.cubes = [
+            set_up_variable_cube(
+                np.roll(rain, (shift, 2 * shift), axis=(0, 1)),
+                name="lwe_precipitation_rate",
+                units="mm h-1",
+                time=TIME + timedelta(minutes=15 * shift),
+                frt=TIME + timedelta(minutes=15 * shift),
+                **grid_kwargs(grid),
+            )
+            for shift in range(2)
+        ]
+        self.plugin = OpticalFlow()
+
+    def time_process(self, grid):
+        self.plugin(*self.cubes)
+
+    def peakmem_process(self, grid):
+        self.plugin(*self.cubes)
@@ -0,0 +1,48 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the psychrometric calculation plugins."""
+
+from .data import GRIDS, REALIZATIONS, variable_cube
+
+
+class WetBulbTemperature:
+    """Wet bulb temperature of a screen level ensemble."""
+
+    params = [list(GRIDS), REALIZATIONS]
+    param_names = ["grid", "realizations"]
+    timeout = 900
+
+    def setup(self, grid, realizations):
+        from improver.psychrometric_calculations.wet_bulb_temperature import (
+            WetBulbTemperature,
+        )
+
+        self.cubes = [
+            variable_cube(grid, realizations),
+            variable_cube(
+                grid,
+                realizations,
+                name="relative_humidity",
+                units="%",
+                mean=60.0,
+                amplitude=30.0,
+            ),
+            variable_cube(
+                grid,
+                realizations,
+                name="air_pressure",
+                units="Pa",
+                mean=97000.0,
+                amplitude=6000.0,
+                spread=50.0,
+            ),
+        ]
+        self.plugin = WetBulbTemperature()
+
+    def time_process(self, grid, realizations):
+        self.plugin(self.cubes)
+
+    def peakmem_process(self, grid, realizations):
+        self.plugin(self.cubes)
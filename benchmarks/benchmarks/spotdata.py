@@ -0,0 +1,56 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the spot data plugins."""
+
+import numpy as np
+
+from .data import GRIDS, REALIZATIONS, variable_cube
+
+SITES = 20000
+
+
+class SpotExtraction:
+    """Extraction of a temperature ensemble at randomly placed sites."""
+
+    params = [list(GRIDS), REALIZATIONS]
+    param_names = ["grid", "realizations"]
+    timeout = 600
+
+    def setup(self, grid, realizations):
+        from improver.metadata.utilities import create_coordinate_hash
+        from improver.spotdata.build_spotdata_cube import build_spotdata_cube
+        from improver.spotdata.spot_extraction import SpotExtraction
+
+        self.cube = variable_cube(grid, realizations)
+        (ny, nx), _ = GRIDS[grid]
+        rng = np.random.default_rng(0)
+        neighbours = np.stack(
+            [
+                rng.integers(0, nx, SITES),
+                rng.integers(0, ny, SITES),
+                np.zeros(SITES),
+            ]
+        ).astype(np.float32)[np.newaxis]
+        self.neighbour_cube = build_spotdata_cube(
+            neighbours,
+            "grid_neighbours",
+            1,
+            np.zeros(SITES, dtype=np.float32),
+            rng.uniform(-90, 90, SITES).astype(np.float32),
+            rng.uniform(-180, 180, SITES).astype(np.float32),
+            [f"{site:05d}" for site in range(SITES)],
+            grid_attributes=["x_index", "y_index", "vertical_displacement"],
+            neighbour_methods=["nearest"],
+        )
+        self.neighbour_cube.attributes["model_grid_hash"] = create_coordinate_hash(
+            self.cube
+        )
+        self.plugin = SpotExtraction()
+
+    def time_process(self, grid, realizations):
+        self.plugin(self.neighbour_cube, self.cube)
+
+    def peakmem_process(self, grid, realizations):
+        self.plugin(self.neighbour_cube, self.cube)
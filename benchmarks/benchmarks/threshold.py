@@ -0,0 +1,33 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the threshold plugin."""
+
+import numpy as np
+
+from .data import GRIDS, REALIZATIONS, variable_cube
+
+
+class Threshold:
+    """Thresholding of a temperature ensemble at ten thresholds, collapsing
+    the realizations to probabilities."""
+
+    params = [list(GRIDS), REALIZATIONS]
+    param_names = ["grid", "realizations"]
+    timeout = 600
+
+    def setup(self, grid, realizations):
+        from improver.threshold import Threshold
+
+        self.cube = variable_cube(grid, realizations)
+        self.plugin = Threshold(
+            threshold_values=list(np.arange(260.0, 290.0, 3.0)),
+            collapse_coord="realization",
+        )
+
+    def time_process(self, grid, realizations):
+        self.plugin(self.cube)
+
+    def peakmem_process(self, grid, realizations):
+        self.plugin(self.cube)
@@ -4,14 +4,26 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module containing plugin base class."""
 
+import os
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 
-from pkg_resources import DistributionNotFound, get_distribution
+from improver import trace as _trace
 
 try:
-    __version__ = get_distribution("improver").version
-except DistributionNotFound:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:
+    # Python < 3.8, fall back to the (much slower to import) pkg_resources
+    from pkg_resources import DistributionNotFound as PackageNotFoundError
+    from pkg_resources import get_distribution
+
+    def version(distribution_name):
+        return get_distribution(distribution_name).version
+
+
+try:
+    __version__ = version("improver")
+except PackageNotFoundError:
     # package is not installed
     pass
 
@@ -32,6 +44,15 @@ class BasePlugin(ABC):
         Returns:
             Output of self.process()
         """
+        if os.environ.get("IMPROVER_CHUNKED_EXECUTION") and hasattr(
+            self, "chunk_coords"
+        ):
+            from improver.utilities import chunking
+
+            if not chunking.chunking_active():
+                return chunking.call_chunked(self, *args, **kwargs)
+        if _trace.ACTIVE_TRACER is not None:
+            return _trace.ACTIVE_TRACER.call(self, self.process, *args, **kwargs)
         return self.process(*args, **kwargs)
 
     @abstractmethod
@@ -4,8 +4,10 @@
 # See LICENSE in the root of the repository for full licensing details.
 """init for cli and clize"""
 
+import os
 import pathlib
 import shlex
+import sys
 import time
 from collections import OrderedDict
 from functools import partial
@@ -325,6 +327,16 @@ def with_output(
     `least_significant_digit` provided, it will quantize the data to a certain number of
     significant figures.
 
+    If `output` ends in ".imp", the result is saved uncompressed in the
+    intermediate format of :mod:`improver.utilities.intermediate`, which is
+    quicker to write and read for files passed between commands, and the
+    compression options are ignored.
+
+    If the IMPROVER_ASYNC_SAVE environment variable is set to a number of
+    threads, the result is saved in the background so that the caller can
+    continue processing while it is compressed and written. See
+    :func:`improver.utilities.save.wait_for_saves`.
+
     Args:
         wrapped (obj):
             The function to be wrapped.
@@ -346,12 +358,28 @@ def with_output(
     Returns:
         Result of calling `wrapped` or None if `output` is given.
     """
-    from improver.utilities.save import save_netcdf
+    from improver.utilities.intermediate import is_intermediate, save_intermediate
+    from improver.utilities.save import (
+        async_save_workers,
+        save_netcdf,
+        save_netcdf_async,
+    )
 
     result = wrapped(*args, **kwargs)
 
     if output and result:
-        save_netcdf(result, output, compression_level, least_significant_digit)
+        if is_intermediate(output):
+            save_intermediate(result, output)
+        elif async_save_workers():
+            save_netcdf_async(
+                result,
+                output,
+                compression_level,
+                least_significant_digit,
+                copy=pass_through_output,
+            )
+        else:
+            save_netcdf(result, output, compression_level, least_significant_digit)
         if pass_through_output:
             return ObjectAsStr(result, output)
         return
@@ -397,19 +425,85 @@ def command_executor(*argv, verbose=False, dry_run=False):
     )
 
 
-def _cli_items():
-    """Dynamically discover CLIs."""
-    import importlib
+class LazySubcommand:
+    """CLI object for a subcommand whose module is imported on first use.
+
+    The help summary and usages are taken from the static subcommand index
+    (see :mod:`improver.cli._subcommand_index`) so that dispatching to, or
+    listing, commands does not require importing every CLI module. Where a
+    command is missing from the index, its help is obtained by importing it.
+    """
+
+    def __init__(self, module_name, description=None, usages=None):
+        """Initialise the lazy subcommand.
+
+        Args:
+            module_name (str):
+                Name of the module within improver.cli providing `process`.
+            description (str or None):
+                Help summary for the command, as shown by `improver help`.
+            usages (tuple of str or None):
+                Usage strings for the command, as shown by
+                `improver help --usage`.
+        """
+        self.module_name = module_name
+        self._description = description
+        self._usages = usages
+        self._cli = None
+
+    @property
+    def cli(self):
+        """The object clize should use as the CLI for this subcommand."""
+        return self
+
+    @property
+    def helper(self):
+        """Help provider used by clize when listing subcommands."""
+        if self._description is None or self._usages is None:
+            return self.load().helper
+        return self
+
+    @property
+    def description(self):
+        """Help summary from the static index."""
+        return self._description
+
+    def usages(self):
+        """Usage strings from the static index."""
+        return iter(self._usages)
+
+    def load(self):
+        """Import the subcommand module and return its clize CLI object."""
+        if self._cli is None:
+            import importlib
+
+            mcli = importlib.import_module("improver.cli." + self.module_name)
+            self._cli = clizefy(mcli.process).cli
+        return self._cli
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+
+def _cli_module_names():
+    """Names of the CLI modules within improver.cli, without importing them."""
     import pkgutil
 
     from improver.cli import __path__ as improver_cli_pkg_path
 
-    yield ("help", improver_help)
     for minfo in pkgutil.iter_modules(improver_cli_pkg_path):
         mod_name = minfo.name
-        if mod_name != "__main__":
-            mcli = importlib.import_module("improver.cli." + mod_name)
-            yield (mod_name, clizefy(mcli.process))
+        if mod_name != "__main__" and not mod_name.startswith("_"):
+            yield mod_name
+
+
+def _cli_items():
+    """Dynamically discover CLIs, deferring their import until used."""
+    from improver.cli._subcommand_index import SUBCOMMAND_INDEX
+
+    yield ("help", improver_help)
+    for mod_name in _cli_module_names():
+        yield (mod_name, LazySubcommand(mod_name, *SUBCOMMAND_INDEX.get(mod_name, ())))
 
 
 SUBCOMMANDS_TABLE = OrderedDict(sorted(_cli_items()))
@@ -517,6 +611,9 @@ def main(
     *args,
     profile: value_converter(lambda _: _, name="FILENAME") = None,  # noqa: F821
     memprofile: value_converter(lambda _: _, name="FILENAME") = None,  # noqa: F821
+    memprofile_interval: float = None,
+    trace: value_converter(lambda _: _, name="FILENAME") = None,  # noqa: F821
+    max_memory: value_converter(lambda _: _, name="SIZE") = None,  # noqa: F821
     verbose=False,
     dry_run=False,
 ):
@@ -545,6 +642,22 @@ def main(
             of your program (suffixed with _SNAPSHOT)
             and a track of the maximum memory used by your program
             over time (suffixed with _MAX_TRACKER).
+        memprofile_interval (float):
+            If given with memprofile, instead samples the resident and unique
+            memory every this many seconds without tracemalloc, which has
+            little overhead. Creates a timeline of the samples tagged with
+            the plugins running (suffixed with _TIMELINE.csv) and a report of
+            the peak memory while each plugin was running (suffixed with
+            _PEAKS).
+        trace (str):
+            If given, will record every plugin call, including nested calls,
+            and write a Chrome trace (viewable in chrome://tracing) to the
+            file given. A summary per plugin is printed to stderr.
+        max_memory (str):
+            If given, plugins which process their data in batches choose
+            batch sizes to use up to about this much memory, as a number of
+            bytes with an optional K, M, G or T suffix, e.g. 4G. Equivalent
+            to setting the IMPROVER_MAX_MEMORY environment variable.
         verbose (bool):
             Print executed commands
         dry_run (bool):
@@ -555,14 +668,25 @@ def main(
     """
     args = unbracket(args)
     exec_cmd = execute_command
+    if max_memory is not None:
+        from improver.utilities.memory_budget import MAX_MEMORY_ENV, parse_memory_size
+
+        parse_memory_size(max_memory)
+        os.environ[MAX_MEMORY_ENV] = max_memory
     if profile is not None:
         from improver.profile import profile_hook_enable
 
         profile_hook_enable(dump_filename=None if profile == "-" else profile)
+    if trace is not None:
+        from improver.trace import trace_hook_enable
+
+        trace_hook_enable(dump_filename=trace)
     if memprofile is not None:
         from improver.memprofile import memory_profile_decorator
 
-        exec_cmd = memory_profile_decorator(exec_cmd, memprofile)
+        exec_cmd = memory_profile_decorator(
+            exec_cmd, memprofile, interval=memprofile_interval
+        )
     result = exec_cmd(
         SUBCOMMANDS_DISPATCHER,
         prog_name,
@@ -571,6 +695,10 @@ def main(
         verbose=verbose,
         dry_run=dry_run,
     )
+    save_module = sys.modules.get("improver.utilities.save")
+    if save_module is not None:
+        # complete any background saves before reporting success
+        save_module.wait_for_saves()
     return result
 
 
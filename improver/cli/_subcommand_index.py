@@ -0,0 +1,783 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Static index of IMPROVER CLI subcommands.
+
+Maps each CLI module name to its help summary and usages.
+Generated by ``python -m improver.developer_tools.subcommand_index``,
+do not edit by hand.
+"""
+
+SUBCOMMAND_INDEX = {
+    "aggregate_reliability_tables": (
+        "Aggregate reliability tables.",
+        (
+            "[--coordinates=COMMA_SEPARATED_LIST] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "apply_beta_recalibration": (
+        "Runs probability recalibration.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube recalibration-config",
+            "--help [--usage]",
+        ),
+    ),
+    "apply_bias_correction": (
+        "Apply simple bias correction to ensemble members based on the bias from the reference forecast dataset.",
+        (
+            "[--lower-bound=FLOAT] [--upper-bound=FLOAT] [--fill-masked-bias-data] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "apply_dz_rescaling": (
+        "Apply a scaling factor to account for a correction linked to the difference in altitude between the grid point and the site location.",
+        (
+            "[--site-id-coord=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] forecast scaling-factor",
+            "--help [--usage]",
+        ),
+    ),
+    "apply_emos_coefficients": (
+        "Applying coefficients for Ensemble Model Output Statistics.",
+        (
+            "[--validity-times=COMMA_SEPARATED_LIST] [--realizations-count=INT] [--randomise] [--random-seed=INT] [--ignore-ecc-bounds-exceedance] [--tolerate-time-mismatch] [--predictor=STR] [--land-sea-mask-name=STR] [--percentiles=COMMA_SEPARATED_LIST] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "apply_height_adjustment": (
+        "Apply height adjustment to account for the difference between site altitude and grid square orography. The spot forecast contains information representative of the associated grid point. This needs to be adjusted to reflect the true site altitude.",
+        (
+            "[--land-constraint] [--similar-altitude] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] spot-cube neighbour",
+            "--help [--usage]",
+        ),
+    ),
+    "apply_lapse_rate": (
+        "Apply downscaling temperature adjustment using calculated lapse rate.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] temperature lapse-rate source-orography target-orography",
+            "--help [--usage]",
+        ),
+    ),
+    "apply_mask": (
+        "Applies provided mask to cube data. The mask_name is used to extract the mask cube from the input cubelist. The other cube in the cubelist is then masked using the mask data. If invert_mask is True, the mask will be inverted before it is applied.",
+        (
+            "--mask-name=STR [--invert-mask=BOOL] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "apply_night_mask": (
+        "Sets night values to zero for UV index.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "apply_rainforests_calibration": (
+        "Calibrate a forecast cube using the Rainforests method.",
+        (
+            "--model-config=INPUTJSON [--output-thresholds=COMMA_SEPARATED_LIST_OF_FLOAT] [--output-threshold-config=INPUTJSON] [--threshold-units=STR] [--threads=INT] [--bin-data] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] forecast [features...]",
+            "--help [--usage]",
+        ),
+    ),
+    "apply_reliability_calibration": (
+        "Calibrate a probability forecast using the provided reliability calibration table. This calibration is designed to improve the reliability of probability forecasts without significantly degrading their resolution. If a reliability table is not provided, the input forecast is returned unchanged.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] forecast [reliability-table] [point-by-point]",
+            "--help [--usage]",
+        ),
+    ),
+    "batch": (
+        "Run an improver command for each input file matching a glob pattern.",
+        (
+            "--inputs-glob=STR --output-template=STR [--workers=INT] [--shared=COMMA_SEPARATED_LIST] command [args...]",
+            "--help [--usage]",
+        ),
+    ),
+    "between_thresholds": (
+        "Calculate the probabilities of occurrence between thresholds",
+        (
+            "--threshold-ranges=INPUTJSON [--threshold-units=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "blend_adjacent_points": (
+        "Runs weighted blending across adjacent points.",
+        (
+            "--coordinate=STR --central-point=FLOAT [--units=STR] [--width=FLOAT] [--calendar=STR] [--blend-time-using-forecast-period] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "blend_cycles_and_realizations": (
+        "Runs equal-weighted blending for a specific scenario.",
+        (
+            "[--cycletime=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "blend_with_vicinity_and_rename": (
+        "Runs weighted blending, with additional options to handle mismatched in_vicinity coords and to apply a new name to the output cube.",
+        (
+            "--coordinate=STR [--new-name=STR] [--vicinity-radius=FLOAT] [--weighting-method=STR] [--weighting-coord=STR] [--weighting-config=INPUTJSON] [--attributes-config=INPUTJSON] [--cycletime=STR] [--y0val=FLOAT] [--ynval=FLOAT] [--cval=FLOAT] [--model-id-attr=STR] [--record-run-attr=STR] [--spatial-weights-from-mask] [--fuzzy-length=FLOAT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "calculate_forecast_bias": (
+        "Calculate forecast bias from the specified set of historical forecasts and truth values.",
+        (
+            "--truth-attribute=STR [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "categorical": (
+        "Generates categorical data. Uses a decision tree to determine which category represents each location in the input cubes. Used to generate categorical data like weather symbols.",
+        (
+            "[--decision-tree=INPUTJSON] [--model-id-attr=STR] [--record-run-attr=STR] [--target-period=INT] [--check-tree] [--title=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "categorical_modes": (
+        "Generates a modal category for the period covered by the input categorical cubes. Where there are different categories available for night and day, the modal code returned is always a day code, regardless of the times covered by the input files.  Designed for use with weather symbol data.",
+        (
+            "[--decision-tree=INPUTJSON] [--model-id-attr=STR] [--record-run-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "clip": (
+        "max_value and any data below min_value is set equal to min_value.",
+        (
+            "[--max-value=FLOAT] [--min-value=FLOAT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "cloud_condensation_level": (
+        "Module to generate cloud condensation level.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "cloud_top_temperature": (
+        "Module to calculate the convective cloud top temperature from the cloud condensation level temperature and pressure, and temperature on pressure levels data.  The temperature is that of the parcel after saturated ascent at the last pressure level where the parcel is buoyant.  If the cloud top temperature is less than 4K colder than the cloud condensation level, the cloud top temperature is masked.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] ccl-cubes temperature",
+            "--help [--usage]",
+        ),
+    ),
+    "collapse_realizations": (
+        "Collapse the realization dimension of a cube.",
+        (
+            "[--method=STR] [--new-name=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "combine": (
+        "Combine input cubes.",
+        (
+            "[--operation=STR] [--new-name=STR] [--broadcast=STR] [--minimum-realizations=STR] [--cell-method-coordinate=STR] [--expand-bound=BOOL] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "compare": (
+        "Compare two netcdf files",
+        (
+            "[--ignored-attributes=COMMA_SEPARATED_LIST] actual desired [rtol] [atol]",
+            "--help [--usage]",
+        ),
+    ),
+    "construct_reliability_tables": (
+        "Populate reliability tables for use in reliability calibration.",
+        (
+            "--truth-attribute=STR [--n-probability-bins=INT] [--single-value-lower-limit] [--single-value-upper-limit] [--aggregate-coordinates=COMMA_SEPARATED_LIST] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "convection_ratio": (
+        "Calculate the convection ratio from convective and dynamic (stratiform) precipitation rate components.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "copy_metadata": (
+        "Copy attribute values from template_cube to cube, overwriting any existing values.",
+        (
+            "[--attributes=COMMA_SEPARATED_LIST] [--aux-coord=COMMA_SEPARATED_LIST] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube template-cube",
+            "--help [--usage]",
+        ),
+    ),
+    "create_grid_with_halo": (
+        "Generate a zeroed grid with halo from a source cube.",
+        (
+            "[--halo-radius=FLOAT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "cubelist_extract": (
+        "Extract a single cube from a cubelist whose name matches the provided name.",
+        (
+            "--name=STR [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cubes",
+            "--help [--usage]",
+        ),
+    ),
+    "duration_subdivision": (
+        "Subdivide a duration diagnostic, e.g. sunshine duration, into shorter periods, optionally applying a night mask to ensure that quantities defined only in the day or night are not spread into night or day periods respectively.",
+        (
+            "--target-period=INT --fidelity=INT [--night-mask] [--day-mask] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "enforce_consistent_forecasts": (
+        "Module to enforce that the values in the forecast cube are not less than, not greater than, or between some linear function(s) of the corresponding values in the reference forecast.",
+        (
+            "[--ref-name=STR] [--additive-amount=COMMA_SEPARATED_LIST_OF_FLOAT] [--multiplicative-amount=COMMA_SEPARATED_LIST_OF_FLOAT] [--comparison-operator=COMMA_SEPARATED_LIST] [--diff-for-warning=FLOAT] [--use-latest-update-time] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "estimate_dz_rescaling": (
+        "Estimate a scaling factor to account for a correction linked to the difference in altitude between the grid point and the site location. Note that the output will have the same sites as provided by the neighbour cube.",
+        (
+            "--forecast-period=INT [--dz-lower-bound=FLOAT] [--dz-upper-bound=FLOAT] [--land-constraint] [--similar-altitude] [--site-id-coord=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] forecast truth neighbour-cube",
+            "--help [--usage]",
+        ),
+    ),
+    "estimate_emos_coefficients": (
+        "Estimate coefficients for Ensemble Model Output Statistics.",
+        (
+            "--distribution=STR --truth-attribute=STR [--point-by-point] [--use-default-initial-guess] [--units=STR] [--predictor=STR] [--tolerance=FLOAT] [--max-iterations=INT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "estimate_emos_coefficients_from_table": (
+        "Estimate coefficients for Ensemble Model Output Statistics.",
+        (
+            "--diagnostic=STR --cycletime=STR --forecast-period=STR --training-length=STR --distribution=STR [--point-by-point] [--use-default-initial-guess] [--units=STR] [--predictor=STR] [--tolerance=FLOAT] [--max-iterations=INT] [--percentiles=COMMA_SEPARATED_LIST] [--experiment=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] forecast truth [additional-predictors]",
+            "--help [--usage]",
+        ),
+    ),
+    "expected_value": (
+        "Calculate expected value from probabilistic data.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "extend_radar_mask": (
+        "Extend radar mask based on coverage data.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube coverage",
+            "--help [--usage]",
+        ),
+    ),
+    "extract": (
+        "Extract a subset of a single cube.",
+        (
+            "--constraints=STR... [--units=COMMA_SEPARATED_LIST] [--ignore-failure] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "extract_from_table": (
+        "Extract values from a table based on the provided row and column cubes.",
+        (
+            "--table=INPUTJSON --row-name=STR [--new-name=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "feels_like_temp": (
+        "Calculates the feels like temperature using the data in the input cube.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] temperature wind-speed relative-humidity pressure",
+            "--help [--usage]",
+        ),
+    ),
+    "field_texture": (
+        "Calculates field texture for a given neighbourhood radius.",
+        (
+            "[--nbhood-radius=FLOAT] [--textural-threshold=FLOAT] [--diagnostic-threshold=FLOAT] [--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "fill_radar_holes": (
+        "Fill in small \"no data\" holes in the radar composite",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "freezing_rain": (
+        "Calculates a probability of freezing-rain near the ground using rain, sleet, and temperature probabilities.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "generate_clearsky_solar_radiation": (
+        "Generate a cube containing clearsky solar radiation data, evaluated on the target grid for the specified time and accumulation period. Accumulated clearsky solar radiation is used as an input to the RainForests calibration for rainfall.",
+        (
+            "--time=INPUTDATETIME --accumulation-period=INT [--temporal-spacing=INT] [--new-title=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] target-grid [surface-altitude] [linke-turbidity]",
+            "--help [--usage]",
+        ),
+    ),
+    "generate_landmask_ancillary": (
+        "Generate a land_sea_mask ancillary.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] land-sea-mask",
+            "--help [--usage]",
+        ),
+    ),
+    "generate_metadata_cube": (
+        "Generate a cube with metadata only.",
+        (
+            "[--name=STR] [--units=STR] [--spatial-grid=STR] [--time-period=INT] [--json-input=INPUTJSON] [--ensemble-members=INT] [--x-grid-spacing=FLOAT] [--y-grid-spacing=FLOAT] [--domain-corner=COMMA_SEPARATED_LIST_OF_FLOAT] [--npoints=INT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] mandatory-attributes-json",
+            "--help [--usage]",
+        ),
+    ),
+    "generate_orographic_smoothing_coefficients": (
+        "Generate smoothing coefficients for recursive filtering based on orography gradients.",
+        (
+            "[--min-gradient-smoothing-coefficient=FLOAT] [--max-gradient-smoothing-coefficient=FLOAT] [--power=FLOAT] [--use-mask-boundary] [--invert-mask] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] orography [mask]",
+            "--help [--usage]",
+        ),
+    ),
+    "generate_percentiles": (
+        "Collapses cube coordinates and calculate percentiled data.",
+        (
+            "[--coordinates=COMMA_SEPARATED_LIST] [--percentiles=COMMA_SEPARATED_LIST] [--retained-coordinates=COMMA_SEPARATED_LIST] [--ignore-ecc-bounds-exceedance] [--skip-ecc-bounds] [--mask-percentiles] [--optimal-crps-percentiles] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "generate_realizations": (
+        "Converts an incoming cube into one containing realizations.",
+        (
+            "[--realizations-count=INT] [--random-seed=INT] [--tie-break=STR] [--ignore-ecc-bounds-exceedance] [--skip-ecc-bounds] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube [raw-cube]",
+            "--help [--usage]",
+        ),
+    ),
+    "generate_solar_time": (
+        "Generate a cube containing local solar time, evaluated on the target grid for specified time. Local solar time is used as an input to the RainForests calibration for rainfall.",
+        (
+            "--time=INPUTDATETIME [--new-title=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] target-grid",
+            "--help [--usage]",
+        ),
+    ),
+    "generate_topography_bands_mask": (
+        "Runs topographic bands mask generation.",
+        (
+            "[--bands-config=INPUTJSON] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] orography [land-sea-mask]",
+            "--help [--usage]",
+        ),
+    ),
+    "generate_topography_bands_weights": (
+        "Runs topographic weights generation.",
+        (
+            "[--bands-config=INPUTJSON] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] orography [land-sea-mask]",
+            "--help [--usage]",
+        ),
+    ),
+    "gradient_between_adjacent_grid_squares": (
+        "Calculate the gradient between adjacent grid squares within a cube. The gradient is calculated along the x and y axis individually.",
+        (
+            "[--regrid] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "gradient_between_vertical_levels": (
+        "Calculate the gradient between two vertical levels. The gradient is calculated as the difference between the input cubes divided by the difference in height.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "hail_fraction": (
+        "Calculates the fraction of precipitation that is forecast to fall as hail.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "hail_size": (
+        "Module to calculate the size of hail stones from the cloud condensation level (ccl) temperature and pressure, temperature on pressure levels data, wet bulb freezing altitude above sea level and orography.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "height_of_max_vertical_velocity": (
+        "Calculates the height level at which the maximum vertical velocity occurs for each grid point. It requires an input cube of vertical velocity and a cube with the maximum vertical velocity values at each grid point. For this case we are looking for the lowest height at which the maximum occurs.",
+        (
+            "[--find-lowest=BOOL] [--new-name=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube max-cube",
+            "--help [--usage]",
+        ),
+    ),
+    "integrate_time_bounds": (
+        "Multiply a frequency or rate cube by the time period given by the time bounds over which it is defined to return a count or accumulation.  The frequency or rate must be defined with time bounds, e.g. an average frequency across the period. This function will handle a cube with a non-scalar time coordinate, multiplying each time in the coordinate by the related bounds.",
+        (
+            "[--new-name=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "interpolate_using_difference": (
+        "Uses interpolation to fill masked regions in the data contained within the input cube. This is achieved by calculating the difference between the input cube and a complete (i.e. complete across the whole domain) reference cube. The difference between the data in regions where they overlap is calculated and this difference field is then interpolated across the domain. Any masked regions in the input cube data are then filled with data calculated as the reference cube data minus the interpolated difference field.",
+        (
+            "[--limit-as-maximum=BOOL] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube reference-cube [limit]",
+            "--help [--usage]",
+        ),
+    ),
+    "interpret_metadata": (
+        "Intepret the metadata of an IMPROVER output into human readable format according to the IMPROVER standard. An optional verbosity flag, if set to True, will specify the source of each interpreted element.",
+        (
+            "[--verbose] [--failures-only] [file-paths...]",
+            "--help [--usage]",
+        ),
+    ),
+    "lightning_from_cape_and_precip": (
+        "Apply latitude-dependent thresholds to CAPE and precipitation rate to derive a probability-of-lightning cube.  Does not collapse a realization coordinate.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "lightning_multivariate_probability_usaf2024": (
+        "From the supplied following cubes: Convective Available Potential Energy (CAPE in J/kg), Lifted Index (liftind in K), Precipitable Water (pwat in kg m-2 or mm. This is used as mm in the regression equations), Convective Inhibition (CIN in J/kg), 3-hour Accumulated Precipitation (apcp in kg m-2 or millimetres), calculate a probability of lightning cube using relationships developed using regression statistics.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "manipulate_reliability_table": (
+        "Manipulate a reliability table to ensure sufficient sample counts in as many bins as possible by combining bins with low sample counts.  Also enforces a monotonic observation frequency.",
+        (
+            "[--minimum-forecast-count=INT] [--point-by-point] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] reliability-table",
+            "--help [--usage]",
+        ),
+    ),
+    "max_in_height": (
+        "Calculate the maximum value over the height coordinate of a cube. If height bounds are specified then the maximum value between these height levels is calculated.",
+        (
+            "[--lower-height-bound=FLOAT] [--upper-height-bound=FLOAT] [--new-name=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "max_in_time_window": (
+        "Find the maximum probability or maximum diagnostic value within a time window for a period diagnostic. For example, find the maximum probability of exceeding a given accumulation threshold in a period e.g. 20 mm in 3 hours, over the course of a longer interval e.g. a 24 hour time window.",
+        (
+            "[--minimum-realizations=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "merge": (
+        "Merge multiple files together",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "nbhood": (
+        "Runs neighbourhood processing.",
+        (
+            "--neighbourhood-output=STR [--neighbourhood-shape=STR] --radii=COMMA_SEPARATED_LIST [--lead-times=COMMA_SEPARATED_LIST] [--degrees-as-complex] [--weighted-mode] [--area-sum] [--percentiles=COMMA_SEPARATED_LIST] [--halo-radius=FLOAT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube [mask]",
+            "--help [--usage]",
+        ),
+    ),
+    "nbhood_iterate_with_mask": (
+        "Runs neighbourhooding processing iterating over a coordinate by mask.",
+        (
+            "--coord-for-masking=STR [--neighbourhood-shape=STR] --radii=COMMA_SEPARATED_LIST [--lead-times=COMMA_SEPARATED_LIST] [--area-sum] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube mask [weights]",
+            "--help [--usage]",
+        ),
+    ),
+    "nbhood_land_and_sea": (
+        "Module to process land and sea separately before combining them.",
+        (
+            "[--neighbourhood-shape=STR] --radii=COMMA_SEPARATED_LIST [--lead-times=COMMA_SEPARATED_LIST] [--area-sum] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube mask [weights]",
+            "--help [--usage]",
+        ),
+    ),
+    "neighbour_finding": (
+        "Create neighbour cubes for extracting spot data.",
+        (
+            "[--all-methods] [--land-constraint] [--similar-altitude] [--search-radius=FLOAT] [--node-limit=INT] [--site-coordinate-system=STR] [--site-coordinate-options=STR] [--site-x-coordinate=STR] [--site-y-coordinate=STR] [--unique-site-id-key=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] orography land-sea-mask site-list",
+            "--help [--usage]",
+        ),
+    ),
+    "normalise_to_reference": (
+        "Module to enforce that the sum of data in a list of cubes is equal to the corresponding data in a reference cube. Only one of the updated cubes is returned.",
+        (
+            "--reference-name=STR --return-name=STR [--ignore-zero-total] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "nowcast_accumulate": (
+        "Module to extrapolate and accumulate the weather with 1 min fidelity.",
+        (
+            "[--attributes-config=INPUTJSON] [--max-lead-time=INT] [--lead-time-interval=INT] [--accumulation-period=INT] [--accumulation-units=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube advection-velocity orographic-enhancement",
+            "--help [--usage]",
+        ),
+    ),
+    "nowcast_extrapolate": (
+        "Module to extrapolate input cubes given advection velocity fields.",
+        (
+            "[--attributes-config=INPUTJSON] [--max-lead-time=INT] [--lead-time-interval=INT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube advection-velocity [orographic-enhancement]",
+            "--help [--usage]",
+        ),
+    ),
+    "nowcast_optical_flow": (
+        "Calculate optical flow components from input fields.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] orographic-enhancement [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "nowcast_optical_flow_from_winds": (
+        "Calculate optical flow components as perturbations from the model steering flow.  Advects the older of the two input radar observations to the validity time of the newer observation, then calculates the velocity required to adjust this forecast to match the observation.  Sums the steering flow and perturbation values to give advection components for extrapolation nowcasting.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] steering-flow orographic-enhancement [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "orographic_enhancement": (
+        "Calculate orographic enhancement",
+        (
+            "[--boundary-height=FLOAT] [--boundary-height-units=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] temperature humidity pressure wind-speed wind-direction orography",
+            "--help [--usage]",
+        ),
+    ),
+    "phase_change_level": (
+        "Height of precipitation phase change relative to sea level.",
+        (
+            "--phase-change=STR [--grid-point-radius=INT] [--horizontal-interpolation=BOOL] [--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "phase_mask": (
+        "Make phase-mask cube for the specified phase.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube phase",
+            "--help [--usage]",
+        ),
+    ),
+    "phase_probability": (
+        "Converts a phase-change-level cube into the probability of a specific precipitation phase being found at the surface or at a site's altitude.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "pipeline": (
+        "Run a pipeline of improver commands defined in a JSON or YAML file.",
+        (
+            "[--workers=INT] [--verbose] [--dry-run] pipeline",
+            "--help [--usage]",
+        ),
+    ),
+    "precipitation_duration": (
+        "Classifies periods of precipitation intensity using both the maximum precipitation rate in the period and the accumulation in the period. These classified periods are then used to determine what fraction of a constructed longer period would be classified as such.",
+        (
+            "--min-accumulation-per-hour=COMMA_SEPARATED_LIST --critical-rate=COMMA_SEPARATED_LIST --target-period=FLOAT --percentiles=COMMA_SEPARATED_LIST [--accumulation-diagnostic=STR] [--rate-diagnostic=STR] [--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "recursive_filter": (
+        "Module to apply a recursive filter to neighbourhooded data.",
+        (
+            "[--iterations=INT] [--variable-mask] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube smoothing-coefficients",
+            "--help [--usage]",
+        ),
+    ),
+    "regrid": (
+        "Regrids source cube data onto a target grid. Optional land-sea awareness.",
+        (
+            "[--regrid-mode=STR] [--extrapolation-mode=STR] [--land-sea-mask-vicinity=FLOAT] [--regridded-title=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube target-grid [land-sea-mask]",
+            "--help [--usage]",
+        ),
+    ),
+    "relabel_to_period": (
+        "Relabel a diagnostic as a period diagnostic.",
+        (
+            "[--period=INT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "remake_as_shower_condition": (
+        "Modify the name and threshold coordinate of another diagnostic to create a shower condition cube. Such a cube provides the probability that any precipitation, should it be present, should be classified as showery. Only suitable proxies for identifying showery conditions should be modified in this way. By modifying cubes in this way it is possible to blend different proxies from different models as though they are equivalent diagnostics.  The user must be satisfied that the proxies are suitable for blending.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "resolve_wind_components": (
+        "Converts speed and direction into individual velocity components.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] wind-speed wind-direction",
+            "--help [--usage]",
+        ),
+    ),
+    "serve": (
+        "Run a server executing improver commands sent over a UNIX socket.",
+        (
+            "[--workers=INT] [--max-jobs-per-worker=INT] [--preload=COMMA_SEPARATED_LIST] socket-path",
+            "--help [--usage]",
+        ),
+    ),
+    "shower_condition_probability": (
+        "Create a shower condition diagnostic that provides the probability that precipitation, if present, should be classified as showery. This shower condition is created from cloud area fraction and convective ratio fields.",
+        (
+            "--cloud-threshold=FLOAT --convection-threshold=FLOAT [--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "sleet_probability": (
+        "Calculate sleet probability.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] snow rain",
+            "--help [--usage]",
+        ),
+    ),
+    "snow_fraction": (
+        "Calculates a snow-fraction field from fields of snow and rain (rate or accumulation). Where no precipitation is present, the data are filled in from the nearest precipitating point.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "snow_splitter": (
+        "Separates the snow/rain contribution from precipitation rate/accumulation.",
+        (
+            "--output-is-rain=BOOL [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "spot_extract": (
+        "Module to run spot data extraction.",
+        (
+            "[--apply-lapse-rate-correction] [--fixed-lapse-rate=FLOAT] [--land-constraint] [--similar-altitude] [--extract-percentiles=COMMA_SEPARATED_LIST] [--ignore-ecc-bounds-exceedance] [--skip-ecc-bounds] [--new-title=STR] [--suppress-warnings] [--realization-collapse] [--subset-coord=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "standardise": (
+        "Standardise a source cube. Available options are renaming, converting units, updating attributes and removing named scalar coordinates. Remaining scalar coordinates are collapsed, CellMethod(\"point\": \"time\") is discarded, and data are cast to IMPROVER standard datatypes and units.",
+        (
+            "[--attributes-config=INPUTJSON] [--coords-to-remove=COMMA_SEPARATED_LIST] [--coord-modification=INPUTJSON] [--new-name=STR] [--new-units=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube",
+            "--help [--usage]",
+        ),
+    ),
+    "temp_lapse_rate": (
+        "Calculate temperature lapse rates in units of K m-1 over orography grid.",
+        (
+            "[--max-height-diff=FLOAT] [--nbhood-radius=INT] [--max-lapse-rate=FLOAT] [--min-lapse-rate=FLOAT] [--dry-adiabatic] [--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] temperature [orography] [land-sea-mask]",
+            "--help [--usage]",
+        ),
+    ),
+    "temporal_interpolate": (
+        "Interpolate data between validity times.",
+        (
+            "[--interval-in-mins=INT] [--times=COMMA_SEPARATED_LIST] [--interpolation-method=STR] [--accumulation] [--max] [--min] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] start-cube end-cube",
+            "--help [--usage]",
+        ),
+    ),
+    "threshold": (
+        "Module to apply thresholding to a parameter dataset.",
+        (
+            "[--threshold-values=COMMA_SEPARATED_LIST] [--threshold-config=INPUTJSON] [--threshold-units=STR] [--comparison-operator=STR] [--fuzzy-factor=FLOAT] [--collapse-coord=COMMA_SEPARATED_LIST] [--collapse-cell-methods=INPUTJSON] [--vicinity=COMMA_SEPARATED_LIST] [--fill-masked=FLOAT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube [land-sea-mask]",
+            "--help [--usage]",
+        ),
+    ),
+    "threshold_interpolation": (
+        "Use this CLI to modify the probability thresholds in an existing probability forecast cube by linearly interpolating between the existing thresholds.",
+        (
+            "--thresholds=COMMA_SEPARATED_LIST [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] forecast-at-thresholds",
+            "--help [--usage]",
+        ),
+    ),
+    "time_lagged_ensembles": (
+        "Module to time-lag ensembles.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "uv_index": (
+        "Calculate the UV index using the data in the input cubes.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] uv-flux-down",
+            "--help [--usage]",
+        ),
+    ),
+    "vertical_updraught": (
+        "Module to generate maximum vertical updraught.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "vicinity": (
+        "Module to apply vicinity processing to data.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] cube [vicinity]",
+            "--help [--usage]",
+        ),
+    ),
+    "visibility_combine_cloud_base": (
+        "Combine the probability of visibility above or below a threshold with the probability of cloud base at ground level.",
+        (
+            "--initial-scaling-value=FLOAT --first-unscaled-threshold=FLOAT [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "weather_symbol_modes": (
+        "Generates a modal weather code for the period covered by the input categorical cubes. Where there are different categories available for night and day, the modal code returned is always a day code, regardless of the times covered by the input files. The weather codes provided are expected to end at midnight and therefore represent either a full day or a partial day.",
+        (
+            "[--decision-tree=INPUTJSON] [--broad-categories=INPUTJSON] [--wet-categories=INPUTJSON] [--intensity-categories=INPUTJSON] [--day-weighting=INT] [--day-start=INT] [--day-end=INT] [--wet-bias=INT] [--model-id-attr=STR] [--record-run-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "weighted_blending": (
+        "Runs weighted blending.",
+        (
+            "--coordinate=STR [--weighting-method=STR] [--weighting-coord=STR] [--weighting-config=INPUTJSON] [--attributes-config=INPUTJSON] [--cycletime=STR] [--y0val=FLOAT] [--ynval=FLOAT] [--cval=FLOAT] [--model-id-attr=STR] [--record-run-attr=STR] [--spatial-weights-from-mask] [--fuzzy-length=FLOAT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "wet_bulb_freezing_level": (
+        "Module to generate wet-bulb freezing level.",
+        (
+            "[--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] wet-bulb-temperature",
+            "--help [--usage]",
+        ),
+    ),
+    "wet_bulb_temperature": (
+        "Module to generate wet-bulb temperatures.",
+        (
+            "[--convergence-condition=FLOAT] [--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] [cubes...]",
+            "--help [--usage]",
+        ),
+    ),
+    "wet_bulb_temperature_integral": (
+        "Module to calculate wet bulb temperature integral.",
+        (
+            "[--model-id-attr=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] wet-bulb-temperature",
+            "--help [--usage]",
+        ),
+    ),
+    "wind_direction": (
+        "Calculates mean wind direction from ensemble realization.",
+        (
+            "[--backup-method=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] wind-direction",
+            "--help [--usage]",
+        ),
+    ),
+    "wind_downscaling": (
+        "Wind downscaling.",
+        (
+            "--model-resolution=FLOAT [--output-height-level=FLOAT] [--output-height-level-units=STR] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] wind-speed sigma target-orography standard-orography silhouette-roughness [vegetative-roughness]",
+            "--help [--usage]",
+        ),
+    ),
+    "wind_gust_diagnostic": (
+        "Create a cube containing the wind_gust diagnostic.",
+        (
+            "[--wind-gust-percentile=FLOAT] [--wind-speed-percentile=FLOAT] [--output=STR] [--pass-through-output] [--compression-level=INT] [--least-significant-digit=INT] wind-gust wind-speed",
+            "--help [--usage]",
+        ),
+    ),
+}
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Script to run one improver command over many input files in parallel."""
+
+from improver import cli
+
+
+@cli.clizefy
+def process(
+    command: cli.LAST_OPTION,
+    *args,
+    inputs_glob: str,
+    output_template: str,
+    workers: int = None,
+    shared: cli.comma_separated_list = None,
+):
+    """Run an improver command for each input file matching a glob pattern.
+
+    Each input file is passed as the first argument of the command, or in
+    place of an "{input}" argument, and the result written to a file named
+    from the output template. Options for this command must come before the
+    command name, for example::
+
+        improver batch --inputs-glob "in/*.nc" --output-template "out/{stem}.nc"
+            --shared mask.nc apply-mask {input} mask.nc --mask-name land_binary_mask
+
+    The command is imported once and shared ancillary files loaded once,
+    before the worker processes are started. The outcome and run time of
+    each item are printed, and a failure in one item does not stop the
+    others from being processed.
+
+    Args:
+        command (str):
+            Command to run for each input file.
+        args (tuple):
+            Command arguments. An argument "{input}" is replaced by the path
+            of each input file.
+        inputs_glob (str):
+            Glob pattern matching the input files. Quote this to prevent
+            expansion by the shell.
+        output_template (str):
+            Template for the output file of each input, which may contain
+            the fields {name} (input file name), {stem} (input file name
+            without its extension) and {parent} (input file directory).
+        workers (int):
+            Number of worker processes. Defaults to the number of CPUs.
+        shared (list of str):
+            Ancillary files which are loaded once and passed in memory
+            wherever they appear in the command arguments.
+
+    Raises:
+        RuntimeError: If the command failed for any input file.
+    """
+    from improver.utilities.batch import run_batch
+
+    results = run_batch(
+        command,
+        args,
+        inputs_glob,
+        output_template,
+        workers=workers,
+        shared=shared,
+        verbose=True,
+    )
+    failed = [result for result in results if not result.ok]
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(results)} items failed.")
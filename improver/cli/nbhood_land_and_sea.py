@@ -144,6 +144,24 @@ def process(
         radius_or_radii = [float(x) for x in radii]
         lead_times = [int(x) for x in lead_times]
 
+    if (
+        masking_coordinate is None
+        and land_only.data.max() > 0.0
+        and sea_only.data.max() > 0.0
+    ):
+        # Process land and sea points together, each using only points of
+        # the same type within their neighbourhood.
+        result = NeighbourhoodProcessing(
+            neighbourhood_shape,
+            radius_or_radii,
+            lead_times=lead_times,
+            sum_only=area_sum,
+            re_mask=True,
+            land_and_sea=True,
+        )(cube, land_only)
+        result.data = np.ma.filled(result.data, 0)
+        return result
+
     # Section for neighbourhood processing land points.
     if land_only.data.max() > 0.0:
         if masking_coordinate is None:
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Script to run a pipeline of commands passing results in memory."""
+
+from improver import cli
+
+
+@cli.clizefy
+def process(
+    pipeline: cli.inputpath, *, workers: int = 1, verbose=False, dry_run=False
+):
+    """Run a pipeline of improver commands defined in a JSON or YAML file.
+
+    The pipeline file maps step names to commands and their arguments under
+    a "steps" key. An argument "@name" passes the result of the step called
+    name in memory, without writing it to file. A step's result is written
+    only if the step has an "output" file. For example::
+
+        {"steps": {
+            "speed": {"command": "wind-speed-from-components",
+                      "args": ["u.nc", "v.nc"]},
+            "probabilities": {"command": "threshold",
+                              "args": ["@speed", "--threshold-values", "5"],
+                              "output": "probabilities.nc"}}}
+
+    Steps run once the results they use are available, with independent
+    steps running concurrently. A result used by several steps is held in
+    memory once, so commands must not modify their input cubes in place.
+
+    Args:
+        pipeline (pathlib.Path):
+            Path to the pipeline file. Files ending .yaml or .yml are read as
+            YAML and all others as JSON.
+        workers (int):
+            Maximum number of steps to run at once.
+        verbose (bool):
+            Print each command with its run time.
+        dry_run (bool):
+            Print the commands to be run without running them.
+    """
+    from improver.utilities.pipeline import load_pipeline, run_pipeline
+
+    run_pipeline(
+        load_pipeline(pipeline), workers=workers, verbose=verbose, dry_run=dry_run
+    )
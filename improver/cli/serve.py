@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Script to run a server executing improver commands in warm workers."""
+
+from improver import cli
+
+
+@cli.clizefy
+def process(
+    socket_path: str,
+    *,
+    workers: int = None,
+    max_jobs_per_worker: int = 100,
+    preload: cli.comma_separated_list = None,
+):
+    """Run a server executing improver commands sent over a UNIX socket.
+
+    Commands are run in a pool of worker processes which already have the
+    improver CLI, iris and the loading and saving utilities imported, avoiding
+    the start-up cost of a new process for every command. The server runs
+    until interrupted or sent SIGTERM.
+
+    Commands are sent to the server by setting IMPROVER_SERVER_SOCKET to the
+    socket path before calling improver, or with
+    ``python -m improver.utilities.cli_server SOCKET_PATH COMMAND [ARGS...]``.
+    Commands are run in the client's working directory but do not inherit
+    the client's environment.
+
+    Args:
+        socket_path (str):
+            Path of the UNIX socket to listen on.
+        workers (int):
+            Maximum number of commands to run at once. Defaults to the number
+            of CPUs.
+        max_jobs_per_worker (int):
+            Number of commands after which a worker process is replaced by a
+            fresh one, to limit memory growth. Set to 0 to never replace
+            workers.
+        preload (list of str):
+            Names of subcommands to import before starting the workers.
+    """
+    from improver.utilities.cli_server import serve
+
+    serve(
+        socket_path,
+        workers=workers,
+        max_jobs_per_worker=max_jobs_per_worker or None,
+        preload=preload,
+    )
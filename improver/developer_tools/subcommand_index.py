@@ -0,0 +1,89 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Generate the static index of IMPROVER CLI subcommands.
+
+The index records the help summary and usages of each CLI so that the
+`improver` command can list and dispatch subcommands without importing every
+CLI module. It must be regenerated whenever a CLI is added, removed or has
+its signature or summary changed::
+
+    python -m improver.developer_tools.subcommand_index
+"""
+
+import importlib
+import json
+import pathlib
+from typing import Dict, Tuple
+
+INDEX_HEADER = '''\
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Static index of IMPROVER CLI subcommands.
+
+Maps each CLI module name to its help summary and usages.
+Generated by ``python -m improver.developer_tools.subcommand_index``,
+do not edit by hand.
+"""
+
+'''
+
+
+def build_subcommand_index() -> Dict[str, Tuple[str, Tuple[str, ...]]]:
+    """Import every CLI and collect its help summary and usages.
+
+    Returns:
+        Dictionary mapping CLI module names to a tuple of the help summary
+        and usage strings reported by clize.
+    """
+    from improver.cli import _cli_module_names, clizefy
+
+    index = {}
+    for mod_name in sorted(_cli_module_names()):
+        mcli = importlib.import_module("improver.cli." + mod_name)
+        helper = clizefy(mcli.process).cli.helper
+        index[mod_name] = (helper.description, tuple(helper.usages()))
+    return index
+
+
+def format_subcommand_index(index: Dict[str, Tuple[str, Tuple[str, ...]]]) -> str:
+    """Render the subcommand index as the source of a Python module.
+
+    Args:
+        index:
+            Subcommand index as returned by :func:`build_subcommand_index`.
+
+    Returns:
+        Python source defining SUBCOMMAND_INDEX.
+    """
+    lines = [INDEX_HEADER + "SUBCOMMAND_INDEX = {"]
+    for mod_name, (description, usages) in index.items():
+        lines.append(f"    {json.dumps(mod_name)}: (")
+        lines.append(f"        {json.dumps(description)},")
+        lines.append("        (")
+        lines.extend(f"            {json.dumps(usage)}," for usage in usages)
+        lines.append("        ),")
+        lines.append("    ),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_subcommand_index(path: str = None) -> None:
+    """Regenerate the static subcommand index module.
+
+    Args:
+        path:
+            Output file, defaults to improver/cli/_subcommand_index.py.
+    """
+    if path is None:
+        from improver.cli import __path__ as improver_cli_pkg_path
+
+        path = pathlib.Path(improver_cli_pkg_path[0]) / "_subcommand_index.py"
+    pathlib.Path(path).write_text(format_subcommand_index(build_subcommand_index()))
+
+
+if __name__ == "__main__":
+    write_subcommand_index()
@@ -48,6 +48,7 @@ from improver.utilities.cube_manipulation import (
     manipulate_n_realizations,
 )
 from improver.utilities.indexing_operations import choose
+from improver.utilities.memory_budget import batch_size, batches
 
 
 class RebadgeRealizationsAsPercentiles(BasePlugin):
@@ -1349,6 +1350,53 @@ class EnsembleReordering(BasePlugin):
             )
         return raw_forecast_realizations
 
+    @staticmethod
+    def _time_batches(
+        raw_forecast_realizations: Cube, post_processed_forecast_percentiles: Cube
+    ) -> List[Tuple[Cube, Cube]]:
+        """
+        Split the raw and post-processed forecasts into batches of times,
+        with as many times in each batch as the memory budget allows.
+
+        Args:
+            raw_forecast_realizations:
+                Cube containing the raw forecasts.
+            post_processed_forecast_percentiles:
+                Cube for post-processed percentiles.
+
+        Returns:
+            Pairs of raw and post-processed forecast cubes for each batch,
+            which keep the time dimension if it is a dimension of both.
+        """
+        if not all(
+            cube.coords("time", dim_coords=True)
+            for cube in (raw_forecast_realizations, post_processed_forecast_percentiles)
+        ):
+            return list(
+                zip(
+                    raw_forecast_realizations.slices_over("time"),
+                    post_processed_forecast_percentiles.slices_over("time"),
+                )
+            )
+        n_times = len(raw_forecast_realizations.coord("time").points)
+        # data, random keys, sorting indices and ranking of each time
+        time_bytes = 4 * raw_forecast_realizations.data.nbytes // n_times
+        index = [slice(None)] * raw_forecast_realizations.ndim
+        pp_index = [slice(None)] * post_processed_forecast_percentiles.ndim
+        (time_dim,) = raw_forecast_realizations.coord_dims("time")
+        (pp_time_dim,) = post_processed_forecast_percentiles.coord_dims("time")
+        pairs = []
+        for batch in batches(n_times, batch_size(time_bytes, n_times)):
+            index[time_dim] = batch
+            pp_index[pp_time_dim] = batch
+            pairs.append(
+                (
+                    raw_forecast_realizations[tuple(index)],
+                    post_processed_forecast_percentiles[tuple(pp_index)],
+                )
+            )
+        return pairs
+
     @staticmethod
     def rank_ecc(
         post_processed_forecast_percentiles: Cube,
@@ -1394,13 +1442,12 @@ class EnsembleReordering(BasePlugin):
             ValueError: tie_break is not either 'random' or 'realization'
         """
         results = iris.cube.CubeList([])
-        for rawfc, calfc in zip(
-            raw_forecast_realizations.slices_over("time"),
-            post_processed_forecast_percentiles.slices_over("time"),
+        if random_seed is not None:
+            random_seed = int(random_seed)
+        random_seed = np.random.RandomState(random_seed)
+        for rawfc, calfc in EnsembleReordering._time_batches(
+            raw_forecast_realizations, post_processed_forecast_percentiles
         ):
-            if random_seed is not None:
-                random_seed = int(random_seed)
-            random_seed = np.random.RandomState(random_seed)
             if random_ordering:
                 random_data = random_seed.rand(*rawfc.data.shape)
                 # Returns the indices that would sort the array.
@@ -1443,7 +1490,10 @@ class EnsembleReordering(BasePlugin):
             results.append(calfc)
         # Ensure we haven't lost any dimensional coordinates with only one
         # value in.
-        results = results.merge_cube()
+        if results[0].coords("time", dim_coords=True):
+            results = results.concatenate_cube()
+        else:
+            results = results.merge_cube()
         results = check_cube_coordinates(post_processed_forecast_percentiles, results)
         return results
 
@@ -10,8 +10,10 @@ import tracemalloc
 from datetime import datetime
 from queue import Queue
 from resource import RUSAGE_SELF, getrusage
-from threading import Thread
-from typing import Callable, Tuple
+from threading import Event, Thread
+from typing import Callable, Dict, List, Optional, Tuple
+
+from improver import trace
 
 
 def memory_profile_start(outfile_prefix: str) -> Tuple[Thread, Queue]:
@@ -87,7 +89,142 @@ def memory_monitor(queue: Queue, outfile_prefix: str) -> None:
             return
 
 
-def memory_profile_decorator(func: Callable, outfile_prefix: str) -> Callable:
+def read_memory() -> Tuple[float, Optional[float]]:
+    """Read the current resident (RSS) and unique (USS) memory of the process.
+
+    USS, the memory which would be freed if the process exited, is read from
+    /proc/self/smaps_rollup and so is only available on linux. Elsewhere the
+    maximum RSS so far is returned in place of the current RSS.
+
+    Returns:
+        - RSS in MiB.
+        - USS in MiB, or None if not available.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as smaps:
+            fields = dict(line.split(":", 1) for line in smaps if ":" in line)
+    except OSError:
+        b2mb = 1 / 1024 if sys.platform == "linux" else 1 / 1048576
+        return getrusage(RUSAGE_SELF).ru_maxrss * b2mb, None
+
+    def kib(name):
+        return int(fields.get(name, "0 kB").split()[0])
+
+    uss = kib("Private_Clean") + kib("Private_Dirty")
+    return kib("Rss") / 1024, uss / 1024
+
+
+def memory_sample_start(
+    outfile_prefix: str, interval: float
+) -> Tuple[Thread, Event]:
+    """Starts sampling memory usage in a separate thread.
+
+    Args:
+        outfile_prefix:
+            Prefix for the generated output. 2 files will be generated:
+            \\*_TIMELINE.csv and \\*_PEAKS.
+        interval:
+            Time in seconds between samples.
+
+    Returns:
+        - Active Thread sampling the memory.
+        - Event to set to stop sampling.
+    """
+    # record the running plugins, unless already done by an active tracer
+    if trace.ACTIVE_TRACER is None:
+        trace.ACTIVE_TRACER = trace.PluginStack()
+    stop = Event()
+    thread = Thread(
+        target=memory_sampler,
+        args=(stop, outfile_prefix, interval, trace.ACTIVE_TRACER),
+        daemon=True,
+    )
+    thread.start()
+    return thread, stop
+
+
+def memory_sample_end(stop: Event, thread: Thread) -> None:
+    """Ends sampling memory usage.
+
+    Args:
+        stop:
+            Event stopping the sampler.
+        thread:
+            Active thread sampling the memory.
+    """
+    stop.set()
+    thread.join()
+    if type(trace.ACTIVE_TRACER) is trace.PluginStack:
+        trace.ACTIVE_TRACER = None
+
+
+def memory_sampler(
+    stop: Event, outfile_prefix: str, interval: float, plugins: trace.PluginStack
+) -> None:
+    """Sample memory usage until stopped, should be run in a separate
+    thread to the main program.
+
+    Samples RSS and USS every interval seconds, tagged with the IMPROVER
+    plugins running at the time, and writes each sample to a CSV timeline.
+    Unlike :func:`memory_monitor` this does not use tracemalloc, so has
+    little effect on the run time of the program. When stopped, writes a
+    report of the highest RSS sampled while each plugin was running.
+
+    Args:
+        stop:
+            Event which is set to stop sampling.
+        outfile_prefix:
+            Prefix for the generated output. 2 files will be generated:
+            \\*_TIMELINE.csv and \\*_PEAKS.
+        interval:
+            Time in seconds between samples.
+        plugins:
+            Record of the plugins running.
+    """
+    # highest RSS while each combination of plugins was running, with the
+    # time, USS and number of samples
+    peaks: Dict[str, List] = {}
+    start = time.perf_counter()
+    with open("{}_TIMELINE.csv".format(outfile_prefix), "w") as fout:
+        print("time_s,rss_mib,uss_mib,plugins", file=fout)
+        while True:
+            elapsed = time.perf_counter() - start
+            rss, uss = read_memory()
+            running = plugins.running()
+            uss_str = "" if uss is None else "{:.1f}".format(uss)
+            print(
+                '{:.3f},{:.1f},{},"{}"'.format(elapsed, rss, uss_str, running),
+                file=fout,
+            )
+            peak = peaks.setdefault(running, [rss, elapsed, uss, 0])
+            if rss > peak[0]:
+                peak[:3] = [rss, elapsed, uss]
+            peak[3] += 1
+            if stop.wait(interval):
+                break
+
+    with open("{}_PEAKS".format(outfile_prefix), "w") as fout:
+        print(
+            "{:>10} {:>10} {:>10} {:>8}  plugins".format(
+                "rss MiB", "uss MiB", "time s", "samples"
+            ),
+            file=fout,
+        )
+        for running, (rss, elapsed, uss, count) in sorted(
+            peaks.items(), key=lambda item: -item[1][0]
+        ):
+            uss_str = "-" if uss is None else "{:.1f}".format(uss)
+            print(
+                "{:>10.1f} {:>10} {:>10.3f} {:>8}  {}".format(
+                    rss, uss_str, elapsed, count, running or "(no plugin)"
+                ),
+                file=fout,
+            )
+
+
+def memory_profile_decorator(
+    func: Callable, outfile_prefix: str, interval: Optional[float] = None
+) -> Callable:
     """A decorator for convenience of running.
 
     Args:
@@ -95,13 +232,24 @@ def memory_profile_decorator(func: Callable, outfile_prefix: str) -> Callable:
             function to track the maximum memory of.
         outfile_prefix:
             Prefix for the generated output. 2 files will
-            be generated: \\*_SNAPSHOT and \\*_MAX_TRACKER.
+            be generated: \\*_SNAPSHOT and \\*_MAX_TRACKER, or
+            \\*_TIMELINE.csv and \\*_PEAKS if an interval is given.
+        interval:
+            If given, sample memory usage every interval seconds with
+            :func:`memory_sampler` rather than tracking the maximum
+            memory with tracemalloc.
 
     Returns:
         The wrapper
     """
 
     def wrapper(*args, **kwargs):
+        if interval is not None:
+            thread, stop = memory_sample_start(outfile_prefix, interval)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                memory_sample_end(stop, thread)
         thread, queue = memory_profile_start(outfile_prefix)
         results = func(*args, **kwargs)
         memory_profile_end(queue, thread)
@@ -6,12 +6,14 @@
 
 import hashlib
 import pprint
-from typing import Any, Dict, List, Optional, Type, Union
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import dask.array as da
 import iris
 import numpy as np
 from cf_units import Unit
+from iris.coords import Coord
 from iris.cube import Cube, CubeList
 from numpy import ndarray
 from numpy.ma.core import MaskedArray
@@ -148,23 +150,77 @@ def generate_hash(data_in: Any) -> str:
     return hashlib.sha256(bytestring).hexdigest()
 
 
-def create_coordinate_hash(cube: Cube) -> str:
-    """
-    Generate a hash based on the input cube's x and y coordinates. This
-    acts as a unique identifier for the grid which can be used to allow two
-    grids to be compared.
+# Grid hashes of pairs of x and y coordinates, keyed on the x coordinate
+_GRID_HASHES: "weakref.WeakKeyDictionary[Coord, Dict]" = weakref.WeakKeyDictionary()
+
+
+def _coord_state(coord: Coord) -> Optional[Tuple]:
+    """The values and metadata of a coordinate from which its grid hash is
+    generated, or None if the hash cannot be reused because the values are
+    lazy or could be modified in place."""
+    arrays = [coord.core_points(), coord.core_bounds()]
+    if not all(
+        array is None or (isinstance(array, ndarray) and not array.flags.writeable)
+        for array in arrays
+    ):
+        return None
+    return (
+        *arrays,
+        coord.standard_name,
+        coord.long_name,
+        coord.units,
+        coord.coord_system,
+    )
 
-    Args:
-        cube:
-            The cube from which x and y coordinates will be used to
-            generate a hash.
 
-    Returns:
-        A hash created using the x and y coordinates of the input cube.
-    """
+def _same_state(state: Tuple, other: Tuple) -> bool:
+    """Whether two coordinate states are the same. Arrays are the same if
+    they view the same memory, which cannot have been freed and reused as
+    the stored state holds a reference to it."""
+    for item, other_item in zip(state, other):
+        if isinstance(item, ndarray) or isinstance(other_item, ndarray):
+            if not (
+                isinstance(item, ndarray)
+                and isinstance(other_item, ndarray)
+                and item.__array_interface__ == other_item.__array_interface__
+            ):
+                return False
+        elif item != other_item:
+            return False
+    return True
+
+
+def _memoized_grid_hash(
+    cube: Cube, kind: str, hash_function: Callable[[Coord, Coord], str]
+) -> str:
+    """Calculate the hash of the x and y coordinates of a cube, reusing the
+    hash calculated earlier in this process for the same coordinate objects
+    if they are unchanged."""
+    x_coord, y_coord = cube.coord(axis="x"), cube.coord(axis="y")
+    state = (_coord_state(x_coord), _coord_state(y_coord))
+    if None in state:
+        return hash_function(x_coord, y_coord)
+    try:
+        memo = _GRID_HASHES.setdefault(x_coord, {})
+    except TypeError:
+        # coordinate cannot be weakly referenced
+        return hash_function(x_coord, y_coord)
+    cached = memo.get(kind)
+    if (
+        cached is not None
+        and cached[0]() is y_coord
+        and all(map(_same_state, cached[1], state))
+    ):
+        return cached[2]
+    grid_hash = hash_function(x_coord, y_coord)
+    memo[kind] = (weakref.ref(y_coord), state, grid_hash)
+    return grid_hash
+
+
+def _coordinate_hash(x_coord: Coord, y_coord: Coord) -> str:
+    """Generate the hash of create_coordinate_hash."""
     hashable_data = []
-    for axis in ("x", "y"):
-        coord = cube.coord(axis=axis)
+    for coord in (x_coord, y_coord):
         hashable_data.extend(
             [
                 list(coord.points),
@@ -178,6 +234,61 @@ def create_coordinate_hash(cube: Cube) -> str:
     return generate_hash(hashable_data)
 
 
+def _grid_hash(x_coord: Coord, y_coord: Coord) -> str:
+    """Generate the hash of create_grid_hash."""
+    digest = hashlib.sha256()
+    for coord in (x_coord, y_coord):
+        for values in (coord.points, coord.bounds):
+            if values is None:
+                digest.update(b"none")
+                continue
+            values = np.ascontiguousarray(values, dtype="<f8")
+            digest.update(repr(values.shape).encode("utf-8"))
+            digest.update(values.view(np.uint8))
+        metadata = [coord.standard_name, coord.long_name, coord.coord_system]
+        metadata.append(str(coord.units))
+        digest.update(repr(metadata).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def create_coordinate_hash(cube: Cube) -> str:
+    """
+    Generate a hash based on the input cube's x and y coordinates. This
+    acts as a unique identifier for the grid which can be used to allow two
+    grids to be compared. This hash is stored in the model_grid_hash
+    attribute of spot data cubes, so does not change between versions;
+    use :func:`create_grid_hash` for a faster hash to compare gridded
+    cubes within a process.
+
+    Args:
+        cube:
+            The cube from which x and y coordinates will be used to
+            generate a hash.
+
+    Returns:
+        A hash created using the x and y coordinates of the input cube.
+    """
+    return _memoized_grid_hash(cube, "coordinate", _coordinate_hash)
+
+
+def create_grid_hash(cube: Cube) -> str:
+    """
+    Generate a hash based on the input cube's x and y coordinates from the
+    raw coordinate values and their metadata. This is much faster to
+    calculate than :func:`create_coordinate_hash` for large grids, but the
+    two hashes are not interchangeable.
+
+    Args:
+        cube:
+            The cube from which x and y coordinates will be used to
+            generate a hash.
+
+    Returns:
+        A hash created using the x and y coordinates of the input cube.
+    """
+    return _memoized_grid_hash(cube, "grid", _grid_hash)
+
+
 def check_grid_match(cubes: Union[List[Cube], CubeList]) -> None:
     """
     Checks that cubes are on, or originate from, compatible coordinate grids.
@@ -196,11 +307,17 @@ def check_grid_match(cubes: Union[List[Cube], CubeList]) -> None:
                     identified by the model_grid_hash.
     """
 
+    # hashes stored on cubes must be compared with the original hash
+    if any("model_grid_hash" in cube.attributes for cube in cubes):
+        hash_function = create_coordinate_hash
+    else:
+        hash_function = create_grid_hash
+
     def _get_grid_hash(cube):
         try:
             cube_hash = cube.attributes["model_grid_hash"]
         except KeyError:
-            cube_hash = create_coordinate_hash(cube)
+            cube_hash = hash_function(cube)
         return cube_hash
 
     cubes = iter(cubes)
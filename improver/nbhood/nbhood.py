@@ -4,7 +4,8 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module containing neighbourhood processing utilities."""
 
-from typing import List, Optional, Union
+import warnings
+from typing import List, Optional, Tuple, Union
 
 import iris
 import numpy as np
@@ -16,19 +17,35 @@ from improver import BasePlugin, PostProcessingPlugin
 from improver.constants import DEFAULT_PERCENTILES
 from improver.metadata.forecast_times import forecast_period_coord
 from improver.nbhood import radius_by_lead_time
+from improver.utilities.chunking import leading_coord_names
 from improver.utilities.common_input_handle import as_cube, as_iterable
 from improver.utilities.complex_conversion import complex_to_deg, deg_to_complex
 from improver.utilities.cube_checker import (
     check_cube_coordinates,
     find_dimension_coordinate_mismatch,
 )
-from improver.utilities.neighbourhood_tools import boxsum, pad_and_roll
+from improver.utilities.memory_budget import batch_size, batches
+from improver.utilities.neighbourhood_tools import (
+    boxsum,
+    chord_sum,
+    multi_boxsum,
+    pad_and_roll,
+)
 from improver.utilities.spatial import (
     check_if_grid_is_equal_area,
     distance_to_number_of_grid_cells,
 )
 
 
+# Size of the batches of x-y-slices processed together by square
+# neighbourhood processing if no memory budget is set
+_DEFAULT_BATCH_BYTES = 256 * 1024**2
+
+# Smallest width of an unweighted circular kernel for which the neighbourhood
+# sums are calculated along its chords rather than by direct correlation
+_CHORD_SUM_MIN_SIZE = 11
+
+
 def check_radius_against_distance(cube: Cube, radius: float) -> None:
     """Check required distance isn't greater than the size of the domain.
 
@@ -148,6 +165,35 @@ class BaseNeighbourhoodProcessing(PostProcessingPlugin):
         radii = np.interp(cube_lead_times, self.lead_times, self.radii)
         return radii
 
+    def chunk_coords(self, cube: Cube) -> List[str]:
+        """Leading coordinates whose slices are processed independently, so
+        that the cube can be processed in chunks along them (see
+        :class:`improver.utilities.chunking.ChunkedExecution`).
+
+        Args:
+            cube:
+                Cube to be processed.
+
+        Returns:
+            Names of the coordinates, in order of preference.
+        """
+        return leading_coord_names(cube)
+
+    def tile_halo(self, cube: Cube) -> int:
+        """Number of grid points beyond a point which contribute to its
+        neighbourhood, as needed to process the cube in spatial tiles (see
+        :class:`improver.utilities.tiling.SpatialTiling`).
+
+        Args:
+            cube:
+                Cube to be processed.
+
+        Returns:
+            The number of grid points in the largest neighbourhood radius.
+        """
+        radius = max(self.radii) if hasattr(self, "radii") else self.radius
+        return distance_to_number_of_grid_cells(cube, radius)
+
     def process(self, cube: Cube) -> Cube:
         """
         Supply a cube with a forecast period coordinate in order to set the
@@ -187,6 +233,7 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         weighted_mode: bool = False,
         sum_only: bool = False,
         re_mask: bool = True,
+        land_and_sea: bool = False,
     ) -> None:
         """
         Initialise class.
@@ -200,6 +247,9 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
                 Rounded up to convert into integer number of grid
                 points east and north, based on the characteristic spacing
                 at the zero indices of the cube projection-x and y coords.
+                If a list of radii is given without lead times, the
+                neighbourhood processing is applied for each radius and a
+                result returned for each.
             lead_times:
                 List of lead times or forecast periods, at which the radii
                 within 'radii' are defined. The lead times are expected
@@ -217,12 +267,21 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
                 mask is not applied. Therefore, the neighbourhood processing
                 may result in values being present in areas that were
                 originally masked.
+            land_and_sea:
+                If True, the mask cube is taken to be a land-sea mask, and the
+                neighbourhood of each land point includes only land points
+                and that of each sea point only sea points. Both are
+                calculated together, giving the same result as processing
+                with the land mask and the sea mask separately and combining
+                the results.
 
         Raises:
             ValueError: If the neighbourhood_method is not either
                         "square" or "circular".
             ValueError: If the weighted_mode is used with a
                         neighbourhood_method that is not "circular".
+            ValueError: If land_and_sea is used with several radii without
+                        lead times.
         """
         super().__init__(radii, lead_times=lead_times)
         if neighbourhood_method in ["square", "circular"]:
@@ -240,15 +299,39 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         self.weighted_mode = weighted_mode
         self.sum_only = sum_only
         self.re_mask = re_mask
+        self.land_and_sea = land_and_sea
+        if land_and_sea and self._multiple_radii():
+            raise ValueError("land_and_sea cannot be used with multiple radii.")
 
-    def _calculate_neighbourhood(
+    def _multiple_radii(self) -> bool:
+        """Whether several radii were given without lead times, so that the
+        plugin returns a result for each radius."""
+        return self.lead_times is None and hasattr(self, "radii")
+
+    def chunk_coords(self, cube: Cube) -> List[str]:
+        """Leading coordinates whose slices are processed independently, as
+        for the base class, unless the plugin returns a result for each of
+        several radii, which cannot be joined from chunks.
+
+        Args:
+            cube:
+                Cube to be processed.
+
+        Returns:
+            Names of the coordinates, in order of preference.
+        """
+        if self._multiple_radii():
+            return []
+        return super().chunk_coords(cube)
+
+    def _prepare_data(
         self, data: ndarray, mask: ndarray = None
-    ) -> Union[ndarray, np.ma.MaskedArray]:
+    ) -> Tuple[ndarray, ndarray, ndarray, type]:
         """
-        Apply neighbourhood processing. Ensures that masked data does not
-        contribute to the neighbourhood result. Masked data is either data that
-        is masked in the input data array or that corresponds to zeros in the
-        input mask.
+        Prepare data for neighbourhood summing, such that masked data does
+        not contribute to the neighbourhood sums. Masked data is either data
+        that is masked in the input data array or that corresponds to zeros
+        in the input mask.
 
         Args:
             data:
@@ -257,14 +340,11 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
                 Mask of valid input data elements.
 
         Returns:
-            Array containing the smoothed field after the
-            neighbourhood method has been applied.
+            - Data in a working precision with invalid elements set to zero.
+            - Array of ones for valid data elements and zeros elsewhere.
+            - Mask of invalid data elements, for re-masking the result.
+            - Data type of the result.
         """
-
-        if not self.sum_only:
-            min_val = np.nanmin(data)
-            max_val = np.nanmax(data)
-
         # Data mask to be eventually used for re-masking.
         # (This is OK even if mask is None, it gives a scalar False mask then.)
         # Invalid data where the mask provided == 0.
@@ -293,15 +373,38 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         valid_data_mask = np.ones(data.shape, dtype=mask_type)
         valid_data_mask[data_mask] = 0
         data[data_mask] = 0
+        return data, valid_data_mask, data_mask, out_data_dtype
 
-        if self.sum_only:
-            max_extreme_data = None
-        else:
-            area_sum = self._do_nbhood_sum(valid_data_mask)
-            max_extreme_data = area_sum.astype(loc_data_dtype)
-        # Where data are all ones in nbhood, result will be same as area_sum
-        data = self._do_nbhood_sum(data, max_extreme=max_extreme_data)
+    def _finalise_neighbourhood(
+        self,
+        data: ndarray,
+        area_sum: Optional[ndarray],
+        data_mask: ndarray,
+        value_range: Optional[Tuple[float, float]],
+        out_data_dtype: type,
+    ) -> Union[ndarray, np.ma.MaskedArray]:
+        """
+        Convert neighbourhood sums to the result, being the neighbourhood
+        mean unless only the sum is required.
 
+        Args:
+            data:
+                Neighbourhood sums of the data.
+            area_sum:
+                Neighbourhood sums of the valid data elements, or None if
+                only the sum is required.
+            data_mask:
+                Mask of invalid data elements.
+            value_range:
+                Minimum and maximum of the input data, to which the mean is
+                clipped, or None if only the sum is required.
+            out_data_dtype:
+                Data type of the result.
+
+        Returns:
+            Array containing the smoothed field after the
+            neighbourhood method has been applied.
+        """
         if not self.sum_only:
             with np.errstate(divide="ignore", invalid="ignore"):
                 # Calculate neighbourhood mean.
@@ -309,13 +412,266 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
             # For points where all data in the neighbourhood is masked,
             # set result to nan
             data[area_sum == 0] = np.nan
-            data = data.clip(min_val, max_val)
+            data = data.clip(*value_range)
 
         if self.re_mask:
             data = np.ma.masked_array(data, data_mask, copy=False)
 
         return data.astype(out_data_dtype)
 
+    def _calculate_neighbourhood(
+        self, data: ndarray, mask: ndarray = None
+    ) -> Union[ndarray, np.ma.MaskedArray]:
+        """
+        Apply neighbourhood processing. Ensures that masked data does not
+        contribute to the neighbourhood result. Masked data is either data that
+        is masked in the input data array or that corresponds to zeros in the
+        input mask.
+
+        Args:
+            data:
+                Input data array.
+            mask:
+                Mask of valid input data elements.
+
+        Returns:
+            Array containing the smoothed field after the
+            neighbourhood method has been applied.
+        """
+        value_range = None
+        if not self.sum_only:
+            value_range = (np.nanmin(data), np.nanmax(data))
+
+        data, valid_data_mask, data_mask, out_data_dtype = self._prepare_data(
+            data, mask
+        )
+
+        if self.sum_only:
+            area_sum = max_extreme_data = None
+        else:
+            area_sum = self._do_nbhood_sum(valid_data_mask)
+            max_extreme_data = area_sum.astype(data.dtype)
+        # Where data are all ones in nbhood, result will be same as area_sum
+        data = self._do_nbhood_sum(data, max_extreme=max_extreme_data)
+
+        return self._finalise_neighbourhood(
+            data, area_sum, data_mask, value_range, out_data_dtype
+        )
+
+    def _calculate_land_and_sea_neighbourhood(
+        self, data: ndarray, land_sea_mask: ndarray
+    ) -> Union[ndarray, np.ma.MaskedArray]:
+        """
+        Apply neighbourhood processing separately over land and sea, so that
+        the result at land points is calculated from the land points in their
+        neighbourhood and that at sea points from the sea points. The
+        neighbourhood sums over land and over sea are calculated in one pass.
+
+        Args:
+            data:
+                Input data array.
+            land_sea_mask:
+                Array which is one at land points and zero at sea points.
+
+        Returns:
+            Array containing the smoothed field after the
+            neighbourhood method has been applied.
+        """
+        value_range = None
+        if not self.sum_only:
+            value_range = (np.nanmin(data), np.nanmax(data))
+
+        data, valid_data_mask, data_mask, out_data_dtype = self._prepare_data(data)
+        land = land_sea_mask != 0
+        fields = [np.where(land, data, 0), np.where(land, 0, data)]
+        if not self.sum_only:
+            fields += [
+                np.where(land, valid_data_mask, 0),
+                np.where(land, 0, valid_data_mask),
+            ]
+        sums = self._stacked_nbhood_sums(np.array(fields))
+
+        nbhood_sum = np.where(land, sums[0], sums[1])
+        area_sum = None if self.sum_only else np.where(land, sums[2], sums[3])
+        return self._finalise_neighbourhood(
+            nbhood_sum, area_sum, data_mask, value_range, out_data_dtype
+        )
+
+    def _calculate_square_neighbourhoods(
+        self, data: ndarray, nb_sizes: List[int], mask: ndarray = None
+    ) -> List[Union[ndarray, np.ma.MaskedArray]]:
+        """
+        Apply square neighbourhood processing for several neighbourhood
+        sizes, taking the neighbourhood sums for every size from one
+        summed-area table of the data and one of the valid data elements.
+
+        Args:
+            data:
+                Input data array.
+            nb_sizes:
+                Width of each square neighbourhood in grid points.
+            mask:
+                Mask of valid input data elements.
+
+        Returns:
+            Arrays containing the smoothed field for each neighbourhood size.
+        """
+        value_range = None
+        if not self.sum_only:
+            value_range = (np.nanmin(data), np.nanmax(data))
+
+        data, valid_data_mask, data_mask, out_data_dtype = self._prepare_data(
+            data, mask
+        )
+
+        data_sums = multi_boxsum(data, nb_sizes, mode="constant", constant_values=0)
+        if self.sum_only:
+            area_sums = [None] * len(nb_sizes)
+        else:
+            area_sums = multi_boxsum(
+                valid_data_mask, nb_sizes, mode="constant", constant_values=0
+            )
+        return [
+            self._finalise_neighbourhood(
+                data_sum, area_sum, data_mask, value_range, out_data_dtype
+            )
+            for data_sum, area_sum in zip(data_sums, area_sums)
+        ]
+
+    def _calculate_square_neighbourhood_batched(
+        self, data: ndarray, mask: ndarray = None
+    ) -> Union[ndarray, np.ma.MaskedArray]:
+        """
+        Apply square neighbourhood processing to every x-y-slice of an array
+        at once, giving the same result as _calculate_neighbourhood for each
+        slice. The slices are processed in batches, as many at once as the
+        memory budget allows (see :mod:`improver.utilities.memory_budget`),
+        and the summed-area tables of each batch are calculated in place in
+        a single padded work array reused for every batch.
+
+        Args:
+            data:
+                Input data array, with y and x as its last dimensions.
+            mask:
+                Mask of valid input data elements on the x-y grid.
+
+        Returns:
+            Array containing the smoothed field after the
+            neighbourhood method has been applied.
+        """
+        # the data mask alone defines the range of values of each slice
+        value_mask = np.ma.getmaskarray(data)
+        data_mask = value_mask if mask is None else value_mask | (mask == 0)
+        data = np.ma.getdata(data)
+        if issubclass(data.dtype.type, np.complexfloating):
+            loc_data_dtype, out_data_dtype = np.complex128, np.complex64
+        else:
+            loc_data_dtype, out_data_dtype = np.float64, np.float32
+
+        shape = data.shape
+        ny, nx = shape[-2:]
+        data = data.reshape((-1, ny, nx))
+        value_mask = value_mask.reshape((-1, ny, nx))
+        data_mask = data_mask.reshape((-1, ny, nx))
+        n_slices = data.shape[0]
+        half = self.nb_size // 2
+
+        # Where no points are masked in any slice beyond those of the mask,
+        # the valid points are the same in every slice and their
+        # neighbourhood sums are calculated once.
+        shared_area_sum = None
+        if not self.sum_only and not (data_mask != data_mask[0]).any():
+            shared_area_sum = boxsum(
+                (~data_mask[0]).astype(np.int64),
+                self.nb_size,
+                mode="constant",
+                constant_values=0,
+            )
+
+        # padded work array, data sums and area sums of each slice, and
+        # temporaries of the same size
+        padded_size = (ny + 2 * half + 1) * (nx + 2 * half + 1)
+        slice_bytes = np.dtype(loc_data_dtype).itemsize * (padded_size + 4 * ny * nx)
+        size = batch_size(
+            slice_bytes,
+            n_slices,
+            default=max(_DEFAULT_BATCH_BYTES // slice_bytes, 1),
+        )
+        work = np.zeros((size, ny + 2 * half + 1, nx + 2 * half + 1), loc_data_dtype)
+        interior = (slice(half + 1, half + 1 + ny), slice(half + 1, half + 1 + nx))
+
+        def _nbhood_sums(values: ndarray) -> ndarray:
+            """Neighbourhood sums of a batch of slices, with the data outside
+            the grid taken to be zero."""
+            batch = work[: len(values)]
+            # zero the padding accumulated into by the previous batch
+            batch[:, half + 1 + ny :, :] = 0
+            batch[:, :, half + 1 + nx :] = 0
+            batch[(slice(None), *interior)] = values
+            np.cumsum(batch, axis=-2, out=batch)
+            np.cumsum(batch, axis=-1, out=batch)
+            return boxsum(batch, self.nb_size, cumsum=False)
+
+        result = np.empty(data.shape, dtype=out_data_dtype)
+        for batch in batches(n_slices, size):
+            batch_mask = data_mask[batch]
+            batch_data = data[batch]
+            if not self.sum_only:
+                values = np.where(value_mask[batch], np.nan, batch_data)
+                with warnings.catch_warnings():
+                    # slices with every point masked are masked in the result
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    min_val = np.nanmin(values, axis=(-2, -1), keepdims=True)
+                    max_val = np.nanmax(values, axis=(-2, -1), keepdims=True)
+            nbhood_sum = _nbhood_sums(np.where(batch_mask, 0, batch_data))
+            if not self.sum_only:
+                if shared_area_sum is None:
+                    area_sum = _nbhood_sums(~batch_mask)
+                else:
+                    area_sum = shared_area_sum
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    # Calculate neighbourhood mean.
+                    nbhood_sum = nbhood_sum / area_sum
+                # For points where all data in the neighbourhood is masked,
+                # set result to nan
+                nbhood_sum[np.broadcast_to(area_sum == 0, nbhood_sum.shape)] = np.nan
+                nbhood_sum = nbhood_sum.clip(min_val, max_val)
+            result[batch] = nbhood_sum
+
+        result = result.reshape(shape)
+        if self.re_mask:
+            result = np.ma.masked_array(result, data_mask.reshape(shape), copy=False)
+        return result
+
+    def _stacked_nbhood_sums(
+        self, values: ndarray, max_extreme: Optional[ndarray] = None
+    ) -> ndarray:
+        """Calculate the neighbourhood sums of a stack of 2D fields, as
+        _do_nbhood_sum does for each field. For a square neighbourhood the
+        summed-area tables of every field are calculated together.
+
+        Args:
+            values:
+                Array of the fields, stacked along the leading dimension, in
+                which any masked points have been replaced with zeroes.
+            max_extreme:
+                Stack of the results for fields of all ones, for each field,
+                as for _do_nbhood_sum.
+
+        Returns:
+            Array containing the neighbourhood sums of each field.
+        """
+        if self.neighbourhood_method == "square":
+            return boxsum(values, self.nb_size, mode="constant", constant_values=0)
+        if max_extreme is None:
+            max_extreme = [None] * len(values)
+        return np.array(
+            [
+                self._do_nbhood_sum(field, max_extreme=extreme)
+                for field, extreme in zip(values, max_extreme)
+            ]
+        )
+
     def _do_nbhood_sum(
         self, data: np.ndarray, max_extreme: Optional[np.ndarray] = None
     ) -> np.ndarray:
@@ -398,7 +754,12 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
                     data, self.nb_size, mode="constant", constant_values=extreme
                 )
             elif self.neighbourhood_method == "circular":
-                data = correlate(data, self.kernel, mode="nearest")
+                if self.weighted_mode or self.nb_size < _CHORD_SUM_MIN_SIZE:
+                    data = correlate(data, self.kernel, mode="nearest")
+                else:
+                    # Sum along the chords of the circle, at a cost growing
+                    # with the radius rather than the area of the kernel.
+                    data = chord_sum(data, self.kernel, mode="edge")
         else:
             data = untrimmed
 
@@ -408,7 +769,9 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
             data = untrimmed
         return data
 
-    def process(self, cube: Cube, mask_cube: Optional[Cube] = None) -> Cube:
+    def process(
+        self, cube: Cube, mask_cube: Optional[Cube] = None
+    ) -> Union[Cube, CubeList]:
         """
         Call the methods required to apply a neighbourhood processing to a cube.
 
@@ -429,17 +792,74 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
                 will be applied. Usually thresholded data.
             mask_cube:
                 Cube containing the array to be used as a mask. Zero values in
-                this array are taken as points to be masked.
+                this array are taken as points to be masked. If land_and_sea
+                is set, this is the land-sea mask, which is one over land and
+                zero over sea.
 
         Returns:
             Cube containing the smoothed field after the
-            neighbourhood method has been applied.
+            neighbourhood method has been applied, or a list of such cubes
+            for each radius if several radii were given without lead times.
+
+        Raises:
+            ValueError: If land_and_sea is set and no mask cube is given.
         """
         super().process(cube)
         check_if_grid_is_equal_area(cube)
 
+        if self._multiple_radii():
+            return self._process_radii(cube, mask_cube)
+
         # If the data is masked, the mask will be processed as well as the
         # original_data * mask array.
+        self._set_neighbourhood_size(cube)
+
+        try:
+            mask_cube_data = mask_cube.data
+        except AttributeError:
+            mask_cube_data = None
+
+        if self.land_and_sea:
+            if mask_cube_data is None:
+                raise ValueError("A land-sea mask cube is required for land_and_sea.")
+            result_slices = CubeList()
+            for cube_slice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
+                cube_slice.data = self._calculate_land_and_sea_neighbourhood(
+                    cube_slice.data, mask_cube_data
+                )
+                result_slices.append(cube_slice)
+            return result_slices.merge_cube()
+
+        yx_dims = [cube.coord_dims(cube.coord(axis=axis)) for axis in "yx"]
+        if self.neighbourhood_method == "square" and yx_dims == [
+            (cube.ndim - 2,),
+            (cube.ndim - 1,),
+        ]:
+            # Process all x-y-slices together.
+            return cube.copy(
+                data=self._calculate_square_neighbourhood_batched(
+                    cube.data, mask_cube_data
+                )
+            )
+
+        result_slices = CubeList()
+        for cube_slice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
+            cube_slice.data = self._calculate_neighbourhood(
+                cube_slice.data, mask_cube_data
+            )
+            result_slices.append(cube_slice)
+        neighbourhood_averaged_cube = result_slices.merge_cube()
+
+        return neighbourhood_averaged_cube
+
+    def _set_neighbourhood_size(self, cube: Cube) -> None:
+        """Set the size of the neighbourhood in grid points for the radius on
+        the grid of the cube, and the kernel of a circular neighbourhood.
+
+        Args:
+            cube:
+                Cube to which the neighbourhood processing will be applied.
+        """
         check_radius_against_distance(cube, self.radius)
 
         grid_cells = distance_to_number_of_grid_cells(cube, self.radius)
@@ -449,20 +869,134 @@ class NeighbourhoodProcessing(BaseNeighbourhoodProcessing):
         else:
             self.nb_size = 2 * grid_cells + 1
 
+    def collapse_masked_neighbourhoods(
+        self, cube: Cube, masks: ndarray, weights: ndarray
+    ) -> Cube:
+        """
+        Apply neighbourhood processing to a 2D cube with each of a stack of
+        masks, such as the masks of topographic bands, and calculate the
+        weighted mean of the results over the masks. Results for masks with
+        no valid points within the neighbourhood of a point are excluded from
+        its mean, the weights of the others being renormalised, as by the
+        collapse_mask_coord method of
+        :class:`~improver.nbhood.use_nbhood.ApplyNeighbourhoodProcessingWithAMask`.
+
+        The data are prepared once, and the neighbourhood sums of the masked
+        data and of the masks are calculated together for batches of masks,
+        as many at once as the memory budget allows (see
+        :mod:`improver.utilities.memory_budget`). The weighted results of each
+        batch are accumulated as they are calculated, so the result for every
+        mask is never held at once. The result is not re-masked.
+
+        Args:
+            cube:
+                2D cube containing the array to which the neighbourhood
+                processing will be applied.
+            masks:
+                Array of the masks, with a leading dimension along which the
+                masks are stacked followed by the y and x dimensions of the
+                cube. Zero values are taken as points to be masked.
+            weights:
+                Array of the weight of each mask at each point, of the same
+                shape as the masks. Masked weights are excluded.
+
+        Returns:
+            Cube containing the weighted mean of the neighbourhood processed
+            fields, which is masked, with NaN values, at points where no mask
+            has any weight and valid points within the neighbourhood.
+        """
+        super().process(cube)
+        check_if_grid_is_equal_area(cube)
+        self._set_neighbourhood_size(cube)
+
+        value_range = None
+        if not self.sum_only:
+            value_range = (np.nanmin(cube.data), np.nanmax(cube.data))
+        data, _, data_mask, out_data_dtype = self._prepare_data(cube.data)
+        weights_mask = np.ma.getmaskarray(weights)
+        weights = np.ma.getdata(weights)
+
+        # masks, masked data, their neighbourhood sums, and temporaries
+        mask_bytes = np.dtype(data.dtype).itemsize * 6 * data.size
+        size = batch_size(
+            mask_bytes,
+            len(masks),
+            default=max(_DEFAULT_BATCH_BYTES // mask_bytes, 1),
+        )
+        total = np.zeros(data.shape, dtype=data.dtype)
+        total_weight = np.zeros(data.shape)
+        for batch in batches(len(masks), size):
+            valid = (masks[batch] != 0) & ~data_mask
+            if self.sum_only:
+                results = self._stacked_nbhood_sums(np.where(valid, data, 0))
+                no_data = np.zeros(results.shape, dtype=bool)
+            else:
+                area_sums = self._stacked_nbhood_sums(valid.astype(data.dtype))
+                results = self._stacked_nbhood_sums(
+                    np.where(valid, data, 0), max_extreme=area_sums
+                )
+                no_data = area_sums == 0
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    results = (results / area_sums).clip(*value_range)
+            batch_weights = np.where(weights_mask[batch] | no_data, 0, weights[batch])
+            total += (batch_weights * np.where(no_data, 0, results)).sum(axis=0)
+            total_weight += batch_weights.sum(axis=0)
+
+        no_weight = total_weight == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = total / total_weight
+        result[no_weight] = np.nan
+        return cube.copy(
+            data=np.ma.masked_array(result.astype(out_data_dtype), mask=no_weight)
+        )
+
+    def _process_radii(self, cube: Cube, mask_cube: Optional[Cube] = None) -> CubeList:
+        """
+        Apply neighbourhood processing for each of the radii. For square
+        neighbourhoods the cumulative sums of each x-y-slice are calculated
+        once and used for every radius.
+
+        Args:
+            cube:
+                Cube containing the array to which the neighbourhood processing
+                will be applied.
+            mask_cube:
+                Cube containing the array to be used as a mask.
+
+        Returns:
+            Cubes containing the smoothed field for each radius, in the
+            order of the radii.
+        """
+        if self.neighbourhood_method == "circular":
+            return CubeList(
+                NeighbourhoodProcessing(
+                    self.neighbourhood_method,
+                    radius,
+                    weighted_mode=self.weighted_mode,
+                    sum_only=self.sum_only,
+                    re_mask=self.re_mask,
+                )(cube, mask_cube=mask_cube)
+                for radius in self.radii
+            )
+
+        nb_sizes = []
+        for radius in self.radii:
+            check_radius_against_distance(cube, radius)
+            nb_sizes.append(2 * distance_to_number_of_grid_cells(cube, radius) + 1)
+
         try:
             mask_cube_data = mask_cube.data
         except AttributeError:
             mask_cube_data = None
 
-        result_slices = CubeList()
+        result_slices = [CubeList() for _ in nb_sizes]
         for cube_slice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
-            cube_slice.data = self._calculate_neighbourhood(
-                cube_slice.data, mask_cube_data
+            results = self._calculate_square_neighbourhoods(
+                cube_slice.data, nb_sizes, mask_cube_data
             )
-            result_slices.append(cube_slice)
-        neighbourhood_averaged_cube = result_slices.merge_cube()
-
-        return neighbourhood_averaged_cube
+            for slices, result in zip(result_slices, results):
+                slices.append(cube_slice.copy(data=result))
+        return CubeList(slices.merge_cube() for slices in result_slices)
 
 
 class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
@@ -473,6 +1007,7 @@ class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
         radii: Union[float, List[float]],
         lead_times: Optional[List] = None,
         percentiles: Union[float, List[float]] = DEFAULT_PERCENTILES,
+        histogram_bins: Optional[int] = None,
     ) -> None:
         """
         Create a neighbourhood processing subclass that generates percentiles
@@ -480,6 +1015,13 @@ class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
         grid cells is imposed in order to avoid computational inefficiency and
         possible memory errors.
 
+        Where numba is available, the values within the neighbourhood are kept
+        sorted as it slides along each row of the grid, rather than sorted
+        afresh for each grid point. Alternatively, approximate percentiles
+        can be calculated from histograms of the values within each
+        neighbourhood, which are much quicker to calculate for large
+        neighbourhoods.
+
         Args:
             radii:
                 The radii in metres of the neighbourhood to apply.
@@ -493,9 +1035,123 @@ class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
             percentiles:
                 Percentile value(s) at which to calculate; if not provided uses
                 DEFAULT_PERCENTILES.
+            histogram_bins:
+                If set, calculate the percentiles from histograms of the values
+                within each neighbourhood, with the range of the data divided
+                into this number of bins. The percentiles are interpolated
+                within the bins, so are approximate unless the data contain no
+                more distinct values than there are bins. The cost grows with
+                the number of bins and the diameter, rather than the area, of
+                the neighbourhood.
+
+        Raises:
+            ValueError: If histogram_bins is not positive.
         """
         super().__init__(radii, lead_times=lead_times)
         self.percentiles = tuple(as_iterable(percentiles))
+        if histogram_bins is not None and histogram_bins < 1:
+            raise ValueError(
+                f"The number of histogram bins must be positive, not {histogram_bins}"
+            )
+        self.histogram_bins = histogram_bins
+
+    @staticmethod
+    def _kernel_runs(kernel_mask: ndarray) -> List[Tuple[int, int, int]]:
+        """Split each row of a kernel into runs of consecutive points.
+
+        Args:
+            kernel_mask:
+                Boolean array selecting the points of the kernel.
+
+        Returns:
+            The row, start column and stop column of each run.
+        """
+        runs = []
+        for row, values in enumerate(kernel_mask):
+            edges = np.diff(np.concatenate([[0], values.astype(np.int8), [0]]))
+            (starts,) = np.nonzero(edges == 1)
+            (stops,) = np.nonzero(edges == -1)
+            runs.extend((row, start, stop) for start, stop in zip(starts, stops))
+        return runs
+
+    def _histogram_percentiles(
+        self, padded: ndarray, kernel_mask: ndarray, percentiles: ndarray
+    ) -> ndarray:
+        """Calculate percentiles over a kernel around each point from the
+        histogram of the values within the kernel.
+
+        The cumulative histogram of each neighbourhood is built up a bin at a
+        time, the number of values within each neighbourhood falling into the
+        bin being the sum of differences of cumulative sums along the rows of
+        the grid, one for each run of points along a row of the kernel. The
+        values of the order statistics needed for the percentiles are taken
+        from the bins in which the cumulative histogram passes their rank,
+        and interpolated linearly as by numpy.percentile. If the data have no
+        more distinct values than there are bins, each bin holds one of those
+        values and the percentiles are exact; otherwise the range of the data
+        is divided into bins of equal width, and the values within each bin
+        are assumed to be evenly spread across it.
+
+        Args:
+            padded:
+                2D array of the data, padded by half the size of the kernel
+                along each dimension.
+            kernel_mask:
+                Boolean array selecting the points of the kernel.
+            percentiles:
+                Percentiles to calculate.
+
+        Returns:
+            Array of the percentiles, with the percentile as the leading
+            dimension.
+        """
+        ny, nx = (
+            size - kernel_size + 1
+            for size, kernel_size in zip(padded.shape, kernel_mask.shape)
+        )
+        runs = self._kernel_runs(kernel_mask)
+        positions = percentiles.astype(np.float64) / 100
+        positions *= np.count_nonzero(kernel_mask) - 1
+        lower = np.floor(positions).astype(int)
+        upper = np.minimum(lower + 1, np.count_nonzero(kernel_mask) - 1)
+        ranks = np.unique(np.concatenate([lower, upper]))
+
+        levels = np.unique(padded)
+        exact = levels.size <= self.histogram_bins
+        if exact:
+            bins = np.searchsorted(levels, padded)
+        else:
+            edges = np.linspace(levels[0], levels[-1], self.histogram_bins + 1)
+            bins = np.searchsorted(edges, padded, side="right") - 1
+            bins = np.clip(bins, 0, self.histogram_bins - 1)
+
+        # cumulative sums along rows, with a leading zero column
+        cumulative = np.zeros((padded.shape[0], padded.shape[1] + 1), dtype=np.int32)
+        below = np.zeros((ny, nx), dtype=np.int32)
+        order_statistics = np.zeros((len(ranks), ny, nx))
+        for index in range(bins.max() + 1):
+            np.cumsum(bins == index, axis=-1, out=cumulative[:, 1:])
+            in_bin = np.zeros((ny, nx), dtype=np.int32)
+            for row, start, stop in runs:
+                in_bin += cumulative[row : row + ny, stop : stop + nx]
+                in_bin -= cumulative[row : row + ny, start : start + nx]
+            for statistic, rank in zip(order_statistics, ranks):
+                found = (below <= rank) & (below + in_bin > rank)
+                if exact:
+                    statistic[found] = levels[index]
+                else:
+                    width = edges[index + 1] - edges[index]
+                    statistic[found] = edges[index] + width * (
+                        (rank - below[found] + 0.5) / in_bin[found]
+                    )
+            below += in_bin
+            if below.min() > ranks[-1]:
+                break
+
+        lower_values = order_statistics[np.searchsorted(ranks, lower)]
+        upper_values = order_statistics[np.searchsorted(ranks, upper)]
+        fraction = (positions - lower)[:, np.newaxis, np.newaxis]
+        return lower_values + fraction * (upper_values - lower_values)
 
     def pad_and_unpad_cube(self, slice_2d: Cube, kernel: ndarray) -> Cube:
         """
@@ -647,22 +1303,59 @@ class GeneratePercentilesFromANeighbourhood(BaseNeighbourhoodProcessing):
                     # fmt: on
         """
         kernel_mask = kernel > 0
-        nb_slices = pad_and_roll(
-            slice_2d.data, kernel.shape, mode="mean", stat_length=max(kernel.shape) // 2
-        )
+        pad_options = {"mode": "mean", "stat_length": max(kernel.shape) // 2}
         percentiles = np.array(self.percentiles, dtype=np.float32)
 
         # Create cube for output percentile data.
         pctcube = self.make_percentile_cube(slice_2d)
 
+        try:
+            import numba  # noqa: F401
+
+            from improver.nbhood.numba_utilities import (
+                fast_neighbourhood_percentiles,
+            )
+        except ImportError:
+            fast_neighbourhood_percentiles = None
+
+        # NaN values are left to numpy.percentile, as they cannot be sorted.
+        if not np.isnan(slice_2d.data).any() and (
+            self.histogram_bins is not None
+            or fast_neighbourhood_percentiles is not None
+        ):
+            padded = np.pad(
+                slice_2d.data,
+                [(size // 2, size // 2) for size in kernel.shape],
+                **pad_options,
+            )
+            if self.histogram_bins is not None:
+                result = self._histogram_percentiles(padded, kernel_mask, percentiles)
+            else:
+                result = fast_neighbourhood_percentiles(
+                    padded,
+                    kernel_mask,
+                    percentiles,
+                    np.empty(pctcube.shape, dtype=pctcube.dtype),
+                )
+            pctcube.data[...] = result
+            return iris.util.squeeze(pctcube)
+
+        nb_slices = pad_and_roll(slice_2d.data, kernel.shape, **pad_options)
+
         # Collapse neighbourhood windows into percentiles.
-        # (Loop over outer dimension to reduce memory footprint.)
-        for nb_chunk, perc_chunk in zip(nb_slices, pctcube.data.swapaxes(0, 1)):
+        # (Loop over batches of rows, as many as the memory budget allows, to
+        # reduce memory footprint.)
+        n_rows, n_cols = nb_slices.shape[:2]
+        row_bytes = n_cols * (
+            2 * np.count_nonzero(kernel_mask) * nb_slices.itemsize
+            + 8 * len(percentiles)
+        )
+        for rows in batches(n_rows, batch_size(row_bytes, n_rows)):
             np.percentile(
-                nb_chunk[..., kernel_mask],
+                nb_slices[rows][..., kernel_mask],
                 percentiles,
                 axis=-1,
-                out=perc_chunk,
+                out=pctcube.data[:, rows],
                 overwrite_input=True,
             )
 
@@ -774,6 +1467,7 @@ class MetaNeighbourhood(BasePlugin):
         area_sum: bool = False,
         percentiles: Union[float, List[float]] = DEFAULT_PERCENTILES,
         halo_radius: Optional[float] = None,
+        multiple_radii: bool = False,
     ) -> None:
         """
         Initialise the MetaNeighbourhood class.
@@ -824,10 +1518,33 @@ class MetaNeighbourhood(BasePlugin):
                 where a larger grid was defined than the standard grid and we want
                 to clip the grid back to the standard grid. Otherwise no clipping
                 is applied.
+            multiple_radii:
+                Apply neighbourhood processing for each of the radii, rather
+                than choosing the radius by lead time, returning a list with
+                a cube for each radius. For square neighbourhoods the
+                neighbourhood sums for every radius are calculated together.
+                Only applicable for calculating "probabilities" output
+                without lead_times.
+
+        Raises:
+            RuntimeError: If the options are incompatible.
         """
         self._neighbourhood_output = neighbourhood_output
         self._neighbourhood_shape = neighbourhood_shape
-        self._radius_or_radii, self._lead_times = radius_by_lead_time(radii, lead_times)
+        if multiple_radii:
+            if lead_times is not None:
+                raise RuntimeError("multiple_radii cannot be used with lead_times")
+            if neighbourhood_output != "probabilities":
+                raise RuntimeError(
+                    "multiple_radii can only be used with "
+                    'neighbourhood_output="probabilities"'
+                )
+            self._radius_or_radii = [float(x) for x in as_iterable(radii)]
+            self._lead_times = None
+        else:
+            self._radius_or_radii, self._lead_times = radius_by_lead_time(
+                radii, lead_times
+            )
         self._degrees_as_complex = degrees_as_complex
         self._weighted_mode = weighted_mode
         self._area_sum = area_sum
@@ -849,7 +1566,7 @@ class MetaNeighbourhood(BasePlugin):
                     "Cannot process complex numbers with circular neighbourhoods"
                 )
 
-    def process(self, cube: Cube, mask: Cube = None) -> Cube:
+    def process(self, cube: Cube, mask: Cube = None) -> Union[Cube, CubeList]:
         """
         Apply neighbourhood processing to the input cube.
 
@@ -858,7 +1575,8 @@ class MetaNeighbourhood(BasePlugin):
             mask: The mask cube.
 
         Returns:
-            iris.cube.Cube: The processed cube.
+            iris.cube.Cube: The processed cube, or a list of cubes for each
+            radius if multiple_radii is set.
         """
         cube = as_cube(cube)
         if mask:
@@ -884,11 +1602,13 @@ class MetaNeighbourhood(BasePlugin):
                 percentiles=self._percentiles,
             )(cube)
 
-        if self._degrees_as_complex:
-            # convert neighbourhooded cube back to degrees
-            result.data = complex_to_deg(result.data)
-        if self._halo_radius is not None:
-            from improver.utilities.pad_spatial import remove_cube_halo
+        results = result if isinstance(result, CubeList) else CubeList([result])
+        for index, result_cube in enumerate(results):
+            if self._degrees_as_complex:
+                # convert neighbourhooded cube back to degrees
+                result_cube.data = complex_to_deg(result_cube.data)
+            if self._halo_radius is not None:
+                from improver.utilities.pad_spatial import remove_cube_halo
 
-            result = remove_cube_halo(result, self._halo_radius)
-        return result
+                results[index] = remove_cube_halo(result_cube, self._halo_radius)
+        return results if isinstance(result, CubeList) else results[0]
@@ -0,0 +1,197 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""
+This module defines the optional numba utilities for neighbourhood
+processing plugins.
+"""
+
+import os
+
+import numpy as np
+from numba import config, njit, prange, set_num_threads
+
+config.THREADING_LAYER = "omp"
+if "OMP_NUM_THREADS" in os.environ:
+    set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+
+
+@njit(parallel=True)
+def _recursive_filter(
+    grids: np.ndarray,
+    coeffs_x: np.ndarray,
+    keep_x: np.ndarray,
+    coeffs_y: np.ndarray,
+    keep_y: np.ndarray,
+    iterations: int,
+) -> None:
+    """Apply the recursive filter in place to each grid in parallel, given
+    the smoothing coefficients along x and y and their complements."""
+    n_grids, ny, nx = grids.shape
+    for index in prange(n_grids):
+        grid = grids[index]
+        c_x, k_x = coeffs_x[index], keep_x[index]
+        c_y, k_y = coeffs_y[index], keep_y[index]
+        for _ in range(iterations):
+            # forward and backward along x, for each row in turn
+            for j in range(ny):
+                for i in range(1, nx):
+                    grid[j, i] = (
+                        k_x[j, i - 1] * grid[j, i] + c_x[j, i - 1] * grid[j, i - 1]
+                    )
+                for i in range(nx - 2, -1, -1):
+                    grid[j, i] = k_x[j, i] * grid[j, i] + c_x[j, i] * grid[j, i + 1]
+            # forward and backward along y, a row at a time
+            for j in range(1, ny):
+                for i in range(nx):
+                    grid[j, i] = (
+                        k_y[j - 1, i] * grid[j, i] + c_y[j - 1, i] * grid[j - 1, i]
+                    )
+            for j in range(ny - 2, -1, -1):
+                for i in range(nx):
+                    grid[j, i] = k_y[j, i] * grid[j, i] + c_y[j, i] * grid[j + 1, i]
+
+
+def fast_recursive_filter(
+    grids: np.ndarray,
+    smoothing_coefficients_x: np.ndarray,
+    smoothing_coefficients_y: np.ndarray,
+    iterations: int,
+) -> np.ndarray:
+    """Apply the recursive filter to each of a stack of 2-D grids in place,
+    equivalent to RecursiveFilter._run_recursion for each grid. The grids
+    are filtered in parallel.
+
+    Args:
+        grids: n * ny * nx array of the data to filter, with y then x as
+            the last dimensions
+        smoothing_coefficients_x: n * ny * (nx - 1) array of the smoothing
+            coefficients between adjacent points along x for each grid
+        smoothing_coefficients_y: n * (ny - 1) * nx array of the smoothing
+            coefficients between adjacent points along y for each grid
+        iterations: number of iterations of the filter
+    Returns:
+        The filtered grids.
+    """
+    n_grids, ny, nx = grids.shape
+    if smoothing_coefficients_x.shape != (n_grids, ny, nx - 1):
+        raise ValueError("smoothing_coefficients_x must be of shape n * ny * (nx - 1).")
+    if smoothing_coefficients_y.shape != (n_grids, ny - 1, nx):
+        raise ValueError("smoothing_coefficients_y must be of shape n * (ny - 1) * nx.")
+    # The complements are calculated here, as in the NumPy implementation, so
+    # that the arithmetic in the compiled loops is in the precision of the data.
+    _recursive_filter(
+        grids,
+        smoothing_coefficients_x,
+        1.0 - smoothing_coefficients_x,
+        smoothing_coefficients_y,
+        1.0 - smoothing_coefficients_y,
+        iterations,
+    )
+    return grids
+
+
+@njit(parallel=True)
+def _sliding_percentiles(
+    padded: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    leaving_rows: np.ndarray,
+    leaving_cols: np.ndarray,
+    entering_rows: np.ndarray,
+    entering_cols: np.ndarray,
+    positions: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Calculate percentiles over a kernel for each row of the output in
+    parallel, keeping the values within the kernel sorted as it slides along
+    the row."""
+    n_percentiles, ny, nx = out.shape
+    n_window = rows.size
+    n_change = leaving_rows.size
+    for y in prange(ny):
+        window = np.empty(n_window, dtype=padded.dtype)
+        merged = np.empty(n_window, dtype=padded.dtype)
+        leaving = np.empty(n_change, dtype=padded.dtype)
+        entering = np.empty(n_change, dtype=padded.dtype)
+        for i in range(n_window):
+            window[i] = padded[y + rows[i], cols[i]]
+        window.sort()
+        for x in range(nx):
+            if x > 0:
+                for i in range(n_change):
+                    leaving[i] = padded[y + leaving_rows[i], x - 1 + leaving_cols[i]]
+                    entering[i] = padded[y + entering_rows[i], x + entering_cols[i]]
+                leaving.sort()
+                entering.sort()
+                # merge the entering values into the window, skipping the
+                # values which leave it
+                i = j = k = n = 0
+                while n < n_window:
+                    if j < n_change and i < n_window and window[i] == leaving[j]:
+                        i += 1
+                        j += 1
+                    elif k < n_change and (i == n_window or entering[k] < window[i]):
+                        merged[n] = entering[k]
+                        k += 1
+                        n += 1
+                    else:
+                        merged[n] = window[i]
+                        i += 1
+                        n += 1
+                window, merged = merged, window
+            for p in range(n_percentiles):
+                lower = int(positions[p])
+                upper = min(lower + 1, n_window - 1)
+                fraction = positions[p] - lower
+                out[p, y, x] = window[lower] + fraction * (
+                    window[upper] - window[lower]
+                )
+
+
+def fast_neighbourhood_percentiles(
+    padded: np.ndarray,
+    kernel_mask: np.ndarray,
+    percentiles: np.ndarray,
+    out: np.ndarray,
+) -> np.ndarray:
+    """Calculate percentiles of the values within a kernel around each point
+    of a 2-D grid, interpolating linearly between values as numpy.percentile
+    does. The values within the kernel are kept sorted as it slides along
+    each row, so that each step only removes the values of the columns
+    leaving the kernel and merges in those entering it.
+
+    Args:
+        padded: 2-D array of the data, padded by half the size of the
+            kernel along each dimension. Must not contain NaN values.
+        kernel_mask: 2-D boolean array selecting the points of the kernel,
+            of odd size along each dimension
+        percentiles: percentiles to calculate, between 0 and 100
+        out: array of shape (percentiles, y, x) for the result, where y
+            and x are the dimensions of the unpadded data
+    Returns:
+        The array of percentiles.
+    """
+    rows, cols = np.nonzero(kernel_mask)
+    # points whose left or right neighbour within the kernel row is outside
+    # the kernel leave it or enter it as it moves one column along
+    previous = np.zeros_like(kernel_mask)
+    previous[:, 1:] = kernel_mask[:, :-1]
+    following = np.zeros_like(kernel_mask)
+    following[:, :-1] = kernel_mask[:, 1:]
+    leaving_rows, leaving_cols = np.nonzero(kernel_mask & ~previous)
+    entering_rows, entering_cols = np.nonzero(kernel_mask & ~following)
+    positions = np.asarray(percentiles, dtype=np.float64) / 100 * (rows.size - 1)
+    _sliding_percentiles(
+        padded,
+        rows,
+        cols,
+        leaving_rows,
+        leaving_cols,
+        entering_rows,
+        entering_cols,
+        positions,
+        out,
+    )
+    return out
@@ -277,6 +277,46 @@ class RecursiveFilter(PostProcessingPlugin):
 
         return smoothing_coefficients
 
+    def _run_recursions(
+        self, padded_slices: List[Tuple[Cube, Cube, Cube]]
+    ) -> List[Cube]:
+        """
+        Run the recursive filter on each of a list of slices. Where numba
+        is available, all iterations for every slice are run in a single
+        call of a compiled implementation (see
+        :func:`improver.nbhood.numba_utilities.fast_recursive_filter`),
+        filtering the slices in parallel. Otherwise each slice is filtered
+        in turn by :meth:`_run_recursion`.
+
+        Args:
+            padded_slices:
+                For each slice, the 2D cube containing the input data, with
+                y and x dimensions in that order, and the cubes of smoothing
+                coefficients along x and y.
+
+        Returns:
+            Cubes containing the smoothed field of each slice.
+        """
+        try:
+            import numba  # noqa: F401
+
+            from improver.nbhood.numba_utilities import fast_recursive_filter
+        except ImportError:
+            return [
+                self._run_recursion(cube, coeffs_x, coeffs_y, self.iterations)
+                for cube, coeffs_x, coeffs_y in padded_slices
+            ]
+
+        grids = np.stack([np.ma.getdata(cube.data) for cube, _, _ in padded_slices])
+        coeffs_x, coeffs_y = [
+            np.stack([np.ma.getdata(coeffs[axis].data) for coeffs in padded_slices])
+            for axis in (1, 2)
+        ]
+        fast_recursive_filter(grids, coeffs_x, coeffs_y, self.iterations)
+        for (cube, _, _), grid in zip(padded_slices, grids):
+            cube.data = grid
+        return [cube for cube, _, _ in padded_slices]
+
     def _pad_coefficients(self, coeff_x, coeff_y):
         """Pad smoothing coefficients"""
         pad_x, pad_y = [
@@ -382,7 +422,8 @@ class RecursiveFilter(PostProcessingPlugin):
                         "Input cube contains spatial slices with different masks."
                     )
 
-        recursed_cube = iris.cube.CubeList()
+        padded_slices = []
+        mask_cubes = []
         for cslice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
             padded_cube = pad_cube_with_halo(
                 cslice, 2 * self.edge_width, 2 * self.edge_width, pad_method="symmetric"
@@ -403,13 +444,13 @@ class RecursiveFilter(PostProcessingPlugin):
             padded_coefficients_x, padded_coefficients_y = self._pad_coefficients(
                 slice_coeffs_x, slice_coeffs_y
             )
-
-            new_cube = self._run_recursion(
-                padded_cube,
-                padded_coefficients_x,
-                padded_coefficients_y,
-                self.iterations,
+            padded_slices.append(
+                (padded_cube, padded_coefficients_x, padded_coefficients_y)
             )
+            mask_cubes.append(mask_cube)
+
+        recursed_cube = iris.cube.CubeList()
+        for new_cube, mask_cube in zip(self._run_recursions(padded_slices), mask_cubes):
             new_cube = remove_halo_from_cube(
                 new_cube, 2 * self.edge_width, 2 * self.edge_width
             )
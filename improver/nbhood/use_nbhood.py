@@ -223,6 +223,13 @@ class ApplyNeighbourhoodProcessingWithAMask(PostProcessingPlugin):
         )
         yname = cube.coord(axis="y").name()
         xname = cube.coord(axis="x").name()
+        if self.collapse_weights is not None:
+            masks = np.array(
+                [
+                    mask_slice.data
+                    for mask_slice in mask_cube.slices_over(self.coord_for_masking)
+                ]
+            )
         result_slices = iris.cube.CubeList([])
         # Take 2D slices of the input cube for memory issues.
         prev_x_y_slice = None
@@ -238,6 +245,16 @@ class ApplyNeighbourhoodProcessingWithAMask(PostProcessingPlugin):
                 continue
             prev_x_y_slice = x_y_slice
 
+            if self.collapse_weights is not None:
+                # Accumulate the weighted mean over the masks directly,
+                # rather than collapsing a cube of the result for each mask.
+                result_slices.append(
+                    plugin.collapse_masked_neighbourhoods(
+                        x_y_slice, masks, self.collapse_weights.data
+                    )
+                )
+                continue
+
             cube_slices = iris.cube.CubeList([])
             # Apply each mask in mask_cube to the 2D input slice.
             for mask_slice in mask_cube.slices_over(self.coord_for_masking):
@@ -246,10 +263,7 @@ class ApplyNeighbourhoodProcessingWithAMask(PostProcessingPlugin):
                 output_cube.add_aux_coord(coord_object)
                 output_cube = iris.util.new_axis(output_cube, self.coord_for_masking)
                 cube_slices.append(output_cube)
-            concatenated_cube = cube_slices.concatenate_cube()
-            if self.collapse_weights is not None:
-                concatenated_cube = self.collapse_mask_coord(concatenated_cube)
-            result_slices.append(concatenated_cube)
+            result_slices.append(cube_slices.concatenate_cube())
         result = result_slices.merge_cube()
         # Promote any single value dimension coordinates if they were
         # dimension on the input cube.
@@ -18,6 +18,7 @@ from scipy.spatial import cKDTree
 from improver import BasePlugin
 from improver.metadata.utilities import create_coordinate_hash
 from improver.spotdata.build_spotdata_cube import build_spotdata_cube
+from improver.utilities.ancillary_cache import cached_arrays
 from improver.utilities.cube_manipulation import enforce_coordinate_ordering
 
 from .utilities import get_neighbour_finding_method_name
@@ -316,25 +317,41 @@ class NeighbourSelection(BasePlugin):
               indices that correspond to the selected node,
               e.g. node=100 -->  x_coord_index=10, y_coord_index=300,
               index_nodes[100] = [10, 300]
-        """
-        if self.land_constraint:
-            included_points = np.nonzero(land_mask.data)
-        else:
-            included_points = np.where(np.isfinite(land_mask.data.data))
 
-        x_indices = included_points[0]
-        y_indices = included_points[1]
-        x_coords = land_mask.coord(axis="x").points[x_indices]
-        y_coords = land_mask.coord(axis="y").points[y_indices]
+        The nodes are read from the ancillary cache where one is configured
+        (see :mod:`improver.utilities.ancillary_cache`).
+        """
 
-        if self.global_coordinate_system:
-            nodes = self.geocentric_cartesian(land_mask, x_coords, y_coords)
-        else:
-            nodes = list(zip(x_coords, y_coords))
+        def _calculate():
+            if self.land_constraint:
+                included_points = np.nonzero(land_mask.data)
+            else:
+                included_points = np.where(np.isfinite(land_mask.data.data))
 
-        index_nodes = np.array(list(zip(x_indices, y_indices)))
+            x_indices = included_points[0]
+            y_indices = included_points[1]
+            x_coords = land_mask.coord(axis="x").points[x_indices]
+            y_coords = land_mask.coord(axis="y").points[y_indices]
 
-        return cKDTree(nodes), index_nodes
+            if self.global_coordinate_system:
+                nodes = self.geocentric_cartesian(land_mask, x_coords, y_coords)
+            else:
+                nodes = np.stack([x_coords, y_coords], axis=-1)
+
+            index_nodes = np.stack([x_indices, y_indices], axis=-1)
+            return {"nodes": nodes, "index_nodes": index_nodes}
+
+        arrays = cached_arrays(
+            "NeighbourSelection.build_KDTree",
+            [
+                land_mask,
+                land_mask.data,
+                self.land_constraint,
+                self.global_coordinate_system,
+            ],
+            _calculate,
+        )
+        return cKDTree(arrays["nodes"]), arrays["index_nodes"]
 
     def select_minimum_dz(
         self,
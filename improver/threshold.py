@@ -8,6 +8,7 @@ import numbers
 from collections.abc import Iterable
 from typing import Dict, List, Optional, Tuple, Union
 
+import dask.array as da
 import iris
 import numpy as np
 from cf_units import Unit
@@ -24,12 +25,13 @@ from improver.metadata.probabilistic import (
 )
 from improver.metadata.utilities import enforce_time_point_standard
 from improver.utilities.cube_manipulation import enforce_coordinate_ordering
+from improver.utilities.memory_budget import batch_size, batches
 from improver.utilities.probability_manipulation import comparison_operator_dict
 from improver.utilities.rescale import rescale
 from improver.utilities.spatial import (
     create_vicinity_coord,
     distance_to_number_of_grid_cells,
-    maximum_within_vicinity,
+    maxima_within_vicinity,
     rename_vicinity_cube,
 )
 
@@ -467,6 +469,92 @@ class Threshold(PostProcessingPlugin):
 
         return truth_value.astype(FLOAT_DTYPE)
 
+    def _calculate_truth_values(self, cube: Cube, index: slice) -> np.ndarray:
+        """
+        Compares the diagnostic values to several threshold values at once,
+        giving the same truth values as _calculate_truth_value for each.
+
+        For thresholds without fuzzy bounds, the sorted threshold values are
+        searched for each diagnostic value, giving the number of thresholds
+        it exceeds, from which the truth value for every threshold follows.
+        Thresholds with fuzzy bounds are rescaled together, with the
+        thresholds and bounds broadcast along a leading dimension.
+
+        Args:
+            cube:
+                A cube containing the diagnostic values. The cube rather than array
+                is passed in to allow for unit conversion.
+            index:
+                The thresholds against which to compare the diagnostic values.
+
+        Returns:
+            An array of truth values with a leading dimension for each threshold,
+            at the default float precision, masked where the diagnostic is
+            masked.
+        """
+        if self.threshold_units is not None:
+            cube.convert_units(self.threshold_units)
+        data = np.ma.getdata(cube.data)
+        # Comparisons and rescaling are made at the precision of the data, as
+        # for a single threshold value.
+        dtype = data.dtype if np.issubdtype(data.dtype, np.floating) else np.float64
+        thresholds = np.array(self.thresholds[index], dtype=np.float64)
+        bounds = np.array(self.fuzzy_bounds[index], dtype=np.float64).reshape(-1, 2)
+        lower_width = thresholds - bounds[:, 0]
+        upper_width = bounds[:, 1] - thresholds
+        less_than = "less_than" in self.comparison_operator.spp_string
+        leading = (-1,) + (1,) * data.ndim
+
+        truth_values = np.empty((len(thresholds),) + data.shape, dtype=FLOAT_DTYPE)
+        sharp = bounds[:, 0] == bounds[:, 1]
+        if sharp.any():
+            values = thresholds[sharp].astype(dtype)
+            order = np.argsort(values, kind="stable")
+            ranks = np.empty_like(order)
+            ranks[order] = np.arange(order.size)
+            # The number of thresholds below (or not above) each value
+            side = (
+                "left"
+                if self.comparison_operator.spp_string
+                in ("greater_than", "less_than_or_equal_to")
+                else "right"
+            )
+            counts = np.searchsorted(values[order], data, side=side)
+            if less_than:
+                truth_values[sharp] = ranks.reshape(leading) >= counts
+            else:
+                truth_values[sharp] = ranks.reshape(leading) < counts
+
+        # Rescaling over a zero range is an error, which is raised as for a
+        # single threshold value.
+        vectorised = ~sharp & (lower_width > 0) & (upper_width > 0)
+        for ithreshold in np.flatnonzero(~sharp & ~vectorised):
+            truth_values[ithreshold] = self._calculate_truth_value(
+                cube,
+                self.thresholds[index][ithreshold],
+                self.fuzzy_bounds[index][ithreshold],
+            )
+        if vectorised.any():
+            threshold = thresholds[vectorised].astype(dtype).reshape(leading)
+            lower = bounds[vectorised, 0].astype(dtype).reshape(leading)
+            lower_width = lower_width[vectorised].astype(dtype).reshape(leading)
+            upper_width = upper_width[vectorised].astype(dtype).reshape(leading)
+            # scale exceedance probabilities linearly between 0/1 at the
+            # min/max fuzzy bounds and 0.5 at the threshold value
+            fuzzy = np.where(
+                data < threshold,
+                np.clip((data - lower) * 0.5 / lower_width, 0.0, 0.5),
+                np.clip((data - threshold) * 0.5 / upper_width + 0.5, 0.5, 1.0),
+            )
+            truth_values[vectorised] = 1.0 - fuzzy if less_than else fuzzy
+
+        if np.ma.is_masked(cube.data):
+            truth_values = np.ma.masked_array(
+                truth_values,
+                mask=np.broadcast_to(cube.data.mask, truth_values.shape),
+            )
+        return truth_values
+
     def _vicinity_processing(
         self,
         thresholded_cube: Cube,
@@ -474,7 +562,7 @@ class Threshold(PostProcessingPlugin):
         unmasked: np.ndarray,
         landmask: np.ndarray,
         grid_point_radii: List[int],
-        index: int,
+        index: slice,
     ):
         """
         Apply max in vicinity processing to the thresholded values. The
@@ -486,7 +574,8 @@ class Threshold(PostProcessingPlugin):
                 The cube into which the resulting values are added.
             truth_value:
                 An array of thresholded values prior to the application of
-                vicinity processing.
+                vicinity processing, with a leading dimension for each
+                threshold.
             unmasked:
                 Array identifying unmasked data points that should be updated.
             landmask:
@@ -494,25 +583,15 @@ class Threshold(PostProcessingPlugin):
                 differentiates between land and sea points to allow the
                 different surface types to be processed independently.
             grid_point_radii:
-                The vicinity radius to apply expressed as a number of grid
-                cells.
+                The vicinity radii to apply expressed as numbers of grid
+                cells, all of which are applied in one pass over the data.
             index:
-                Index corresponding to the threshold coordinate to identify
-                which array we are summing the contribution into.
+                Indices along the threshold coordinate identifying the arrays
+                we are summing the contributions into.
         """
-        for ivic, vicinity in enumerate(grid_point_radii):
-            if truth_value.ndim > 2:
-                maxes = np.zeros(truth_value.shape, dtype=FLOAT_DTYPE)
-                for yxindex in np.ndindex(*truth_value.shape[:-2]):
-                    slice_max = maximum_within_vicinity(
-                        truth_value[yxindex + (slice(None), slice(None))],
-                        vicinity,
-                        landmask,
-                    )
-                    maxes[yxindex] = slice_max
-            else:
-                maxes = maximum_within_vicinity(truth_value, vicinity, landmask)
-            thresholded_cube.data[ivic][index][unmasked] += maxes[unmasked]
+        radii_maxes = maxima_within_vicinity(truth_value, grid_point_radii, landmask)
+        for ivic, maxes in enumerate(radii_maxes):
+            thresholded_cube.data[ivic][index][:, unmasked] += maxes[:, unmasked]
 
     def _create_threshold_cube(self, cube: Cube) -> Cube:
         """
@@ -565,6 +644,42 @@ class Threshold(PostProcessingPlugin):
         self._update_metadata(thresholded_cube)
         return thresholded_cube
 
+    def _collapse_batches(self, input_cube: Cube) -> Tuple[Optional[int], Iterable]:
+        """Split the input cube for collapsing. Where a single dimension is
+        collapsed without vicinity processing, slices along it are batched
+        as the memory budget allows, so that each batch is processed with
+        whole-array operations summing over the dimension.
+
+        Args:
+            input_cube:
+                Cube to be thresholded.
+
+        Returns:
+            - The dimension of each batch to sum over, or None if each item is
+              a single slice with the collapse coordinates removed.
+            - The batches or slices of the input cube.
+        """
+        collapse_dims = {
+            dim for crd in self.collapse_coord for dim in input_cube.coord_dims(crd)
+        }
+        if self.vicinity is None and len(collapse_dims) == 1:
+            (dim,) = collapse_dims
+            n_slices = input_cube.shape[dim]
+            # data, truth value and mask of each slice
+            slice_bytes = (input_cube.size // n_slices) * (
+                input_cube.dtype.itemsize + 9
+            )
+            size = batch_size(slice_bytes, n_slices)
+            if size > 1:
+                # Batches are generated in turn, so that with lazy data only
+                # one is realised at a time.
+                input_batches = (
+                    input_cube[(slice(None),) * dim + (batch,)]
+                    for batch in batches(n_slices, size)
+                )
+                return dim, input_batches
+        return None, input_cube.slices_over(self.collapse_coord)
+
     def process(self, input_cube: Cube, landmask: Cube = None) -> Cube:
         """Convert each point to a truth value based on provided threshold
         values. The truth value may or may not be fuzzy depending upon if
@@ -574,7 +689,11 @@ class Threshold(PostProcessingPlugin):
 
         Args:
             input_cube:
-                Cube to threshold. The code is dimension-agnostic.
+                Cube to threshold. The code is dimension-agnostic. If the
+                cube has lazy data and coordinates are collapsed, the data
+                are realised one slice (or batch of slices, as the memory
+                budget allows) at a time along the collapsed coordinates, so
+                that the whole input is never held in memory.
             landmask:
                 Cube containing a landmask. Used with vicinity processing
                 only.
@@ -619,7 +738,13 @@ class Threshold(PostProcessingPlugin):
             )
 
         if self.fill_masked is not None:
-            input_cube.data = np.ma.filled(input_cube.data, self.fill_masked)
+            if input_cube.has_lazy_data():
+                # Fill lazily, so that each slice is filled as it is realised.
+                input_cube.data = da.ma.filled(
+                    input_cube.lazy_data(), self.fill_masked
+                )
+            else:
+                input_cube.data = np.ma.filled(input_cube.data, self.fill_masked)
 
         if self.collapse_coord and "percentile" in self.collapse_coord:
             input_cube = RebadgePercentilesAsRealizations()(input_cube)
@@ -639,11 +764,12 @@ class Threshold(PostProcessingPlugin):
 
         # Slice over collapse coords if required and create an empty threshold
         # cube to store the resulting thresholded data.
+        sum_axis = None
         if self.collapse_coord is not None:
-            input_slices = input_cube.slices_over(self.collapse_coord)
             thresholded_cube = self._create_threshold_cube(
                 next(input_cube.slices_over(self.collapse_coord))
             )
+            sum_axis, input_slices = self._collapse_batches(input_cube)
         else:
             input_slices = [input_cube]
             thresholded_cube = self._create_threshold_cube(input_cube)
@@ -673,23 +799,36 @@ class Threshold(PostProcessingPlugin):
             # collapsing that coordinate) then contribution_total will include
             # this extra dimension and our denominator will be 1 at all unmasked
             # points.
-            contribution_total += unmasked
-
-            for index, (threshold, bounds) in enumerate(
-                zip(self.thresholds, self.fuzzy_bounds)
-            ):
-                truth_value = self._calculate_truth_value(cube, threshold, bounds)
+            if sum_axis is None:
+                contribution_total += unmasked
+            else:
+                contribution_total += unmasked.sum(axis=sum_axis)
+
+            # Compare with as many thresholds at once as the memory budget
+            # allows: truth values and temporaries for each threshold.
+            n_thresholds = len(self.thresholds)
+            size = batch_size(16 * cube.data.size, n_thresholds, n_thresholds)
+            for index in batches(n_thresholds, size):
+                truth_values = self._calculate_truth_values(cube, index)
                 if self.vicinity is not None:
                     self._vicinity_processing(
                         thresholded_cube,
-                        truth_value,
+                        truth_values,
                         unmasked,
                         landmask,
                         grid_point_radii,
                         index,
                     )
+                elif sum_axis is not None:
+                    thresholded_cube.data[index] += np.where(
+                        unmasked, truth_values, 0
+                    ).sum(axis=sum_axis + 1)
                 else:
-                    thresholded_cube.data[index][unmasked] += truth_value[unmasked]
+                    thresholded_cube.data[index][:, unmasked] += truth_values[
+                        :, unmasked
+                    ]
+            # Release this slice before the next is realised.
+            del cube, truth_values
 
         # Any x-y position for which there are no valid contributions must be
         # a masked point in every realization, so we can use this array to
@@ -697,11 +836,14 @@ class Threshold(PostProcessingPlugin):
         valid = contribution_total.astype(bool)
 
         # Slice over the array to avoid ballooning the memory required for the
-        # denominators through broadcasting.
+        # denominators through broadcasting, with as many thresholds at once
+        # as the memory budget allows.
         enforce_coordinate_ordering(thresholded_cube, self.threshold_coord_name)
-        for i, dslice in enumerate(thresholded_cube.data):
-            result = np.divide(dslice[valid], contribution_total[valid])
-            thresholded_cube.data[i, valid] = result
+        n_thresholds = thresholded_cube.shape[0]
+        size = batch_size(16 * np.count_nonzero(valid), n_thresholds)
+        for batch in batches(n_thresholds, size):
+            dslice = thresholded_cube.data[batch]
+            dslice[:, valid] = np.divide(dslice[:, valid], contribution_total[valid])
 
         if not valid.all():
             thresholded_cube.data = np.ma.masked_array(
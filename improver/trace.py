@@ -0,0 +1,253 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Module containing plugin call tracing utilities.
+
+When a tracer is active, every call of an IMPROVER plugin, including calls
+nested within other plugins, records its wall time, CPU time, increase in
+peak resident memory and the shapes and data types of its input and output
+cubes. The trace is written in the Chrome trace event format, which can be
+viewed in chrome://tracing or https://ui.perfetto.dev, and summarised per
+plugin class.
+"""
+
+import atexit
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+try:
+    from resource import RUSAGE_SELF, getrusage
+except ImportError:
+    # resource is not available on Windows, where memory is not recorded
+    RUSAGE_SELF = None
+
+    def getrusage(who):
+        return None
+
+
+# The active PluginStack, if any, through which BasePlugin.__call__ calls
+# plugins
+ACTIVE_TRACER = None
+
+# Factor to convert ru_maxrss to MiB, which is in KiB on linux and B on macOS
+_MAXRSS_TO_MIB = 1 / 1024 if sys.platform == "linux" else 1 / 1048576
+
+
+def _max_rss() -> int:
+    """Peak resident memory of the process so far, or 0 if unavailable."""
+    usage = getrusage(RUSAGE_SELF)
+    return 0 if usage is None else usage.ru_maxrss
+
+
+def _describe(obj: Any) -> Any:
+    """Describe the shape and data type of cube-like objects, recursing one
+    level into lists and tuples such as cube lists."""
+    if hasattr(obj, "shape") and hasattr(obj, "dtype"):
+        name = getattr(obj, "name", None)
+        name = name() if callable(name) else type(obj).__name__
+        return f"{name} {tuple(obj.shape)} {obj.dtype}"
+    if isinstance(obj, (list, tuple)):
+        return [_describe(item) for item in obj if hasattr(item, "shape")]
+    return None
+
+
+class PluginStack:
+    """Keep track of the IMPROVER plugins currently running in each thread."""
+
+    def __init__(self) -> None:
+        """Initialise with no running plugins."""
+        self._stacks: Dict[int, List[str]] = {}
+
+    def call(self, plugin: Any, method: Callable, *args, **kwargs) -> Any:
+        """Call a plugin method, recording the plugin as running for the
+        duration of the call.
+
+        Args:
+            plugin:
+                The plugin instance.
+            method:
+                The bound method to call.
+            *args:
+                Positional arguments for the method.
+            **kwargs:
+                Keyword arguments for the method.
+
+        Returns:
+            The result of the method.
+        """
+        stack = self._stacks.setdefault(threading.get_ident(), [])
+        stack.append(type(plugin).__name__)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stack.pop()
+
+    def running(self) -> str:
+        """Describe the plugins currently running, with nested plugins
+        separated by ">" and those in different threads by ";".
+
+        Returns:
+            Description of the running plugins, empty if there are none.
+        """
+        return "; ".join(
+            " > ".join(stack) for stack in list(self._stacks.values()) if stack
+        )
+
+
+class PluginTracer(PluginStack):
+    """Record the calls of IMPROVER plugins as Chrome trace events."""
+
+    def __init__(self) -> None:
+        """Initialise an empty trace."""
+        super().__init__()
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def call(self, plugin: Any, method: Callable, *args, **kwargs) -> Any:
+        """Call a plugin method, recording the call.
+
+        Args:
+            plugin:
+                The plugin instance.
+            method:
+                The bound method to call.
+            *args:
+                Positional arguments for the method.
+            **kwargs:
+                Keyword arguments for the method.
+
+        Returns:
+            The result of the method.
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        # time spent in nested plugin calls, for the self time of this call
+        stack.append(0.0)
+        rss_start = _max_rss()
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        try:
+            result = super().call(plugin, method, *args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            cpu = time.process_time() - cpu_start
+            rss_delta = _max_rss() - rss_start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += end - start
+        inputs = [_describe(arg) for arg in args] + [
+            _describe(arg) for arg in kwargs.values()
+        ]
+        event = {
+            "name": type(plugin).__name__,
+            "cat": type(plugin).__module__,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": 0,
+            "tid": threading.get_ident(),
+            "args": {
+                "self_s": end - start - nested,
+                "cpu_s": cpu,
+                "peak_rss_delta_mib": rss_delta * _MAXRSS_TO_MIB,
+                "inputs": [item for item in inputs if item],
+                "output": _describe(result),
+            },
+        }
+        with self._lock:
+            self.events.append(event)
+        return result
+
+    def write(self, filename: str) -> None:
+        """Write the trace in the Chrome trace event JSON format.
+
+        Args:
+            filename:
+                File path to write the trace to.
+        """
+        with open(filename, "w") as trace_file:
+            json.dump(
+                {"traceEvents": self.events, "displayTimeUnit": "ms"}, trace_file
+            )
+
+    def summary(self) -> str:
+        """Summarise the trace by plugin class, ordered by decreasing time
+        spent in each plugin excluding nested plugin calls.
+
+        Returns:
+            Table of the number of calls, total and self wall time, CPU time
+            and largest increase in peak resident memory for each plugin.
+        """
+        totals = defaultdict(lambda: [0, 0.0, 0.0, 0.0, 0.0])
+        for event in self.events:
+            row = totals[event["name"]]
+            row[0] += 1
+            row[1] += event["dur"] * 1e-6
+            row[2] += event["args"]["self_s"]
+            row[3] += event["args"]["cpu_s"]
+            row[4] = max(row[4], event["args"]["peak_rss_delta_mib"])
+        header = (
+            f"{'plugin':<40} {'calls':>6} {'total s':>10} {'self s':>10} "
+            f"{'cpu s':>10} {'rss MiB':>10}"
+        )
+        lines = [header]
+        for name, row in sorted(totals.items(), key=lambda item: -item[1][2]):
+            lines.append(
+                f"{name:<40} {row[0]:>6} {row[1]:>10.3f} {row[2]:>10.3f} "
+                f"{row[3]:>10.3f} {row[4]:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+def trace_start() -> PluginTracer:
+    """Start and return a new active plugin tracer.
+
+    Returns:
+        Active PluginTracer instance.
+    """
+    global ACTIVE_TRACER
+    ACTIVE_TRACER = PluginTracer()
+    return ACTIVE_TRACER
+
+
+def trace_stop(
+    tracer: PluginTracer,
+    dump_filename: Optional[str] = None,
+    stream: Optional[TextIO] = None,
+) -> None:
+    """Stop a plugin tracer, write its trace and print its summary.
+
+    Args:
+        tracer:
+            Active tracer instance.
+        dump_filename:
+            File path to write the Chrome trace to.
+        stream:
+            Stream to print the summary to. Defaults to stderr.
+    """
+    global ACTIVE_TRACER
+    if ACTIVE_TRACER is tracer:
+        ACTIVE_TRACER = None
+    if dump_filename is not None:
+        tracer.write(dump_filename)
+    print(tracer.summary(), file=stream or sys.stderr)
+
+
+def trace_hook_enable(dump_filename: Optional[str] = None) -> None:
+    """Start tracing plugin calls and register a hook to write the trace
+    and print its summary at exit.
+
+    Args:
+        dump_filename:
+            File path to write the Chrome trace to at exit.
+    """
+    tracer = trace_start()
+    atexit.register(trace_stop, tracer, dump_filename=dump_filename)
@@ -0,0 +1,216 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""On-disk cache for arrays derived from static ancillaries.
+
+Plugins that derive arrays from a grid, such as the latitudes and longitudes
+of a projected grid or the nodes of a KD-tree, can opt in to caching them
+with :func:`cached_arrays`. Entries are keyed on a hash of the grid
+(see :func:`improver.metadata.utilities.create_coordinate_hash`) and the
+parameters of the calculation, and stored as .npy files which are memory
+mapped when read.
+
+The cache is enabled by setting the environment variable
+IMPROVER_ANCILLARY_CACHE_DIR to a directory, which may be shared between
+processes. The least recently used entries are removed once the cache
+exceeds IMPROVER_ANCILLARY_CACHE_SIZE bytes (default 4 GiB).
+"""
+
+import hashlib
+import os
+import pathlib
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+
+import numpy as np
+from iris.cube import Cube
+from numpy import ndarray
+
+from improver.metadata.utilities import create_coordinate_hash, generate_hash
+
+CACHE_DIR_ENV = "IMPROVER_ANCILLARY_CACHE_DIR"
+CACHE_SIZE_ENV = "IMPROVER_ANCILLARY_CACHE_SIZE"
+DEFAULT_CACHE_SIZE = 4 * 1024**3
+
+
+def _hashable(part: Any) -> Any:
+    """Convert part of a cache key to a value with a reproducible string
+    representation. Cubes are represented by the hash of their grid and
+    arrays by a hash of their contents."""
+    if isinstance(part, Cube):
+        return create_coordinate_hash(part)
+    if isinstance(part, ndarray):
+        data = np.ma.getdata(part)
+        digest = hashlib.sha256(np.ascontiguousarray(data).view(np.uint8))
+        if np.ma.is_masked(part):
+            digest.update(np.ma.getmaskarray(part).tobytes())
+        return (part.shape, str(part.dtype), digest.hexdigest())
+    if isinstance(part, (list, tuple)):
+        return [_hashable(item) for item in part]
+    return part
+
+
+def cache_key(*parts: Any) -> str:
+    """Create a cache key.
+
+    Args:
+        parts:
+            Values which identify the cached arrays, such as the name of the
+            calculation, the cube whose grid it is derived from and its
+            parameters. Cubes contribute only their grid, so any data the
+            calculation uses should be included as an array.
+
+    Returns:
+        A hexadecimal hash of the parts.
+    """
+    return generate_hash([_hashable(part) for part in parts])
+
+
+class AncillaryCache:
+    """Directory of cached arrays, with least recently used eviction."""
+
+    def __init__(
+        self, directory: Union[str, pathlib.Path], max_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        """Initialise the cache, creating the directory if required.
+
+        Args:
+            directory:
+                Directory in which to store cached arrays.
+            max_size:
+                Size in bytes above which the least recently used entries are
+                removed.
+        """
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    def __repr__(self) -> str:
+        return f"<AncillaryCache: {self.directory}, max_size: {self.max_size}>"
+
+    def get(self, key: str) -> Optional[Dict[str, ndarray]]:
+        """Read the arrays stored for a key, marking them as recently used.
+
+        Args:
+            key:
+                The cache key.
+
+        Returns:
+            Read-only memory mapped arrays by name, or None if the key is not
+            in the cache.
+        """
+        entry = self.directory / key
+        try:
+            arrays = {
+                path.stem: np.load(path, mmap_mode="r", allow_pickle=False)
+                for path in entry.glob("*.npy")
+            }
+            os.utime(entry)
+        except (FileNotFoundError, ValueError):
+            # missing, or evicted or replaced while being read
+            return None
+        return arrays or None
+
+    def put(self, key: str, arrays: Dict[str, ndarray]) -> Dict[str, ndarray]:
+        """Store arrays for a key and evict old entries if the cache is full.
+
+        The arrays are written to a temporary directory which is then moved
+        into place, so concurrent readers never see a partial entry.
+
+        Args:
+            key:
+                The cache key.
+            arrays:
+                Arrays to store by name. Masked arrays are not supported.
+
+        Returns:
+            The stored arrays, memory mapped from the cache if they remain in
+            it after eviction.
+        """
+        tmp = pathlib.Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.directory))
+        try:
+            for name, array in arrays.items():
+                np.save(tmp / f"{name}.npy", np.asarray(array), allow_pickle=False)
+            os.rename(tmp, self.directory / key)
+        except OSError:
+            # another process has stored the same entry
+            pass
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+        stored = self.get(key)
+        return arrays if stored is None else stored
+
+    def size(self) -> int:
+        """Total size in bytes of the cached arrays."""
+        return sum(path.stat().st_size for path in self.directory.glob("*/*.npy"))
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache is no larger
+        than its maximum size."""
+        entries = []
+        for entry in self.directory.iterdir():
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            try:
+                size = sum(path.stat().st_size for path in entry.glob("*.npy"))
+                entries.append((entry.stat().st_mtime, size, entry))
+            except FileNotFoundError:
+                continue
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+
+def get_ancillary_cache() -> Optional[AncillaryCache]:
+    """Return the cache configured by the environment, if any.
+
+    Returns:
+        The cache in the directory given by IMPROVER_ANCILLARY_CACHE_DIR, or
+        None if the variable is not set.
+    """
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if not directory:
+        return None
+    max_size = int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE))
+    return AncillaryCache(directory, max_size)
+
+
+def cached_arrays(
+    name: str,
+    key_parts: Sequence[Any],
+    calculate: Callable[[], Dict[str, ndarray]],
+    cache: Optional[AncillaryCache] = None,
+) -> Dict[str, ndarray]:
+    """Return arrays from the cache, calculating and storing them if absent.
+
+    Args:
+        name:
+            Name of the calculation, included in the cache key.
+        key_parts:
+            Cubes, arrays and parameters which determine the result of the
+            calculation. See :func:`cache_key`.
+        calculate:
+            Function returning the arrays by name, called if they are not
+            cached.
+        cache:
+            Cache to use. Defaults to that configured by the environment, and
+            if there is none the arrays are always calculated.
+
+    Returns:
+        The arrays by name. Arrays read from the cache are read-only.
+    """
+    if cache is None:
+        cache = get_ancillary_cache()
+    if cache is None:
+        return calculate()
+    key = cache_key(name, *key_parts)
+    arrays = cache.get(key)
+    if arrays is None:
+        arrays = cache.put(key, calculate())
+    return arrays
@@ -0,0 +1,218 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Run one improver command over many input files in a pool of processes.
+
+Each input file is substituted for the "{input}" placeholder in the command
+arguments, or passed as the first argument if there is no placeholder, and
+the result is written to a file named from an output template. The command
+module is imported once, before the worker processes are started, and any
+shared ancillary files are loaded once and passed to every item in memory
+rather than being read from disk for each item.
+
+A failure in one item is reported along with its run time and does not stop
+the remaining items from being processed.
+"""
+
+import glob
+import pathlib
+import time
+import traceback
+from multiprocessing import Pool
+from typing import List, NamedTuple, Optional, Sequence
+
+INPUT_PLACEHOLDER = "{input}"
+
+# Shared ancillary cubes keyed by path, loaded in the parent process before
+# the pool is started so that forked workers inherit them.
+_SHARED_CUBES = {}
+
+
+class BatchItemResult(NamedTuple):
+    """Outcome of running the command for a single input file."""
+
+    input_path: str
+    output_path: str
+    elapsed: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the command completed without error."""
+        return self.error is None
+
+    def __str__(self) -> str:
+        status = "OK" if self.ok else "FAILED"
+        msg = f"{status} {self.elapsed:.3f}s {self.input_path} -> {self.output_path}"
+        if not self.ok:
+            msg += f": {self.error}"
+        return msg
+
+
+def output_path_from_template(template: str, input_path: str) -> str:
+    """Create the output path for an input file from a template.
+
+    Args:
+        template:
+            Output path template, which may contain the fields {name}
+            (input file name), {stem} (input file name without its final
+            extension) and {parent} (directory containing the input file).
+        input_path:
+            Path to the input file.
+
+    Returns:
+        The output path.
+    """
+    path = pathlib.Path(input_path)
+    return template.format(name=path.name, stem=path.stem, parent=path.parent)
+
+
+def _load_shared(shared_paths: Sequence[str]) -> None:
+    """Load shared ancillary cubes which have not already been loaded."""
+    from improver.utilities.load import load_cube
+
+    for path in shared_paths:
+        if path not in _SHARED_CUBES:
+            _SHARED_CUBES[path] = load_cube(path)
+
+
+def _prepare(command: str, shared_paths: Sequence[str]) -> None:
+    """Import the command module and load the shared ancillaries, which are
+    already present in workers forked from a process that has done so."""
+    from improver.cli import SUBCOMMANDS_TABLE
+
+    SUBCOMMANDS_TABLE[command.replace("-", "_")].load()
+    _load_shared(shared_paths)
+
+
+def _init_worker(command: str, shared_paths: Sequence[str]) -> None:
+    """Prepare a worker to run the command, leaving interrupts to the
+    parent process."""
+    import signal
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _prepare(command, shared_paths)
+
+
+def _item_argv(args: Sequence[str], input_path: str) -> List:
+    """Substitute the input path and shared ancillary cubes into the command
+    arguments."""
+    if INPUT_PLACEHOLDER in args:
+        argv = [input_path if arg == INPUT_PLACEHOLDER else arg for arg in args]
+    else:
+        argv = [input_path, *args]
+    return [_SHARED_CUBES.get(arg, arg) for arg in argv]
+
+
+def run_item(
+    command: str, args: Sequence[str], input_path: str, output_path: str
+) -> BatchItemResult:
+    """Run the command for one input file, writing the result to file.
+
+    Args:
+        command:
+            Name of the improver command.
+        args:
+            Command arguments, in which "{input}" is replaced by the input path.
+        input_path:
+            Path to the input file.
+        output_path:
+            Path to write the result to.
+
+    Returns:
+        The outcome of the command, including the error message if it failed.
+    """
+    from improver.cli import SUBCOMMANDS_DISPATCHER, execute_command
+    from improver.utilities.save import wait_for_saves
+
+    argv = _item_argv(args, input_path)
+    error = None
+    start = time.perf_counter()
+    try:
+        execute_command(
+            SUBCOMMANDS_DISPATCHER,
+            "improver",
+            command,
+            *argv,
+            "--output",
+            output_path,
+        )
+        # with background saves the item is complete once written to disk
+        wait_for_saves()
+    except Exception:
+        error = traceback.format_exc(limit=0).strip().splitlines()[-1]
+    return BatchItemResult(input_path, output_path, time.perf_counter() - start, error)
+
+
+def run_batch(
+    command: str,
+    args: Sequence[str],
+    inputs_glob: str,
+    output_template: str,
+    workers: Optional[int] = None,
+    shared: Optional[Sequence[str]] = None,
+    verbose: bool = False,
+) -> List[BatchItemResult]:
+    """Run a command for each input file matching a glob pattern.
+
+    Args:
+        command:
+            Name of the improver command.
+        args:
+            Command arguments, in which "{input}" is replaced by each input
+            path. If there is no "{input}" argument, the input path is passed
+            as the first argument.
+        inputs_glob:
+            Glob pattern matching the input files.
+        output_template:
+            Template for the output path of each input, see
+            :func:`output_path_from_template`.
+        workers:
+            Number of worker processes. Defaults to the number of CPUs.
+        shared:
+            Paths to ancillary files which are loaded once and passed in
+            memory wherever they appear in the arguments. Commands must not
+            modify these cubes in place.
+        verbose:
+            Print the outcome of each item, in the order of the inputs.
+
+    Returns:
+        The outcome of each item, in the sorted order of the input paths.
+
+    Raises:
+        ValueError: If no files match the glob pattern or the template gives
+            the same output path for more than one input.
+    """
+    input_paths = sorted(glob.glob(inputs_glob))
+    if not input_paths:
+        raise ValueError(f"No input files match '{inputs_glob}'.")
+    output_paths = [
+        output_path_from_template(output_template, path) for path in input_paths
+    ]
+    if len(set(output_paths)) != len(output_paths):
+        raise ValueError(
+            f"Output template '{output_template}' does not give a different "
+            "output path for each input."
+        )
+    shared = list(shared or [])
+    args = list(args)
+
+    # import the command and load the ancillaries before starting the
+    # workers, so that forked workers inherit them
+    _prepare(command, shared)
+
+    results = []
+    with Pool(
+        processes=workers, initializer=_init_worker, initargs=(command, shared)
+    ) as pool:
+        jobs = [
+            pool.apply_async(run_item, (command, args, input_path, output_path))
+            for input_path, output_path in zip(input_paths, output_paths)
+        ]
+        for job in jobs:
+            result = job.get()
+            if verbose:
+                print(result, flush=True)
+            results.append(result)
+    return results
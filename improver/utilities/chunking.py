@@ -0,0 +1,216 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Out-of-core execution of plugins over chunks of a leading dimension.
+
+Plugins which process each slice along a leading dimension, such as each
+realization or threshold, independently of the others declare this with a
+``chunk_coords(cube)`` method returning the names of those coordinates, in
+order of preference. :class:`ChunkedExecution` runs such a plugin on the
+first chunk of a lazy cube straight away, to obtain the metadata of the
+result, and defers the other chunks as lazy arrays. Saving the result with
+:func:`improver.utilities.save.save_netcdf` then computes and writes it
+chunk by chunk, so the whole array is never held in memory.
+
+Setting the environment variable IMPROVER_CHUNKED_EXECUTION to a number of
+points per chunk runs every plugin which declares its chunk coordinates in
+this way when it is called with a cube with lazy data, such as one from
+:func:`improver.utilities.load.load_cube`.
+"""
+
+import copy
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
+
+import dask
+import dask.array as da
+import numpy as np
+from iris.cube import Cube, CubeList
+
+from improver import BasePlugin
+from improver.metadata.probabilistic import find_threshold_coordinate, is_probability
+
+CHUNKED_EXECUTION_ENV = "IMPROVER_CHUNKED_EXECUTION"
+
+_LOCAL = threading.local()
+
+
+def chunked_execution_size() -> int:
+    """Number of points per chunk requested by the IMPROVER_CHUNKED_EXECUTION
+    environment variable, or 0 if plugins should not be run in chunks."""
+    return int(os.environ.get(CHUNKED_EXECUTION_ENV) or 0)
+
+
+def leading_coord_names(cube: Cube) -> List[str]:
+    """Names of the realization, percentile, threshold and time coordinates
+    of a cube, for plugins which process each of their slices independently
+    to return from chunk_coords.
+
+    Args:
+        cube:
+            Cube to be processed.
+
+    Returns:
+        Names of the coordinates, in order of preference for chunking.
+    """
+    names = ["realization", "percentile"]
+    if is_probability(cube):
+        names.append(find_threshold_coordinate(cube).name())
+    return names + ["time"]
+
+
+def chunking_active() -> bool:
+    """Whether this thread is already running a plugin on a chunk, in which
+    case nested plugin calls are not themselves chunked."""
+    return getattr(_LOCAL, "active", False)
+
+
+@contextmanager
+def _unchunked() -> Iterator[None]:
+    """Run plugins called within the context normally."""
+    previous = chunking_active()
+    _LOCAL.active = True
+    try:
+        yield
+    finally:
+        _LOCAL.active = previous
+
+
+def _run_chunk(plugin: BasePlugin, chunk: Cube, args, kwargs) -> np.ndarray:
+    """Run a copy of the plugin on a chunk, so that chunks computed
+    concurrently do not share any state the plugin sets on itself."""
+    with _unchunked():
+        return copy.copy(plugin)(chunk, *args, **kwargs).data
+
+
+class ChunkedExecution(BasePlugin):
+    """Run a plugin lazily over chunks of a leading dimension of a cube."""
+
+    def __init__(self, plugin: BasePlugin, chunk_size: int = 1) -> None:
+        """
+        Args:
+            plugin:
+                Plugin with a chunk_coords method, which processes each slice
+                along those coordinates independently.
+            chunk_size:
+                Number of points along the chunked dimension in each chunk.
+
+        Raises:
+            ValueError: If the chunk size is not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive, not {chunk_size}")
+        self.plugin = plugin
+        self.chunk_size = chunk_size
+
+    def __repr__(self) -> str:
+        return f"<ChunkedExecution: {self.plugin}, chunk_size: {self.chunk_size}>"
+
+    def _chunk_dim(self, cube: Cube) -> Optional[int]:
+        """The dimension to chunk, being that of the first coordinate declared
+        by the plugin which is a dimension coordinate of the cube."""
+        for name in self.plugin.chunk_coords(cube):
+            if cube.coords(name, dim_coords=True):
+                return cube.coord_dims(name)[0]
+        return None
+
+    def process(self, cube: Cube, *args: Any, **kwargs: Any) -> Cube:
+        """Run the plugin over chunks of the cube.
+
+        Args:
+            cube:
+                The cube to process in chunks, which should have lazy data.
+            args:
+                Further positional arguments of the plugin, passed unchanged
+                with each chunk.
+            kwargs:
+                Keyword arguments of the plugin.
+
+        Returns:
+            The result of the plugin, with lazy data for all but the first
+            chunk. The arguments must not be modified until its data have
+            been computed.
+
+        Raises:
+            ValueError: If the result does not keep the chunked dimension, or
+                adds coordinates along it.
+        """
+        dim = self._chunk_dim(cube)
+        if dim is None or cube.shape[dim] <= self.chunk_size:
+            with _unchunked():
+                return self.plugin(cube, *args, **kwargs)
+
+        name = cube.coord(dimensions=dim, dim_coords=True).name()
+        index = [slice(None)] * cube.ndim
+        chunks = []
+        for start in range(0, cube.shape[dim], self.chunk_size):
+            index[dim] = slice(start, start + self.chunk_size)
+            chunks.append(cube[tuple(index)])
+
+        # compute the first chunk to obtain the metadata of the result
+        with _unchunked():
+            first = self.plugin(chunks[0], *args, **kwargs)
+        if not first.coords(name, dim_coords=True):
+            raise ValueError(
+                f"{type(self.plugin).__name__} does not keep the {name} "
+                "dimension, so cannot be run in chunks"
+            )
+        out_dim = first.coord_dims(name)[0]
+        empty = np.ma.empty if np.ma.isMaskedArray(first.data) else np.empty
+        meta = empty((0,) * first.ndim, dtype=first.dtype)
+
+        pieces = CubeList([first])
+        for chunk in chunks[1:]:
+            shape = list(first.shape)
+            shape[out_dim] = chunk.shape[dim]
+            data = da.from_delayed(
+                dask.delayed(_run_chunk)(self.plugin, chunk, args, kwargs),
+                shape=tuple(shape),
+                dtype=first.dtype,
+                meta=meta,
+            )
+            piece = first.copy(data=data)
+            for coord in first.coords(dimensions=out_dim):
+                if not chunk.coords(coord.name()):
+                    raise ValueError(
+                        f"{type(self.plugin).__name__} adds the {coord.name()} "
+                        f"coordinate along the {name} dimension, so cannot be "
+                        "run in chunks"
+                    )
+                source = chunk.coord(coord.name())
+                piece.replace_coord(
+                    coord.copy(points=source.points, bounds=source.bounds)
+                )
+            pieces.append(piece)
+        return pieces.concatenate_cube()
+
+
+def call_chunked(plugin: BasePlugin, *args: Any, **kwargs: Any) -> Any:
+    """Call a plugin, in chunks if its first argument is a lazy cube and
+    chunked execution is enabled by the environment.
+
+    Args:
+        plugin:
+            Plugin with a chunk_coords method.
+        args:
+            Positional arguments of the plugin.
+        kwargs:
+            Keyword arguments of the plugin.
+
+    Returns:
+        The result of the plugin.
+    """
+    chunk_size = chunked_execution_size()
+    if (
+        chunk_size
+        and args
+        and isinstance(args[0], Cube)
+        and args[0].has_lazy_data()
+        and not chunking_active()
+    ):
+        return ChunkedExecution(plugin, chunk_size)(*args, **kwargs)
+    with _unchunked():
+        return plugin(*args, **kwargs)
@@ -0,0 +1,265 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Server and client for running improver commands in warm worker processes.
+
+The server listens on a local UNIX socket and runs each received command in
+a bounded pool of worker processes which already have the improver CLI and
+its heavy dependencies imported. Workers are replaced after a given number
+of jobs to limit memory growth.
+
+Each request is a JSON object containing the command arguments (argv,
+excluding the program name) and the client's working directory. The response
+is a JSON object with the exit status and captured stdout and stderr.
+
+This module is deliberately light to import so that it can be used as the
+client without loading numpy, iris or the CLI dispatcher::
+
+    python -m improver.utilities.cli_server SOCKET_PATH threshold ...
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from multiprocessing import Pool
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# Modules imported before the worker pool is started, so that workers
+# inherit them rather than importing them for every command.
+PRELOAD_MODULES = ["improver.cli", "improver.utilities.load", "improver.utilities.save"]
+
+
+def run_command(argv: Sequence[str], cwd: Optional[str] = None) -> Tuple[int, str, str]:
+    """Run an improver command, capturing its output.
+
+    Args:
+        argv:
+            Command arguments, excluding the program name.
+        cwd:
+            Directory to run the command in, against which relative paths
+            in the arguments are resolved.
+
+    Returns:
+        - Exit status of the command.
+        - Captured standard output.
+        - Captured standard error.
+    """
+    from clize import run
+
+    from improver.cli import main
+
+    if cwd is not None:
+        os.chdir(cwd)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    status = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            run(main, args=["improver", *argv], out=stdout, err=stderr)
+        except SystemExit as err:
+            if err.code is None:
+                status = 0
+            elif isinstance(err.code, int):
+                status = err.code
+            else:
+                print(err.code, file=stderr)
+                status = 1
+        except Exception:
+            traceback.print_exc(file=stderr)
+            status = 1
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+def _init_worker() -> None:
+    """Restore default signal handling in worker processes.
+
+    Workers leave interrupts to the server and exit quietly when the pool
+    is terminated, rather than inheriting the server's handlers.
+    """
+    import signal
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    """Run a single request on the server's worker pool and reply."""
+
+    def handle(self):
+        data = self.rfile.read()
+        if not data:
+            # connection probe, e.g. checking whether the server is running
+            return
+        request = json.loads(data.decode("utf-8"))
+        status, out, err = self.server.pool.apply(
+            self.server.job, (request["argv"], request.get("cwd"))
+        )
+        response = {"status": status, "stdout": out, "stderr": err}
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+class CommandServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded UNIX socket server dispatching commands to a worker pool.
+
+    Each connection is handled in its own thread, which blocks until a
+    worker is free, so at most `workers` commands run at once and any
+    further requests queue.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: str,
+        workers: Optional[int] = None,
+        max_jobs_per_worker: Optional[int] = 100,
+        preload: Optional[List[str]] = None,
+        job: Callable = run_command,
+    ) -> None:
+        """Bind the socket, import the preloaded modules and start workers.
+
+        Args:
+            socket_path:
+                Path of the UNIX socket to listen on.
+            workers:
+                Number of worker processes. Defaults to the number of CPUs.
+            max_jobs_per_worker:
+                Number of jobs after which a worker is replaced by a fresh
+                process. None to keep workers for the life of the server.
+            preload:
+                Subcommands to import before starting workers, in addition
+                to the modules in PRELOAD_MODULES.
+            job:
+                Function run in the workers for each request, called with the
+                command arguments and working directory and returning the
+                exit status, stdout and stderr.
+        """
+        import importlib
+
+        for module_name in PRELOAD_MODULES:
+            importlib.import_module(module_name)
+        if preload:
+            from improver.cli import SUBCOMMANDS_TABLE
+
+            for name in preload:
+                SUBCOMMANDS_TABLE[name.replace("-", "_")].load()
+
+        self.job = job
+        self.pool = None
+        self._bound = False
+        super().__init__(socket_path, _CommandHandler)
+        self.pool = Pool(
+            processes=workers,
+            initializer=_init_worker,
+            maxtasksperchild=max_jobs_per_worker,
+        )
+
+    def server_bind(self) -> None:
+        """Bind the socket, replacing a stale socket file left by a server
+        which is no longer running."""
+        if os.path.exists(self.server_address):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(self.server_address)
+                except ConnectionRefusedError:
+                    os.unlink(self.server_address)
+        super().server_bind()
+        self._bound = True
+
+    def server_close(self) -> None:
+        """Close the socket, remove its file and stop the worker pool."""
+        super().server_close()
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+        if self._bound and os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def serve(socket_path: str, **kwargs) -> None:
+    """Run a command server until interrupted or terminated.
+
+    Args:
+        socket_path:
+            Path of the UNIX socket to listen on.
+        kwargs:
+            Passed to :class:`CommandServer`.
+    """
+    import signal
+
+    def _terminate(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _terminate)
+    server = CommandServer(socket_path, **kwargs)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def send_command(
+    socket_path: str, argv: Sequence[str], cwd: Optional[str] = None
+) -> Tuple[int, str, str]:
+    """Send a command to a running server and wait for it to complete.
+
+    Args:
+        socket_path:
+            Path of the server's UNIX socket.
+        argv:
+            Command arguments, excluding the program name.
+        cwd:
+            Directory to run the command in. Defaults to the current
+            working directory.
+
+    Returns:
+        - Exit status of the command.
+        - Captured standard output.
+        - Captured standard error.
+    """
+    request = {"argv": list(argv), "cwd": os.getcwd() if cwd is None else cwd}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    response = json.loads(b"".join(chunks).decode("utf-8"))
+    return response["status"], response["stdout"], response["stderr"]
+
+
+def client_main(argv: Optional[List[str]] = None) -> int:
+    """Send a command to a server, echo its output and return its status.
+
+    Args:
+        argv:
+            Socket path followed by the command arguments. Defaults to
+            sys.argv[1:].
+
+    Returns:
+        Exit status of the command.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        print("usage: cli_server SOCKET_PATH COMMAND [ARGS...]", file=sys.stderr)
+        return 2
+    status, out, err = send_command(argv[0], argv[1:])
+    sys.stdout.write(out)
+    sys.stderr.write(err)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(client_main())
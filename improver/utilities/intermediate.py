@@ -0,0 +1,107 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Uncompressed, memory-mappable format for intermediate results.
+
+Passing cubes between improver processes via netCDF files spends much of
+its time compressing and decompressing data. Outputs with a ".imp"
+extension are instead written as a directory containing the data of each
+cube as an uncompressed .npy file, alongside a pickle of the cube metadata.
+On loading, the data are memory mapped and wrapped as lazy arrays, so only
+the parts of the data which are used are read from disk.
+
+The format is intended for scratch files on fast local disk within a
+single workflow, not for long-term storage or exchange: the metadata are
+pickled, so can only be read with compatible versions of iris and should
+only be loaded from trusted locations.
+"""
+
+import os
+import pathlib
+import pickle
+import shutil
+import tempfile
+from typing import Union
+
+import dask.array as da
+import numpy as np
+from iris.cube import Cube, CubeList
+
+INTERMEDIATE_SUFFIX = ".imp"
+_METADATA_NAME = "metadata.pickle"
+
+
+def is_intermediate(filepath: Union[str, pathlib.Path]) -> bool:
+    """Whether a path names a file in the intermediate format."""
+    return str(filepath).endswith(INTERMEDIATE_SUFFIX)
+
+
+def save_intermediate(
+    cubelist: Union[Cube, CubeList], filepath: Union[str, pathlib.Path]
+) -> None:
+    """Save cubes in the intermediate format, replacing any existing file.
+
+    The data are saved without compression or loss of precision. The file
+    is written to a temporary directory which is then renamed, so readers
+    never see a partial file.
+
+    Args:
+        cubelist:
+            Cube or list of cubes to be saved.
+        filepath:
+            Path of the directory to save to, ending in ".imp".
+    """
+    if isinstance(cubelist, Cube):
+        cubelist = CubeList([cubelist])
+    filepath = pathlib.Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp = pathlib.Path(tempfile.mkdtemp(prefix=".tmp-", dir=filepath.parent))
+    try:
+        skeletons = []
+        for index, cube in enumerate(cubelist):
+            data = cube.data
+            np.save(tmp / f"{index}.npy", np.ma.getdata(data), allow_pickle=False)
+            if np.ma.isMaskedArray(data):
+                np.save(
+                    tmp / f"{index}.mask.npy",
+                    np.ma.getmaskarray(data),
+                    allow_pickle=False,
+                )
+            # store the metadata with placeholder data, which pickles small
+            skeletons.append(
+                cube.copy(data=da.zeros(cube.shape, dtype=cube.dtype, chunks=-1))
+            )
+        with open(tmp / _METADATA_NAME, "wb") as metadata_file:
+            pickle.dump(skeletons, metadata_file, protocol=pickle.HIGHEST_PROTOCOL)
+        if filepath.exists():
+            shutil.rmtree(filepath)
+        os.rename(tmp, filepath)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def load_intermediate(filepath: Union[str, pathlib.Path]) -> CubeList:
+    """Load cubes saved in the intermediate format.
+
+    Args:
+        filepath:
+            Path of the directory to load, ending in ".imp".
+
+    Returns:
+        The cubes, with lazy data memory mapped from the file. Realised data
+        are copy-on-write, so may be modified without changing the file.
+    """
+    filepath = pathlib.Path(filepath)
+    with open(filepath / _METADATA_NAME, "rb") as metadata_file:
+        cubes = pickle.load(metadata_file)
+    for index, cube in enumerate(cubes):
+        data = np.load(filepath / f"{index}.npy", mmap_mode="c")
+        # a single chunk, so realising the data gives the memory map itself
+        data = da.from_array(data, chunks=-1)
+        mask_path = filepath / f"{index}.mask.npy"
+        if mask_path.exists():
+            mask = da.from_array(np.load(mask_path, mmap_mode="c"), chunks=-1)
+            data = da.ma.masked_array(data, mask=mask)
+        cube.data = data
+    return CubeList(cubes)
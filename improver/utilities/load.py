@@ -4,6 +4,10 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Module for loading cubes."""
 
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union
 
 import iris
@@ -15,12 +19,85 @@ from improver.utilities.cube_manipulation import (
     enforce_coordinate_ordering,
     strip_var_names,
 )
+from improver.utilities.intermediate import is_intermediate, load_intermediate
+
+# Environment variable giving the default number of threads used to load
+# lists of files
+LOAD_WORKERS_ENV = "IMPROVER_LOAD_WORKERS"
+
+# Maximum number of files for which the cubes parsed by iris are kept
+LOAD_CACHE_SIZE = 64
+
+# Legacy metadata prefix cube, which is discarded on load
+_NOT_PREFIX_CUBE = iris.Constraint(cube_func=lambda cube: cube.long_name != "prefixes")
+
+# Cubes parsed from each file, keyed by file identity and name constraint
+_LOAD_CACHE: "OrderedDict[tuple, CubeList]" = OrderedDict()
+_LOAD_CACHE_LOCK = threading.Lock()
+
+
+def clear_load_cache() -> None:
+    """Discard the cubes cached by previous loads."""
+    with _LOAD_CACHE_LOCK:
+        _LOAD_CACHE.clear()
+
+
+def _load_file(
+    filepath: str, constraints: Optional[Union[Constraint, str]]
+) -> CubeList:
+    """Load cubes from a single file or wildcard pattern, or from a file in
+    the intermediate format (see :mod:`improver.utilities.intermediate`).
+
+    Name constraints are passed to iris on their own so that it can skip
+    other netCDF variables before building cubes. The (lazy) cubes parsed
+    from a file with no constraint or a name constraint are cached, keyed on
+    the file's path, size and modification time, and copies returned if the
+    same file is loaded again. Other constraints are not cached, as iris
+    constraints cannot in general be compared.
+
+    Args:
+        filepath:
+            Path to, or wildcard pattern matching, the file(s) to load.
+        constraints:
+            Constraint to be applied when loading.
+
+    Returns:
+        Cubes loaded from the file(s), which the caller may modify.
+    """
+    if is_intermediate(filepath):
+        cubes = load_intermediate(filepath)
+        return cubes if constraints is None else cubes.extract(constraints)
+
+    cacheable = constraints is None or isinstance(constraints, str)
+    if not cacheable or not os.path.isfile(filepath):
+        return iris.load(filepath, constraints=constraints)
+
+    stat = os.stat(filepath)
+    key = (
+        os.path.abspath(filepath),
+        stat.st_ino,
+        stat.st_size,
+        stat.st_mtime_ns,
+        constraints,
+    )
+    with _LOAD_CACHE_LOCK:
+        cubes = _LOAD_CACHE.get(key)
+        if cubes is not None:
+            _LOAD_CACHE.move_to_end(key)
+    if cubes is None:
+        cubes = iris.load(filepath, constraints=constraints)
+        with _LOAD_CACHE_LOCK:
+            _LOAD_CACHE[key] = cubes
+            while len(_LOAD_CACHE) > LOAD_CACHE_SIZE:
+                _LOAD_CACHE.popitem(last=False)
+    return CubeList(cube.copy() for cube in cubes)
 
 
 def load_cubelist(
     filepath: Union[str, List[str]],
     constraints: Optional[Union[Constraint, str]] = None,
     no_lazy_load: bool = False,
+    workers: Optional[int] = None,
 ) -> CubeList:
     """Load cubes from filepath(s) into a cubelist. Strips off all
     var names except for "threshold"-type coordinates, where this is different
@@ -38,25 +115,33 @@ def load_cubelist(
             If True, bypass cube deferred (lazy) loading and load the whole
             cube into memory. This can increase performance at the cost of
             memory. If False (default) then lazy load.
+        workers:
+            Number of threads used to load a list of filepaths, which
+            overlaps reading and parsing the files. The cubes are returned
+            in the order of the filepaths. Defaults to the value of the
+            IMPROVER_LOAD_WORKERS environment variable, or 1 if it is unset.
 
     Returns:
         CubeList that has been created from the input filepath given the
         constraints provided.
     """
-    # Remove legacy metadata prefix cube if present
-    constraints = (
-        iris.Constraint(cube_func=lambda cube: cube.long_name != "prefixes")
-        & constraints
-    )
+    if workers is None:
+        workers = int(os.environ.get(LOAD_WORKERS_ENV, 1))
 
     # Load each file individually to avoid partial merging (not used
     # iris.load_raw() due to issues with time representation)
-    if isinstance(filepath, str):
-        cubes = iris.load(filepath, constraints=constraints)
+    filepaths = [filepath] if isinstance(filepath, str) else list(filepath)
+    if workers > 1 and len(filepaths) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(filepaths))) as pool:
+            loaded = list(
+                pool.map(lambda item: _load_file(item, constraints), filepaths)
+            )
     else:
-        cubes = iris.cube.CubeList([])
-        for item in filepath:
-            cubes.extend(iris.load(item, constraints=constraints))
+        loaded = [_load_file(item, constraints) for item in filepaths]
+    cubes = CubeList([cube for item_cubes in loaded for cube in item_cubes])
+
+    # Remove legacy metadata prefix cube if present
+    cubes = cubes.extract(_NOT_PREFIX_CUBE)
 
     if not cubes:
         message = "No cubes found using constraints {}".format(constraints)
@@ -88,6 +173,7 @@ def load_cube(
     filepath: Union[str, List[str]],
     constraints: Optional[Union[Constraint, str]] = None,
     no_lazy_load: bool = False,
+    workers: Optional[int] = None,
 ) -> Cube:
     """Load the filepath provided using Iris into a cube. Strips off all
     var names except for "threshold"-type coordinates, where this is different
@@ -106,12 +192,15 @@ def load_cube(
             If True, bypass cube deferred (lazy) loading and load the whole
             cube into memory. This can increase performance at the cost of
             memory. If False (default) then lazy load.
+        workers:
+            Number of threads used to load a list of filepaths. See
+            :func:`load_cubelist`.
 
     Returns:
         Cube that has been loaded from the input filepath given the
         constraints provided.
     """
-    cubes = load_cubelist(filepath, constraints, no_lazy_load)
+    cubes = load_cubelist(filepath, constraints, no_lazy_load, workers=workers)
     # Merge loaded cubes
     if len(cubes) == 1:
         cube = cubes[0]
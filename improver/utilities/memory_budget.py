@@ -0,0 +1,84 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Process-wide memory budget for plugins which process data in batches.
+
+Plugins which loop over slices of their data to limit their memory use
+consult the budget to choose how many slices to process at once, so that
+fewer, larger vectorised operations are used when memory allows. The
+budget is set with the IMPROVER_MAX_MEMORY environment variable, or the
+--max-memory option of the improver command, as a number of bytes with an
+optional K, M, G or T suffix, e.g. "4G". If it is not set, plugins keep
+their default batch sizes.
+"""
+
+import os
+import re
+from typing import Iterator, Optional
+
+MAX_MEMORY_ENV = "IMPROVER_MAX_MEMORY"
+
+_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_memory_size(size: str) -> int:
+    """Convert a memory size such as "512M" or "4GiB" to a number of bytes.
+
+    Args:
+        size:
+            Number of bytes, with an optional K, M, G or T suffix (powers of
+            1024), optionally followed by B or iB.
+
+    Returns:
+        The number of bytes.
+
+    Raises:
+        ValueError: If the size cannot be parsed.
+    """
+    match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([KMGT]?)(?:i?B)?\s*", size, re.I)
+    if match is None:
+        raise ValueError(f"Invalid memory size '{size}'")
+    return int(float(match[1]) * _UNITS[match[2].upper()])
+
+
+def memory_budget() -> Optional[int]:
+    """The memory budget in bytes, or None if it is not set."""
+    size = os.environ.get(MAX_MEMORY_ENV)
+    return parse_memory_size(size) if size else None
+
+
+def batch_size(item_bytes: int, n_items: int, default: int = 1) -> int:
+    """Number of items, such as slices or rows of an array, to process at once
+    within the memory budget.
+
+    Args:
+        item_bytes:
+            Estimate of the working memory needed to process each item.
+        n_items:
+            Total number of items.
+        default:
+            Number of items to process at once if no budget is set.
+
+    Returns:
+        The number of items per batch, at least 1 and at most n_items.
+    """
+    budget = memory_budget()
+    size = default if budget is None else budget // max(item_bytes, 1)
+    return int(max(min(size, n_items), 1))
+
+
+def batches(n_items: int, size: int) -> Iterator[slice]:
+    """Split a number of items into batches.
+
+    Args:
+        n_items:
+            Total number of items.
+        size:
+            Number of items per batch.
+
+    Returns:
+        Slices selecting each batch of items in turn.
+    """
+    for start in range(0, n_items, size):
+        yield slice(start, min(start + size, n_items))
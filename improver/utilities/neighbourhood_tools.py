@@ -4,7 +4,7 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Provides tools for neighbourhood generation"""
 
-from typing import Any, Tuple, Union
+from typing import Any, List, Sequence, Tuple, Union
 
 import numpy as np
 from numpy import ndarray
@@ -209,3 +209,183 @@ def boxsum(
         - data[..., i : i + m, :n]
     )
     return result
+
+
+def multi_boxsum(
+    data: ndarray,
+    boxsizes: Sequence[Union[int, Tuple[int, int]]],
+    **pad_options: Any,
+) -> List[ndarray]:
+    """Calculate neighbourhood totals for several neighbourhood sizes from
+    a single summed-area table.
+
+    The data are padded once for the largest neighbourhood and accumulated
+    once, and the totals for each neighbourhood size are then taken from
+    the same cumulative array as in `boxsum`.
+
+    Args:
+        data:
+            The input data array.
+        boxsizes:
+            The sizes of the neighbourhoods. Each must be an odd number.
+        pad_options:
+            Additional keyword arguments passed to `numpy.pad` function.
+            If given, the returned results will have the same shape as the
+            input array. Otherwise the results for smaller neighbourhoods
+            are trimmed to the shape of the result for the largest.
+
+    Returns:
+        Arrays containing the calculated neighbourhood totals for each
+        neighbourhood size.
+
+    Raises:
+        ValueError: If any of `boxsizes` has non-integer type.
+        ValueError: If any member of `boxsizes` is not an odd number.
+    """
+    boxsizes = [np.broadcast_to(np.atleast_1d(boxsize), 2) for boxsize in boxsizes]
+    for boxsize in boxsizes:
+        if not issubclass(boxsize.dtype.type, np.integer):
+            raise ValueError(
+                "The size of the neighbourhood must be of an integer type."
+            )
+        if not np.all(boxsize % 2):
+            raise ValueError("The size of the neighbourhood must be an odd number.")
+    largest = np.max(boxsizes, axis=0)
+    if pad_options:
+        data = pad_boxsum(data, tuple(largest), **pad_options)
+    data = data.cumsum(-2).cumsum(-1)
+    # shape of the results, as would be returned for the largest neighbourhood
+    m, n = data.shape[-2] - largest[0], data.shape[-1] - largest[1]
+    results = []
+    for i, j in boxsizes:
+        # offset of the cumulative sums for this neighbourhood within those
+        # padded for the largest neighbourhood
+        y0, x0 = (largest[0] - i) // 2, (largest[1] - j) // 2
+        results.append(
+            boxsum(data[..., y0 : y0 + m + i, x0 : x0 + n + j], (i, j), cumsum=False)
+        )
+    return results
+
+
+def chord_sum(data: ndarray, kernel: ndarray, **pad_options: Any) -> ndarray:
+    """Calculate neighbourhood totals over a kernel in which each row is a
+    single run of ones centred on the kernel, such as an unweighted circular
+    kernel.
+
+    The total over each row of the kernel, a chord of the circle, is the
+    difference of two cumulative sums along the rows of the data, so the
+    cost grows linearly with the size of the kernel rather than with its
+    area as for direct correlation. The result matches
+    `scipy.ndimage.correlate` of the data with the kernel, to within
+    floating point rounding, where the data beyond the edges are given by
+    the padding.
+
+    Args:
+        data:
+            The input data array, with the last two dimensions being those
+            to which the kernel is applied.
+        kernel:
+            Two dimensional kernel of odd size in both dimensions.
+        pad_options:
+            Keyword arguments passed to `numpy.pad` function to extend the
+            data beyond its edges, e.g. mode="edge" to match the "nearest"
+            mode of `scipy.ndimage.correlate`.
+
+    Returns:
+        Array containing the neighbourhood totals, of the same shape and
+        type as the data.
+
+    Raises:
+        ValueError: If the kernel does not have odd sizes, or any row of the
+            kernel is not a run of ones centred on the kernel.
+    """
+    ny_kernel, nx_kernel = kernel.shape
+    if not (ny_kernel % 2 and nx_kernel % 2):
+        raise ValueError("The size of the kernel must be an odd number.")
+    ry, rx = ny_kernel // 2, nx_kernel // 2
+    half_widths = []
+    for row in kernel:
+        (ones,) = np.nonzero(row)
+        half_width = rx - ones[0] if ones.size else -1
+        if ones.size and not (
+            np.all(row[ones] == 1)
+            and ones.size == 2 * half_width + 1
+            and ones[-1] == rx + half_width
+        ):
+            raise ValueError(
+                "Each row of the kernel must be a run of ones centred on the kernel."
+            )
+        half_widths.append(half_width)
+
+    work_dtype = np.result_type(data.dtype, np.float64)
+    padding = [(0, 0)] * (data.ndim - 2) + [(ry, ry), (rx, rx)]
+    padded = np.pad(data, padding, **pad_options)
+    # cumulative sums along rows, with a leading zero column
+    cumulative = np.zeros(padded.shape[:-1] + (padded.shape[-1] + 1,), work_dtype)
+    np.cumsum(padded, axis=-1, out=cumulative[..., 1:])
+
+    ny, nx = data.shape[-2:]
+    result = np.zeros(data.shape, work_dtype)
+    for row, half_width in enumerate(half_widths):
+        if half_width < 0:
+            continue
+        rows = cumulative[..., row : row + ny, :]
+        start, stop = rx - half_width, rx + half_width + 1
+        result += rows[..., stop : stop + nx]
+        result -= rows[..., start : start + nx]
+    return result.astype(data.dtype, copy=False)
+
+
+def running_maximum(
+    data: ndarray, half_width: int, axis: int = -1, fill_value: Any = None
+) -> ndarray:
+    """Calculate the maximum within a window of 2 * half_width + 1 points
+    centred on each point along an axis, ignoring points beyond the edges of
+    the data.
+
+    This uses the van Herk/Gil-Werman algorithm, in which the data are split
+    into blocks the size of the window. Each window spans at most two blocks,
+    so its maximum is the larger of the running maximum from its start to the
+    end of its first block and that from the start of its second block to its
+    end. The cost is therefore independent of the size of the window.
+
+    Args:
+        data:
+            The input data array.
+        half_width:
+            Number of points either side of each point within its window.
+        axis:
+            The axis along which to calculate the maximum.
+        fill_value:
+            Value smaller than any in the data, used to pad the data beyond
+            its edges. Defaults to the smallest value of the data type.
+
+    Returns:
+        Array of the maximum within the window about each point, of the same
+        shape and type as the data.
+    """
+    data = np.moveaxis(data, axis, -1)
+    if half_width == 0:
+        return np.moveaxis(data.copy(), -1, axis)
+    if fill_value is None:
+        if issubclass(data.dtype.type, np.floating):
+            fill_value = -np.inf
+        elif data.dtype == bool:
+            fill_value = False
+        else:
+            fill_value = np.iinfo(data.dtype).min
+
+    width = 2 * half_width + 1
+    n_points = data.shape[-1]
+    n_blocks = -(-(n_points + 2 * half_width) // width)
+    padded = np.full(data.shape[:-1] + (n_blocks * width,), fill_value, data.dtype)
+    padded[..., half_width : half_width + n_points] = data
+    blocks = padded.reshape(data.shape[:-1] + (n_blocks, width))
+    # running maxima forwards and backwards within each block
+    forward = np.maximum.accumulate(blocks, axis=-1).reshape(padded.shape)
+    backward = np.maximum.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1]
+    backward = backward.reshape(padded.shape)
+    result = np.maximum(
+        backward[..., :n_points], forward[..., width - 1 : width - 1 + n_points]
+    )
+    return np.moveaxis(result, -1, axis)
@@ -0,0 +1,237 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Run a graph of improver commands passing intermediate results in memory.
+
+A pipeline is a JSON or YAML mapping with a "steps" entry, which maps step
+names to the command to run, its arguments and optionally a file to write
+the result to. An argument of the form "@name" is replaced by the in-memory
+result of the step called name, in the same way as nested commands in
+square brackets are on the command line::
+
+    {
+        "steps": {
+            "wind_speed": {
+                "command": "wind-speed-from-components",
+                "args": ["u.nc", "v.nc"]
+            },
+            "probabilities": {
+                "command": "threshold",
+                "args": ["@wind_speed", "--threshold-values", "5,10"],
+                "output": "probabilities.nc"
+            },
+            "percentiles": {
+                "command": "generate-percentiles",
+                "args": ["@wind_speed", "--coordinates", "realization"],
+                "output": "percentiles.nc"
+            }
+        }
+    }
+
+Steps run as soon as the results they use are available, with independent
+steps running concurrently in a thread pool. Each result is held once in
+memory, is shared by all the steps that use it and is released when they
+have all completed. Only results of steps with an "output" are written.
+As results are shared, commands must not modify their input cubes in place.
+
+With the IMPROVER_ASYNC_SAVE environment variable set, outputs are written
+in the background while later steps run, and the pipeline completes once
+they have all been written.
+"""
+
+import pathlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Union
+
+REFERENCE_PREFIX = "@"
+
+
+def load_pipeline(path: Union[str, pathlib.Path]) -> Dict[str, Any]:
+    """Load a pipeline definition from a JSON or YAML file.
+
+    Args:
+        path:
+            Path to the pipeline file. Files with a .yaml or .yml extension
+            are read as YAML, which requires the PyYAML package, and all
+            others as JSON.
+
+    Returns:
+        The pipeline definition.
+    """
+    path = pathlib.Path(path)
+    with open(path) as pipeline_file:
+        if path.suffix.lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ModuleNotFoundError:
+                raise ModuleNotFoundError(
+                    "Module yaml (PyYAML) is required to read YAML pipeline files."
+                )
+            return yaml.safe_load(pipeline_file)
+        import json
+
+        return json.load(pipeline_file)
+
+
+def _step_dependencies(name: str, step: Dict[str, Any], steps: Dict) -> List[str]:
+    """Return the names of the steps whose results are used by a step."""
+    dependencies = []
+    for arg in step.get("args", []):
+        if isinstance(arg, str) and arg.startswith(REFERENCE_PREFIX):
+            ref = arg[len(REFERENCE_PREFIX) :]
+            if ref not in steps:
+                raise ValueError(f"Step '{name}' refers to unknown step '{ref}'.")
+            if ref not in dependencies:
+                dependencies.append(ref)
+    return dependencies
+
+
+def parse_pipeline(pipeline: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Check a pipeline definition and find the dependencies between steps.
+
+    Args:
+        pipeline:
+            The pipeline definition.
+
+    Returns:
+        Mapping of each step name to the names of the steps it uses,
+        in an order such that each step follows all of its dependencies.
+
+    Raises:
+        ValueError: If the pipeline has no steps, a step has no command,
+            a step refers to an unknown step or the steps contain a cycle.
+    """
+    steps = pipeline.get("steps")
+    if not steps:
+        raise ValueError("Pipeline must contain at least one step.")
+    dependencies = {}
+    for name, step in steps.items():
+        if "command" not in step:
+            raise ValueError(f"Step '{name}' has no command.")
+        dependencies[name] = _step_dependencies(name, step, steps)
+
+    ordered = {}
+    remaining = dict(dependencies)
+    while remaining:
+        ready = [
+            name
+            for name, deps in remaining.items()
+            if all(dep in ordered for dep in deps)
+        ]
+        if not ready:
+            raise ValueError(
+                "Pipeline contains a cycle involving steps: "
+                + ", ".join(sorted(remaining))
+            )
+        for name in ready:
+            ordered[name] = remaining.pop(name)
+    return ordered
+
+
+def _step_argv(step: Dict[str, Any], results: Dict[str, Any], pass_through: bool):
+    """Build the command arguments for a step, substituting results of the
+    steps it uses and adding its output file if it has one. Numeric arguments
+    are converted to strings and other objects, such as cubes, passed as is."""
+    argv = [step["command"]]
+    for arg in step.get("args", []):
+        if isinstance(arg, str) and arg.startswith(REFERENCE_PREFIX):
+            argv.append(results[arg[len(REFERENCE_PREFIX) :]])
+        elif isinstance(arg, (int, float)):
+            argv.append(str(arg))
+        else:
+            argv.append(arg)
+    if step.get("output"):
+        argv.extend(["--output", str(step["output"])])
+        if pass_through:
+            argv.append("--pass-through-output")
+    return argv
+
+
+def run_pipeline(
+    pipeline: Dict[str, Any],
+    workers: int = 1,
+    verbose: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Run the steps of a pipeline.
+
+    Args:
+        pipeline:
+            The pipeline definition.
+        workers:
+            Maximum number of steps to run at once.
+        verbose:
+            Print each command as it is run, with its run time.
+        dry_run:
+            Print the commands in the order they would be run, without
+            running them.
+
+    Returns:
+        Results of the steps which are not used by any other step and do
+        not have an output file, keyed by step name.
+    """
+    from improver.cli import SUBCOMMANDS_DISPATCHER, ObjectAsStr, execute_command
+    from improver.utilities.save import wait_for_saves
+
+    steps = pipeline["steps"]
+    dependencies = parse_pipeline(pipeline)
+    consumers = {name: [] for name in dependencies}
+    for name, deps in dependencies.items():
+        for dep in deps:
+            consumers[dep].append(name)
+
+    if dry_run:
+        for name in dependencies:
+            argv = _step_argv(
+                steps[name],
+                {dep: f"<{dep}>" for dep in dependencies[name]},
+                bool(consumers[name]),
+            )
+            print(f"{name}: improver " + " ".join(map(ObjectAsStr.obj_to_name, argv)))
+        return {}
+
+    results = {}
+    unfinished_consumers = {name: set(names) for name, names in consumers.items()}
+    final = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        waiting = dict(dependencies)
+        while waiting or pending:
+            ready = [
+                name
+                for name, deps in waiting.items()
+                if all(dep in results for dep in deps)
+            ]
+            for name in ready:
+                del waiting[name]
+                argv = _step_argv(steps[name], results, bool(consumers[name]))
+                future = executor.submit(
+                    execute_command,
+                    SUBCOMMANDS_DISPATCHER,
+                    "improver",
+                    *argv,
+                    verbose=verbose,
+                )
+                pending[future] = name
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception:
+                    for other in pending:
+                        other.cancel()
+                    raise
+                for dep in dependencies[name]:
+                    unfinished_consumers[dep].discard(name)
+                    if not unfinished_consumers[dep]:
+                        # release the result once all its consumers are done
+                        results.pop(dep, None)
+                if consumers[name]:
+                    results[name] = result
+                elif not steps[name].get("output"):
+                    final[name] = result
+    wait_for_saves()
+    return final
@@ -5,8 +5,10 @@
 """Module for saving netcdf cubes with desired attribute types."""
 
 import os
+import threading
 import warnings
-from typing import Optional, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
 
 import cf_units
 import iris
@@ -14,6 +16,14 @@ from iris.cube import Cube, CubeList
 
 from improver.metadata.check_datatypes import check_mandatory_standards
 
+# Environment variable giving the number of background writer threads used
+# by with_output, with 0 or unset to save synchronously
+ASYNC_SAVE_ENV = "IMPROVER_ASYNC_SAVE"
+
+_WRITER: Optional[ThreadPoolExecutor] = None
+_PENDING: List[Future] = []
+_PENDING_LOCK = threading.Lock()
+
 
 def _order_cell_methods(cube: Cube) -> None:
     """
@@ -52,38 +62,13 @@ def _check_metadata(cube: Cube) -> None:
         raise ValueError("{} has unknown units".format(cube.name()))
 
 
-def save_netcdf(
+def _prepare_save(
     cubelist: Union[Cube, CubeList],
-    filename: str,
-    compression_level: int = 1,
-    least_significant_digit: Optional[int] = None,
-) -> None:
-    """Save the input Cube or CubeList as a NetCDF file and check metadata
-    where required for integrity.
-
-    Uses the functionality provided by iris.fileformats.netcdf.save with
-    local_keys to record non-global attributes as data attributes rather than
-    global attributes.
-
-    Args:
-        cubelist:
-            Cube or list of cubes to be saved
-        filename:
-            Filename to save input cube(s)
-        compression_level:
-            1-9 to specify compression level, or 0 to not compress (default compress
-            with complevel 1)
-        least_significant_digit:
-            If specified will truncate the data to a precision given by
-            10**(-least_significant_digit), e.g. if least_significant_digit=2, then the data will
-            be quantized to a precision of 0.01 (10**(-2)). See
-            http://www.esrl.noaa.gov/psd/data/gridded/conventions/cdc_netcdf_standard.shtml
-            for details. When used with `compression level`, this will result in lossy
-            compression.
-
-    Raises:
-        warning if cubelist contains cubes of varying dimensions.
-    """
+    compression_level: int,
+    least_significant_digit: Optional[int],
+) -> Dict[str, Any]:
+    """Check and tidy the metadata of cubes to be saved and work out the
+    arguments to iris.fileformats.netcdf.save. See :func:`save_netcdf`."""
     if isinstance(cubelist, iris.cube.Cube):
         cubelist = iris.cube.CubeList([cubelist])
     elif not isinstance(cubelist, iris.cube.CubeList):
@@ -133,11 +118,8 @@ def save_netcdf(
             "Compression level must be an integer value between 0 and 9 (0 to disable compression)"
         )
 
-    # save atomically by writing to a temporary file and then renaming
-    ftmp = str(filename) + ".tmp"
-    iris.fileformats.netcdf.save(
-        cubelist,
-        ftmp,
+    return dict(
+        cube=cubelist,
         local_keys=local_keys,
         complevel=compression_level,
         shuffle=True,
@@ -145,4 +127,130 @@ def save_netcdf(
         chunksizes=chunksizes,
         least_significant_digit=least_significant_digit,
     )
+
+
+def _write(save_kwargs: Dict[str, Any], filename: str, fsync: bool) -> None:
+    """Save atomically by writing to a temporary file and then renaming,
+    optionally flushing the file to disk first."""
+    ftmp = str(filename) + ".tmp"
+    iris.fileformats.netcdf.save(filename=ftmp, **save_kwargs)
+    if fsync:
+        with open(ftmp, "rb") as tmp_file:
+            os.fsync(tmp_file.fileno())
     os.rename(ftmp, filename)
+    if fsync:
+        dir_fd = os.open(os.path.dirname(os.path.abspath(filename)), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def save_netcdf(
+    cubelist: Union[Cube, CubeList],
+    filename: str,
+    compression_level: int = 1,
+    least_significant_digit: Optional[int] = None,
+    fsync: bool = False,
+) -> None:
+    """Save the input Cube or CubeList as a NetCDF file and check metadata
+    where required for integrity.
+
+    Uses the functionality provided by iris.fileformats.netcdf.save with
+    local_keys to record non-global attributes as data attributes rather than
+    global attributes.
+
+    Args:
+        cubelist:
+            Cube or list of cubes to be saved
+        filename:
+            Filename to save input cube(s)
+        compression_level:
+            1-9 to specify compression level, or 0 to not compress (default compress
+            with complevel 1)
+        least_significant_digit:
+            If specified will truncate the data to a precision given by
+            10**(-least_significant_digit), e.g. if least_significant_digit=2, then the data will
+            be quantized to a precision of 0.01 (10**(-2)). See
+            http://www.esrl.noaa.gov/psd/data/gridded/conventions/cdc_netcdf_standard.shtml
+            for details. When used with `compression level`, this will result in lossy
+            compression.
+        fsync:
+            If True, flush the file to disk before returning.
+
+    Raises:
+        warning if cubelist contains cubes of varying dimensions.
+    """
+    save_kwargs = _prepare_save(cubelist, compression_level, least_significant_digit)
+    _write(save_kwargs, filename, fsync)
+
+
+def async_save_workers() -> int:
+    """Number of background writer threads requested by the
+    IMPROVER_ASYNC_SAVE environment variable, or 0 if saves should be
+    synchronous."""
+    return int(os.environ.get(ASYNC_SAVE_ENV) or 0)
+
+
+def save_netcdf_async(
+    cubelist: Union[Cube, CubeList],
+    filename: str,
+    compression_level: int = 1,
+    least_significant_digit: Optional[int] = None,
+    copy: bool = False,
+) -> Future:
+    """Save the input Cube or CubeList as a NetCDF file in a background
+    writer thread, so that compression and writing overlap with further
+    processing.
+
+    The metadata is checked, and any errors raised, before returning. The
+    file is flushed to disk before the save is complete, and appears under
+    its final name only once complete. Unless copied, the cubes must not be
+    modified until then. Call :func:`wait_for_saves` to wait for all saves to
+    complete.
+
+    Args:
+        cubelist:
+            Cube or list of cubes to be saved
+        filename:
+            Filename to save input cube(s)
+        compression_level:
+            See :func:`save_netcdf`.
+        least_significant_digit:
+            See :func:`save_netcdf`.
+        copy:
+            If True, save a copy of the cubes so that the originals may be
+            modified as soon as this returns.
+
+    Returns:
+        Future which completes when the file has been written.
+    """
+    global _WRITER
+    save_kwargs = _prepare_save(cubelist, compression_level, least_significant_digit)
+    if copy:
+        save_kwargs["cube"] = CubeList(cube.copy() for cube in save_kwargs["cube"])
+    with _PENDING_LOCK:
+        if _WRITER is None:
+            _WRITER = ThreadPoolExecutor(
+                max_workers=max(async_save_workers(), 1),
+                thread_name_prefix="improver-save",
+            )
+        future = _WRITER.submit(_write, save_kwargs, filename, True)
+        _PENDING.append(future)
+    return future
+
+
+def wait_for_saves() -> None:
+    """Wait for all background saves started by :func:`save_netcdf_async`
+    to complete.
+
+    Raises:
+        The first exception raised by any of the saves.
+    """
+    with _PENDING_LOCK:
+        pending = list(_PENDING)
+        _PENDING.clear()
+    errors = [future.exception() for future in pending]
+    errors = [error for error in errors if error is not None]
+    if errors:
+        raise errors[0]
@@ -5,6 +5,7 @@
 """Provides support utilities."""
 
 import copy
+import math
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple, Union
 
@@ -19,7 +20,6 @@ from iris.coords import AuxCoord, CellMethod, Coord, DimCoord
 from iris.cube import Cube, CubeList
 from numpy import ndarray
 from numpy.ma import MaskedArray
-from scipy.ndimage.filters import maximum_filter
 
 from improver import BasePlugin, PostProcessingPlugin
 from improver.metadata.amend import update_diagnostic_name
@@ -29,8 +29,11 @@ from improver.metadata.utilities import (
     create_new_diagnostic_cube,
     generate_mandatory_attributes,
 )
+from improver.utilities.ancillary_cache import cached_arrays
+from improver.utilities.chunking import leading_coord_names
 from improver.utilities.cube_checker import check_cube_coordinates, spatial_coords_match
 from improver.utilities.cube_manipulation import enforce_coordinate_ordering
+from improver.utilities.neighbourhood_tools import running_maximum
 
 
 def check_if_grid_is_equal_area(
@@ -716,6 +719,117 @@ class GradientBetweenAdjacentGridSquares(PostProcessingPlugin):
         return tuple(gradients)
 
 
+def maxima_within_vicinity(
+    grid: Union[MaskedArray, ndarray],
+    grid_point_radii: List[int],
+    landmask: Optional[ndarray] = None,
+    circular: bool = False,
+) -> List[Union[MaskedArray, ndarray]]:
+    """
+    Find the maximum value within the vicinity of each grid point for each of
+    several radii, as for maximum_within_vicinity, in one pass over the data.
+
+    The maxima are calculated from running maxima along the rows and columns
+    of the grid (see
+    :func:`improver.utilities.neighbourhood_tools.running_maximum`), at a cost
+    independent of the radius. For square vicinities, the maximum for each
+    radius is found from that for the next smaller radius. For circular
+    vicinities, the running maxima along the rows are calculated for each
+    chord width of the circles of all the radii in turn, and the maximum for
+    each radius taken over the chords of its circle.
+
+    Args:
+        grid:
+            An array of values to which the process is applied, with y and x
+            as its last dimensions. Any leading dimensions are processed
+            together.
+        grid_point_radii:
+            The radii in grid points about each point within which to
+            determine the maximum value.
+        landmask:
+            A binary grid of the same size as the y and x dimensions of the
+            grid that differentiates between land and sea points to allow the
+            different surface types to be processed independently.
+        circular:
+            If True, the vicinity of each point is a circle of the radius
+            about it, rather than a square with sides of twice the radius.
+
+    Returns:
+        Arrays for each radius where the occurrences have been spatially
+        spread, so that they're equally likely to have occurred anywhere
+        within the vicinity defined using the radius.
+    """
+    # Value, the negative of which is used to fill masked points, ensuring
+    # that when we take a maximum the masked points do not contribute.
+    fill_value = netCDF4.default_fillvals.get(grid.dtype.str[1:], np.inf)
+    fill_value = -np.array(fill_value).astype(grid.dtype)
+
+    if np.ma.is_masked(grid):
+        unmasked_grid = grid.data.copy()
+        unmasked_grid[grid.mask] = fill_value
+    else:
+        unmasked_grid = np.ma.getdata(grid).copy()
+    if landmask is not None:
+        # Process land and sea points together, as two fields in which the
+        # points of the other type are filled.
+        landmask = np.asarray(landmask, dtype=bool)
+        unmasked_grid = np.array(
+            [
+                np.where(landmask, unmasked_grid, fill_value),
+                np.where(landmask, fill_value, unmasked_grid),
+            ]
+        )
+
+    grid_point_radii = [int(radius) for radius in grid_point_radii]
+    ny = unmasked_grid.shape[-2]
+    max_data = [None] * len(grid_point_radii)
+    if circular:
+        # half width of the chord of each circle at each row offset
+        chords = {}
+        for index, radius in enumerate(grid_point_radii):
+            for row in range(-radius, radius + 1):
+                half_width = math.isqrt(radius**2 - row**2)
+                chords.setdefault(half_width, []).append((index, row))
+            max_data[index] = np.full(unmasked_grid.shape, fill_value)
+        row_max, previous = unmasked_grid, 0
+        for half_width in sorted(chords):
+            row_max = running_maximum(
+                row_max, half_width - previous, fill_value=fill_value
+            )
+            previous = half_width
+            for index, row in chords[half_width]:
+                if abs(row) >= ny:
+                    continue
+                target = max_data[index][..., max(-row, 0) : ny - max(row, 0), :]
+                source = row_max[..., max(row, 0) : ny - max(-row, 0), :]
+                np.maximum(target, source, out=target)
+    else:
+        square_max, previous = unmasked_grid, 0
+        for index in np.argsort(grid_point_radii):
+            half_width = grid_point_radii[index] - previous
+            square_max = running_maximum(
+                running_maximum(square_max, half_width, fill_value=fill_value),
+                half_width,
+                axis=-2,
+                fill_value=fill_value,
+            )
+            previous = grid_point_radii[index]
+            max_data[index] = square_max
+
+    results = []
+    for radius_max in max_data:
+        if landmask is not None:
+            radius_max = np.where(landmask, radius_max[0], radius_max[1])
+        if np.ma.is_masked(grid):
+            # Update only the unmasked values
+            processed_grid = grid.copy()
+            processed_grid.data[~grid.mask] = radius_max[~grid.mask]
+        else:
+            processed_grid = radius_max
+        results.append(processed_grid)
+    return results
+
+
 def maximum_within_vicinity(
     grid: Union[MaskedArray, ndarray],
     grid_point_radius: int,
@@ -732,7 +846,8 @@ def maximum_within_vicinity(
 
     Args:
         grid:
-            An array of values to which the process is applied.
+            An array of values to which the process is applied, with y and x
+            as its last dimensions.
         grid_point_radius:
             The radius in grid points about each point within which to
             determine the maximum value.
@@ -746,37 +861,8 @@ def maximum_within_vicinity(
         they're equally likely to have occurred anywhere within the
         vicinity defined using the specified radius.
     """
-    # Value, the negative of which is used to fill masked points, ensuring
-    # that when we take a maximum the masked points do not contribute.
-    fill_value = netCDF4.default_fillvals.get(grid.dtype.str[1:], np.inf)
-
-    # Convert the grid_point_radius into a number of points along an edge
-    # length, including the central point, e.g. grid_point_radius = 1,
-    # points along the edge = 3
-    grid_points = (2 * grid_point_radius) + 1
-    processed_grid = grid.copy()
-    if np.ma.is_masked(grid):
-        unmasked_grid = grid.data.copy()
-        unmasked_grid[grid.mask] = -fill_value
-    else:
-        unmasked_grid = grid.copy()
-    if landmask is not None:
-        max_data = np.empty_like(grid)
-        for match in (True, False):
-            matched_data = unmasked_grid.copy()
-            matched_data[landmask != match] = -fill_value
-            matched_max_data = maximum_filter(matched_data, size=grid_points)
-            max_data = np.where(landmask == match, matched_max_data, max_data)
-    else:
-        # The following command finds the maximum value for each grid point
-        # from within a square of length "size"
-        max_data = maximum_filter(unmasked_grid, size=grid_points)
-    if np.ma.is_masked(grid):
-        # Update only the unmasked values
-        processed_grid.data[~grid.mask] = max_data[~grid.mask]
-    else:
-        processed_grid = max_data
-    return processed_grid
+    (result,) = maxima_within_vicinity(grid, [grid_point_radius], landmask)
+    return result
 
 
 def rename_vicinity_cube(cube: Cube):
@@ -850,6 +936,7 @@ class OccurrenceWithinVicinity(PostProcessingPlugin):
         radii: Optional[List[Union[float, int]]] = None,
         grid_point_radii: Optional[List[Union[float, int]]] = None,
         land_mask_cube: Cube = None,
+        circular: bool = False,
     ) -> None:
         """
         Args:
@@ -864,6 +951,10 @@ class OccurrenceWithinVicinity(PostProcessingPlugin):
                 Binary land-sea mask data. True for land-points, False for sea.
                 Restricts in-vicinity processing to only include points of a
                 like mask value.
+            circular:
+                If True, search for occurrences within a circle of each radius
+                about each point, rather than a square with sides of twice the
+                radius.
 
         Raises:
             ValueError: If both radii and grid point radii are set.
@@ -904,13 +995,55 @@ class OccurrenceWithinVicinity(PostProcessingPlugin):
         else:
             self.land_mask = None
         self.land_mask_cube = land_mask_cube
+        self.circular = circular
+
+    def chunk_coords(self, cube: Cube) -> List[str]:
+        """Leading coordinates whose slices are processed independently, so
+        that the cube can be processed in chunks along them (see
+        :class:`improver.utilities.chunking.ChunkedExecution`).
+
+        Args:
+            cube:
+                Cube to be processed.
+
+        Returns:
+            Names of the coordinates, in order of preference.
+        """
+        return leading_coord_names(cube)
+
+    def tile_halo(self, cube: Cube) -> int:
+        """Number of grid points within the largest vicinity, as needed to
+        process the cube in spatial tiles (see
+        :class:`improver.utilities.tiling.SpatialTiling`).
+
+        Args:
+            cube:
+                Cube to be processed.
+
+        Returns:
+            The largest vicinity radius in grid points.
+
+        Raises:
+            ValueError: If a land mask is used, as this covers the whole domain.
+        """
+        if self.land_mask_cube:
+            raise ValueError(
+                "Vicinity processing with a land mask cannot be run over "
+                "spatial tiles"
+            )
+        if self.native_grid_point_radius:
+            return int(max(self.radii))
+        return max(
+            distance_to_number_of_grid_cells(cube, radius) for radius in self.radii
+        )
 
     def process(self, cube: Cube) -> Cube:
         """
-        Produces the vicinity processed data. The input data is sliced to
-        yield y-x slices to which the maximum_within_vicinity method is applied.
-        The different vicinity radii (if multiple) are looped over and a
-        coordinate recording the radius used is added to each resulting cube.
+        Produces the vicinity processed data. The maxima_within_vicinity
+        function is applied to the data for all the vicinity radii at once,
+        taking all y-x slices together if y and x are the last dimensions of
+        the cube, and a coordinate recording the radius used is added to the
+        resulting cube for each radius.
         A single cube is returned with the leading coordinates of the input cube
         preserved. If a single vicinity radius is provided, a new scalar
         radius_of_vicinity coordinate will be found on the returned cube. If
@@ -950,20 +1083,36 @@ class OccurrenceWithinVicinity(PostProcessingPlugin):
             crd.name() for crd in cube.coords(dim_coords=True) if not crd.coord_system
         ]
 
-        for radius, grid_point_radius in zip(self.radii, grid_point_radii):
-            max_cubes = CubeList([])
-            for cube_slice in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
-                result = cube_slice.copy(
-                    data=maximum_within_vicinity(
-                        cube_slice.data, grid_point_radius, self.land_mask
-                    )
+        y_dims = cube.coord_dims(cube.coord(axis="y"))
+        x_dims = cube.coord_dims(cube.coord(axis="x"))
+        if (y_dims, x_dims) == ((cube.ndim - 2,), (cube.ndim - 1,)):
+            radii_data = maxima_within_vicinity(
+                cube.data, grid_point_radii, self.land_mask, circular=self.circular
+            )
+            radii_results = [cube.copy(data=data) for data in radii_data]
+        else:
+            slices = list(cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]))
+            slice_maxima = [
+                maxima_within_vicinity(
+                    cube_slice.data,
+                    grid_point_radii,
+                    self.land_mask,
+                    circular=self.circular,
+                )
+                for cube_slice in slices
+            ]
+            radii_results = []
+            for index in range(len(self.radii)):
+                max_cubes = CubeList(
+                    cube_slice.copy(data=maxima[index])
+                    for cube_slice, maxima in zip(slices, slice_maxima)
+                )
+                # Put dimensions back if they were there before.
+                radii_results.append(
+                    check_cube_coordinates(cube, max_cubes.merge_cube())
                 )
-                max_cubes.append(result)
-            result_cube = max_cubes.merge_cube()
-
-            # Put dimensions back if they were there before.
-            result_cube = check_cube_coordinates(cube, result_cube)
 
+        for radius, result_cube in zip(self.radii, radii_results):
             # Add a coordinate recording the vicinity radius applied to the data.
             vic_coord = create_vicinity_coord(radius, self.native_grid_point_radius)
             result_cube.add_aux_coord(vic_coord)
@@ -1038,7 +1187,9 @@ def transform_grid_to_lat_lon(cube: Cube) -> Tuple[ndarray, ndarray]:
 
     The result is defined over the spatial grid, of shape (ny, nx) where
     ny is the length of the y-axis coordinate and nx the length of the
-    x-axis coordinate.
+    x-axis coordinate. It is read from the ancillary cache where one is
+    configured (see :mod:`improver.utilities.ancillary_cache`), in which case
+    the arrays returned are read-only.
 
     Args:
         cube:
@@ -1048,31 +1199,33 @@ def transform_grid_to_lat_lon(cube: Cube) -> Tuple[ndarray, ndarray]:
         - Array of shape (ny, nx) containing grid latitude values
         - Array of shape (ny, nx) containing grid longitude values
     """
-    trg_latlon = ccrs.PlateCarree()
-    trg_crs = cube.coord_system().as_cartopy_crs()
-    cube = cube.copy()
-    # TODO use the proj units that are accesible with later versions of proj
-    # to determine the default units to convert to for a given projection.
-
-    # Assuming proj units of metre for all projections not in degrees.
-    for axis in ["x", "y"]:
-        try:
-            cube.coord(axis=axis).convert_units("m")
-        except ValueError as err:
-            msg = (
-                "Cube passed to transform_grid_to_lat_lon does not have an "
-                f"{axis} coordinate with units that can be converted to metres. "
-            )
-            raise ValueError(msg + str(err))
 
-    all_y_points, all_x_points = get_grid_y_x_values(cube)
+    def _calculate():
+        trg_latlon = ccrs.PlateCarree()
+        trg_crs = cube.coord_system().as_cartopy_crs()
+        grid = cube.copy()
+        # TODO use the proj units that are accesible with later versions of proj
+        # to determine the default units to convert to for a given projection.
+
+        # Assuming proj units of metre for all projections not in degrees.
+        for axis in ["x", "y"]:
+            try:
+                grid.coord(axis=axis).convert_units("m")
+            except ValueError as err:
+                msg = (
+                    "Cube passed to transform_grid_to_lat_lon does not have an "
+                    f"{axis} coordinate with units that can be converted to metres. "
+                )
+                raise ValueError(msg + str(err))
+
+        all_y_points, all_x_points = get_grid_y_x_values(grid)
 
-    # Transform points
-    points = trg_latlon.transform_points(trg_crs, all_x_points, all_y_points)
-    lons = points[..., 0]
-    lats = points[..., 1]
+        # Transform points
+        points = trg_latlon.transform_points(trg_crs, all_x_points, all_y_points)
+        return {"lats": points[..., 1], "lons": points[..., 0]}
 
-    return lats, lons
+    arrays = cached_arrays("transform_grid_to_lat_lon", [cube], _calculate)
+    return arrays["lats"], arrays["lons"]
 
 
 def update_name_and_vicinity_coord(cube: Cube, new_name: str, vicinity_radius: float):
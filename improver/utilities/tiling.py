@@ -0,0 +1,293 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Run plugins which act on local neighbourhoods of grid points over spatial
+tiles in parallel.
+
+The x-y domain is split into tiles, each of which is extended by a halo of
+grid points taken from the neighbouring tiles so that the plugin sees all
+the data it needs to calculate the result within the tile. The halo is
+trimmed from the result of each tile and the tiles joined back together.
+Tiles at the edges of the domain are not extended beyond it, so the plugin
+treats the domain edges as it would when run on the whole domain.
+
+Plugins which can be tiled declare the width of the halo they need with a
+``tile_halo(cube)`` method returning a number of grid points.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple
+
+import dask.array as da
+import numpy as np
+from iris.cube import Cube, CubeList
+
+from improver import BasePlugin
+from improver.utilities.cube_checker import spatial_coords_match
+
+# State of each worker process, set up by _init_worker
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def tile_bounds(size: int, tile_size: int) -> List[Tuple[int, int]]:
+    """Split a dimension into tiles of near equal size no larger than the
+    tile size.
+
+    Args:
+        size:
+            Number of points along the dimension.
+        tile_size:
+            Maximum number of points in each tile.
+
+    Returns:
+        Start and stop index of each tile.
+    """
+    n_tiles = -(-size // tile_size)
+    edges = np.linspace(0, size, n_tiles + 1).round().astype(int)
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _check_yx_last(cube: Cube) -> None:
+    """Check that the y and x dimensions are the last in a cube."""
+    y_dims = cube.coord_dims(cube.coord(axis="y"))
+    x_dims = cube.coord_dims(cube.coord(axis="x"))
+    if (y_dims, x_dims) != ((cube.ndim - 2,), (cube.ndim - 1,)):
+        raise ValueError(
+            f"Spatial tiling requires the y and x dimensions to be the last "
+            f"dimensions of {cube.name()}"
+        )
+
+
+def _share(array: np.ndarray) -> Tuple[SharedMemory, Tuple]:
+    """Copy an array to a new shared memory block.
+
+    Returns:
+        The shared memory and a specification from which worker processes
+        can attach to it.
+    """
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _attach(spec: Tuple) -> np.ndarray:
+    """Attach to an array in shared memory created by the parent process."""
+    name, shape, dtype = spec
+    try:
+        shm = SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always tracks, so would unlink the memory on exit
+        shm = SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+    _WORKER_STATE.setdefault("shared", []).append(shm)
+    return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _init_worker(
+    plugin: BasePlugin,
+    args: List[Any],
+    kwargs: Dict[str, Any],
+    specs: Dict[Any, Tuple[Tuple, Optional[Tuple]]],
+) -> None:
+    """Set up a worker with the plugin and its arguments, attaching the
+    data of the tiled cubes from shared memory."""
+    args = list(args)
+    kwargs = dict(kwargs)
+    for key, (data_spec, mask_spec) in specs.items():
+        container = args if isinstance(key, int) else kwargs
+        data = _attach(data_spec)
+        if mask_spec is not None:
+            data = np.ma.masked_array(data, mask=_attach(mask_spec), copy=False)
+        container[key].data = data
+    _WORKER_STATE.update(plugin=plugin, args=args, kwargs=kwargs)
+
+
+def _run_tile(
+    plugin: BasePlugin,
+    args: List[Any],
+    kwargs: Dict[str, Any],
+    keys: List[Any],
+    tile: Tuple[int, int, int, int],
+    halo: int,
+    shape: Tuple[int, int],
+) -> Cube:
+    """Run the plugin on one tile extended by the halo, returning the result
+    within the tile."""
+    y0, y1, x0, x1 = tile
+    hy0, hx0 = max(y0 - halo, 0), max(x0 - halo, 0)
+    hy1, hx1 = min(y1 + halo, shape[0]), min(x1 + halo, shape[1])
+    args = list(args)
+    kwargs = dict(kwargs)
+    for key in keys:
+        container = args if isinstance(key, int) else kwargs
+        container[key] = container[key][..., hy0:hy1, hx0:hx1]
+    result = plugin(*args, **kwargs)
+    _check_yx_last(result)
+    return result[..., y0 - hy0 : y1 - hy0, x0 - hx0 : x1 - hx0]
+
+
+def _run_worker_tile(keys, tile, halo, shape) -> Cube:
+    """Run the plugin on one tile in a worker process."""
+    state = _WORKER_STATE
+    return _run_tile(
+        state["plugin"], state["args"], state["kwargs"], keys, tile, halo, shape
+    )
+
+
+class SpatialTiling(BasePlugin):
+    """Run a plugin over spatial tiles of its input cubes in parallel and
+    join the results.
+
+    Every cube argument on the same grid as the first is split into tiles,
+    with other arguments passed unchanged to each call of the plugin. In
+    worker processes the data of the tiled cubes are read from shared
+    memory rather than copied to each process.
+    """
+
+    def __init__(
+        self,
+        plugin: BasePlugin,
+        tile_size: int = 512,
+        halo: Optional[int] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            plugin:
+                Plugin whose result at each grid point depends only on the
+                inputs within a halo of that point.
+            tile_size:
+                Maximum number of grid points along each side of a tile,
+                excluding the halo.
+            halo:
+                Width of the halo in grid points. Defaults to the width
+                declared by the plugin's tile_halo method.
+            workers:
+                Number of worker processes, or 1 to process the tiles in
+                turn in this process. Defaults to the number of CPUs.
+
+        Raises:
+            ValueError: If the tile size is not positive.
+        """
+        if tile_size < 1:
+            raise ValueError(f"Tile size must be positive, not {tile_size}")
+        self.plugin = plugin
+        self.tile_size = tile_size
+        self.halo = halo
+        self.workers = workers or os.cpu_count() or 1
+
+    def __repr__(self) -> str:
+        return (
+            f"<SpatialTiling: {self.plugin}, tile_size: {self.tile_size}, "
+            f"halo: {self.halo}, workers: {self.workers}>"
+        )
+
+    def _halo(self, cube: Cube) -> int:
+        """The halo width given, or declared by the plugin."""
+        if self.halo is not None:
+            return self.halo
+        tile_halo = getattr(self.plugin, "tile_halo", None)
+        if tile_halo is None:
+            raise ValueError(
+                f"{type(self.plugin).__name__} does not declare the halo needed "
+                "to run it over spatial tiles"
+            )
+        return tile_halo(cube)
+
+    def _run_parallel(
+        self,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        keys: List[Any],
+        tiles: List[Tuple[int, int, int, int]],
+        halo: int,
+        shape: Tuple[int, int],
+    ) -> List[Cube]:
+        """Run the tiles in a pool of worker processes sharing the data of the
+        tiled cubes."""
+        shared = []
+        specs = {}
+        args = list(args)
+        kwargs = dict(kwargs)
+        try:
+            for key in keys:
+                container = args if isinstance(key, int) else kwargs
+                cube = container[key]
+                data = cube.data
+                data_shm, data_spec = _share(np.ma.getdata(data))
+                shared.append(data_shm)
+                mask_spec = None
+                if np.ma.isMaskedArray(data):
+                    mask_shm, mask_spec = _share(np.ma.getmaskarray(data))
+                    shared.append(mask_shm)
+                specs[key] = (data_spec, mask_spec)
+                # pass the metadata to the workers with placeholder data
+                container[key] = cube.copy(
+                    data=da.zeros(cube.shape, dtype=cube.dtype, chunks=-1)
+                )
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(tiles)),
+                initializer=_init_worker,
+                initargs=(self.plugin, args, kwargs, specs),
+            ) as pool:
+                jobs = [
+                    pool.submit(_run_worker_tile, keys, tile, halo, shape)
+                    for tile in tiles
+                ]
+                return [job.result() for job in jobs]
+        finally:
+            for shm in shared:
+                shm.close()
+                shm.unlink()
+
+    def process(self, *args, **kwargs) -> Cube:
+        """Run the plugin over spatial tiles.
+
+        Args:
+            args:
+                Positional arguments of the plugin, the first of which must
+                be a cube.
+            kwargs:
+                Keyword arguments of the plugin.
+
+        Returns:
+            The result of the plugin, joined from the result of each tile.
+
+        Raises:
+            ValueError: If the plugin does not declare its halo and none is
+                given, or the y and x dimensions are not the last dimensions
+                of the cubes.
+        """
+        cube = args[0]
+        _check_yx_last(cube)
+        halo = self._halo(cube)
+        keys = [
+            key
+            for key, value in list(enumerate(args)) + list(kwargs.items())
+            if isinstance(value, Cube) and spatial_coords_match([cube, value])
+        ]
+        for key in keys:
+            _check_yx_last(args[key] if isinstance(key, int) else kwargs[key])
+
+        shape = cube.shape[-2:]
+        y_tiles = tile_bounds(shape[0], self.tile_size)
+        x_tiles = tile_bounds(shape[1], self.tile_size)
+        tiles = [(y0, y1, x0, x1) for y0, y1 in y_tiles for x0, x1 in x_tiles]
+
+        if self.workers > 1 and len(tiles) > 1:
+            results = self._run_parallel(args, kwargs, keys, tiles, halo, shape)
+        else:
+            results = [
+                _run_tile(self.plugin, args, kwargs, keys, tile, halo, shape)
+                for tile in tiles
+            ]
+
+        rows = [
+            CubeList(results[row * len(x_tiles) : (row + 1) * len(x_tiles)])
+            for row in range(len(y_tiles))
+        ]
+        return CubeList(row.concatenate_cube() for row in rows).concatenate_cube()
@@ -4,6 +4,7 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for cli.__init__"""
 
+import os
 import unittest
 from unittest.mock import patch
 
@@ -14,6 +15,7 @@ from iris.exceptions import ConstraintMismatchError
 
 import improver
 from improver.cli import (
+    LazySubcommand,
     clizefy,
     create_constrained_inputcubelist_converter,
     docutilize,
@@ -229,6 +231,19 @@ class Test_with_output(unittest.TestCase):
         m.assert_called_with(4, "foo", 0, 2)
         self.assertEqual(result, None)
 
+    @patch.dict(os.environ, {"IMPROVER_ASYNC_SAVE": "2"})
+    @patch("improver.utilities.save.save_netcdf")
+    @patch("improver.utilities.save.save_netcdf_async")
+    def test_with_output_async(self, m_async, m_sync):
+        """Tests save_netcdf_async is used when background saves are enabled,
+        saving a copy if the result is passed through"""
+        result = wrapped_with_output.cli("argv[0]", "2", "--output=foo")
+        m_async.assert_called_with(4, "foo", 1, None, copy=False)
+        self.assertEqual(result, None)
+        wrapped_with_output.cli("argv[0]", "2", "--output=foo", "--pass-through-output")
+        m_async.assert_called_with(4, "foo", 1, None, copy=True)
+        m_sync.assert_not_called()
+
 
 def setup_for_mock():
     """Function that returns a CubeList of wind_speed and wind_from_direction
@@ -396,6 +411,60 @@ def test_import_cli():
     subprocess.run([sys.executable, "-c", script], check=True)  # nosec
 
 
+def test_import_cli_lazy_subcommands():
+    """Test that `import improver.cli` does not import the CLI modules.
+
+    Subcommands are dispatched lazily, so only the requested command
+    should be imported when running one.
+    """
+    import subprocess  # nosec
+    import sys
+
+    script = (
+        "import improver.cli, sys; "
+        'assert "improver.cli.threshold" not in sys.modules, '
+        '"CLI module imported by improver.cli"'
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)  # nosec
+
+
+def test_subcommand_index_up_to_date():
+    """Test that the static subcommand index matches the CLI modules.
+
+    If this fails, regenerate the index with
+    `python -m improver.developer_tools.subcommand_index`.
+    """
+    from improver.cli._subcommand_index import SUBCOMMAND_INDEX
+    from improver.developer_tools.subcommand_index import build_subcommand_index
+
+    assert SUBCOMMAND_INDEX == build_subcommand_index()
+
+
+class Test_LazySubcommand(unittest.TestCase):
+    """Test the LazySubcommand CLI object."""
+
+    def test_help_from_index(self):
+        """Test that help comes from the index without importing the CLI."""
+        lazy = LazySubcommand("no_such_cli", "Summary.", ("cube", "--help"))
+        self.assertIs(lazy.cli, lazy)
+        self.assertEqual(lazy.helper.description, "Summary.")
+        self.assertEqual(list(lazy.helper.usages()), ["cube", "--help"])
+
+    def test_help_not_in_index(self):
+        """Test that help is obtained from the CLI when not indexed."""
+        lazy = LazySubcommand("threshold")
+        self.assertEqual(
+            lazy.helper.description,
+            "Module to apply thresholding to a parameter dataset.",
+        )
+
+    def test_call(self):
+        """Test that calling imports and runs the CLI."""
+        lazy = LazySubcommand("threshold", "Summary.", ())
+        result = lazy("improver threshold", "--help")
+        self.assertIn("Usage: improver threshold", result)
+
+
 def test_help_no_stderr():
     """Test if help writes to sys.stderr."""
     import contextlib
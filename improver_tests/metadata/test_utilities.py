@@ -7,6 +7,7 @@
 import unittest
 from datetime import datetime, timedelta
 from typing import Callable, List
+from unittest import mock
 
 import iris
 import numpy as np
@@ -18,6 +19,7 @@ from improver.metadata.constants.attributes import MANDATORY_ATTRIBUTE_DEFAULTS
 from improver.metadata.utilities import (
     check_grid_match,
     create_coordinate_hash,
+    create_grid_hash,
     create_new_diagnostic_cube,
     enforce_time_point_standard,
     generate_hash,
@@ -320,6 +322,53 @@ class Test_create_coordinate_hash(unittest.TestCase):
         self.assertNotEqual(result1, result2)
 
 
+    def test_memoized(self):
+        """Test the hash is reused for the same coordinates, and recalculated
+        when a coordinate is replaced or renamed."""
+        cube = set_up_variable_cube(np.zeros((3, 3)).astype(np.float32))
+        expected = create_coordinate_hash(cube)
+        with mock.patch("improver.metadata.utilities.generate_hash") as mock_hash:
+            self.assertEqual(create_coordinate_hash(cube), expected)
+            mock_hash.assert_not_called()
+        latitude = cube.coord("latitude")
+        cube.replace_coord(latitude.copy(points=latitude.points * 1.001))
+        replaced = create_coordinate_hash(cube)
+        self.assertNotEqual(replaced, expected)
+        cube.coord("longitude").long_name = "renamed"
+        self.assertNotEqual(create_coordinate_hash(cube), replaced)
+
+
+class Test_create_grid_hash(unittest.TestCase):
+    """Test the hash of the x and y coordinates calculated from the raw
+    coordinate values."""
+
+    def setUp(self):
+        """Set up a cube for use in testing."""
+        self.cube = set_up_variable_cube(np.zeros((3, 3)).astype(np.float32))
+
+    def test_equivalent_grids(self):
+        """Test cubes with equal coordinates have the same hash."""
+        result1 = create_grid_hash(self.cube)
+        result2 = create_grid_hash(self.cube.copy())
+        self.assertIsInstance(result1, str)
+        self.assertEqual(result1, result2)
+        self.assertNotEqual(result1, create_coordinate_hash(self.cube))
+
+    def test_variation(self):
+        """Test that changes to the points, bounds or metadata of a
+        coordinate change the hash."""
+        expected = create_grid_hash(self.cube)
+        for change in (
+            lambda coord: coord.copy(points=coord.points * 1.001),
+            lambda coord: coord.copy(bounds=np.stack([coord.points] * 2, axis=-1)),
+        ):
+            cube = self.cube.copy()
+            cube.replace_coord(change(cube.coord("latitude")))
+            self.assertNotEqual(create_grid_hash(cube), expected)
+        self.cube.coord("latitude").long_name = "renamed"
+        self.assertNotEqual(create_grid_hash(self.cube), expected)
+
+
 class Test_check_grid_match(unittest.TestCase):
     """Test the check_grid_match function."""
 
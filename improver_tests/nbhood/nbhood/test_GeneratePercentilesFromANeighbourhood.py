@@ -4,7 +4,9 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the nbhood.nbhood.GeneratePercentilesFromANeighbourhood plugin."""
 
+import importlib
 import unittest
+from unittest import mock, skipIf
 
 import iris
 import numpy as np
@@ -18,6 +20,15 @@ from improver.synthetic_data.set_up_test_cubes import (
     set_up_variable_cube,
 )
 
+numba_installed = True
+try:
+    importlib.util.find_spec("numba")
+    from improver.nbhood.numba_utilities import (  # noqa: F401
+        fast_neighbourhood_percentiles,
+    )
+except ImportError:
+    numba_installed = False
+
 
 class Test_make_percentile_cube(IrisTest):
     """Test the make_percentile_cube method from
@@ -298,6 +309,64 @@ class Test_pad_and_unpad_cube(IrisTest):
         ).pad_and_unpad_cube(self.cube, kernel)
         self.assertArrayAlmostEqual(result.data, expected)
 
+    def test_histogram_exact(self):
+        """Test percentiles from histograms are exact when the data have no
+        more distinct values than there are bins."""
+        kernel = np.array([[0.0, 1.0, 0.0], [1.0, 1.0, 1.0], [0.0, 1.0, 0.0]])
+        self.cube.data[2, 2] = 0
+        self.cube.data[0, 1] = 0.5
+        plugin = GeneratePercentilesFromANeighbourhood(2000, percentiles=[10, 50, 90])
+        expected = plugin.pad_and_unpad_cube(self.cube, kernel)
+        plugin = GeneratePercentilesFromANeighbourhood(
+            2000, percentiles=[10, 50, 90], histogram_bins=8
+        )
+        result = plugin.pad_and_unpad_cube(self.cube, kernel)
+        self.assertArrayAlmostEqual(result.data, expected.data)
+
+    def test_histogram_approximate(self):
+        """Test approximate percentiles from histograms are within one bin
+        width of the exact percentiles."""
+        kernel = np.ones((5, 5))
+        cube = set_up_variable_cube(
+            np.random.default_rng(0).random((12, 12), dtype=np.float32),
+            spatial_grid="equalarea",
+        )
+        plugin = GeneratePercentilesFromANeighbourhood(2000, percentiles=[5, 50, 95])
+        expected = plugin.pad_and_unpad_cube(cube, kernel)
+        plugin = GeneratePercentilesFromANeighbourhood(
+            2000, percentiles=[5, 50, 95], histogram_bins=20
+        )
+        result = plugin.pad_and_unpad_cube(cube, kernel)
+        bin_width = np.ptp(cube.data) / 20
+        np.testing.assert_allclose(result.data, expected.data, atol=bin_width)
+
+    @skipIf(not (numba_installed), "numba not installed")
+    def test_sorted_window_matches_numpy(self):
+        """Test the sliding sorted window gives the same percentiles as
+        numpy.percentile, for an irregular kernel."""
+        kernel = np.array(
+            [
+                [0.0, 1.0, 1.0, 0.0, 1.0],
+                [1.0, 1.0, 0.0, 1.0, 1.0],
+                [0.0, 1.0, 1.0, 1.0, 0.0],
+            ]
+        )
+        cube = set_up_variable_cube(
+            np.random.default_rng(0).random((10, 12), dtype=np.float32),
+            spatial_grid="equalarea",
+        )
+        plugin = GeneratePercentilesFromANeighbourhood(2000, percentiles=[0, 33, 100])
+        result = plugin.pad_and_unpad_cube(cube, kernel)
+        with mock.patch.dict("sys.modules", numba=None):
+            expected = plugin.pad_and_unpad_cube(cube, kernel)
+        np.testing.assert_allclose(result.data, expected.data, rtol=1e-6)
+
+    def test_histogram_bins_error(self):
+        """Test an error is raised if the number of bins is not positive."""
+        msg = "The number of histogram bins must be positive, not 0"
+        with self.assertRaisesRegex(ValueError, msg):
+            GeneratePercentilesFromANeighbourhood(2000, histogram_bins=0)
+
 
 class Test_process(IrisTest):
     """Test the process method within the plugin to calculate percentile values
@@ -71,3 +71,27 @@ def test___init___exceptions(
     kwargs.update(dict(lead_times=[1, 2, 3], radii=[1, 2, 3]))
     with pytest.raises(RuntimeError, match=exception_msg):
         MetaNeighbourhood(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "neighbourhood_output, lead_times, exception_msg",
+    [
+        ("probabilities", [1, 2], "multiple_radii cannot be used with lead_times"),
+        (
+            "percentiles",
+            None,
+            'multiple_radii can only be used with neighbourhood_output="probabilities"',
+        ),
+    ],
+)
+def test___init___multiple_radii_exceptions(
+    neighbourhood_output, lead_times, exception_msg
+):
+    """Exception when multiple_radii is used with incompatible options"""
+    with pytest.raises(RuntimeError, match=exception_msg):
+        MetaNeighbourhood(
+            neighbourhood_output,
+            radii=[1, 2],
+            lead_times=lead_times,
+            multiple_radii=True,
+        )
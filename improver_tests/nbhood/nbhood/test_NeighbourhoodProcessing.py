@@ -4,15 +4,20 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the nbhood.NeighbourhoodProcessing plugin."""
 
+import os
 import unittest
+from unittest import mock
 
 import numpy as np
 from iris.coords import CellMethod
-from iris.cube import Cube
+from iris.cube import Cube, CubeList
 from iris.tests import IrisTest
 
 from improver.nbhood.nbhood import NeighbourhoodProcessing
-from improver.synthetic_data.set_up_test_cubes import set_up_probability_cube
+from improver.synthetic_data.set_up_test_cubes import (
+    add_coordinate,
+    set_up_probability_cube,
+)
 
 
 class Test__init__(IrisTest):
@@ -415,6 +420,115 @@ class Test_process(IrisTest):
         self.assertTupleEqual(result.cell_methods, self.cube.cell_methods)
         self.assertDictEqual(result.attributes, self.cube.attributes)
 
+    def test_batched_matches_slices(self):
+        """Test that processing all x-y-slices together gives the same result
+        as processing each slice in turn, for masked data with and without a
+        mask cube, and when a memory budget limits the batches to one slice."""
+        cube = set_up_probability_cube(
+            np.zeros((3, 7, 6), dtype=np.float32),
+            thresholds=np.array([278, 281, 284], dtype=np.float32),
+            spatial_grid="equalarea",
+        )
+        cube = add_coordinate(cube, [0, 1], "realization", dtype=np.int32)
+        rng = np.random.default_rng(0)
+        cube.data = np.ma.masked_less(rng.random(cube.shape).astype(np.float32), 0.1)
+        mask = cube[0, 0].copy(data=np.ones((7, 6), dtype=np.float32))
+        mask.data[:2, :3] = 0
+        for sum_only, mask_cube, budget in (
+            (False, None, None),
+            (False, mask, None),
+            (True, mask, None),
+            (False, mask, "1"),
+        ):
+            plugin = NeighbourhoodProcessing("square", 4000, sum_only=sum_only)
+            with mock.patch.dict(
+                os.environ, {} if budget is None else {"IMPROVER_MAX_MEMORY": budget}
+            ):
+                result = plugin(cube, mask_cube=mask_cube)
+            mask_data = None if mask_cube is None else mask_cube.data
+            for index in np.ndindex(cube.shape[:2]):
+                expected = plugin._calculate_neighbourhood(cube.data[index], mask_data)
+                self.assertArrayAlmostEqual(result.data[index], expected)
+                self.assertArrayEqual(result.data.mask[index], expected.mask)
+            self.assertEqual(result.metadata, cube.metadata)
+
+    def test_large_circular_neighbourhood(self):
+        """Test that large circular neighbourhoods, for which sums are
+        calculated along the chords of the circle, match the results of
+        direct correlation, including for masked data."""
+        cube = set_up_probability_cube(
+            np.zeros((2, 30, 30), dtype=np.float32),
+            thresholds=np.array([278, 281], dtype=np.float32),
+            spatial_grid="equalarea",
+        )
+        rng = np.random.default_rng(0)
+        data = (rng.random(cube.shape) > 0.6).astype(np.float32)
+        cube.data = np.ma.masked_array(data, mask=rng.random(cube.shape) > 0.9)
+        plugin = NeighbourhoodProcessing("circular", 14000)
+        result = plugin(cube)
+        with mock.patch("improver.nbhood.nbhood._CHORD_SUM_MIN_SIZE", np.inf):
+            expected = plugin(cube)
+        self.assertArrayAlmostEqual(result.data, expected.data, decimal=6)
+        self.assertArrayEqual(result.data.mask, expected.data.mask)
+
+    def test_multiple_radii(self):
+        """Test that a list of radii without lead times gives the result for
+        each radius, matching processing with each radius in turn."""
+        self.cube.data = np.ma.masked_array(self.cube.data)
+        self.cube.data[1, 0, 0] = np.ma.masked
+        mask = self.cube[0].copy(data=np.ones((5, 5), dtype=np.float32))
+        mask.data[4, :] = 0
+        for neighbourhood_method in ("square", "circular"):
+            result = NeighbourhoodProcessing(neighbourhood_method, [4000, 2000])(
+                self.cube, mask_cube=mask
+            )
+            self.assertIsInstance(result, CubeList)
+            self.assertEqual(len(result), 2)
+            for radius, result_cube in zip([4000, 2000], result):
+                expected = NeighbourhoodProcessing(neighbourhood_method, radius)(
+                    self.cube, mask_cube=mask
+                )
+                self.assertEqual(result_cube.metadata, expected.metadata)
+                self.assertArrayAlmostEqual(result_cube.data, expected.data)
+                self.assertArrayEqual(result_cube.data.mask, expected.data.mask)
+
+
+    def test_land_and_sea(self):
+        """Test that processing land and sea together matches processing with
+        the land mask and the sea mask separately and combining the results,
+        for masked data."""
+        rng = np.random.default_rng(0)
+        data = rng.random(self.cube.shape).astype(np.float32)
+        self.cube.data = np.ma.masked_array(data, mask=data > 0.9)
+        land = self.cube[0].copy(data=np.zeros((5, 5), dtype=np.int32))
+        land.data[:, :2] = 1
+        land.data[1, 2] = 1
+        sea = land.copy(data=1 - land.data)
+        for neighbourhood_method, sum_only in (
+            ("square", False),
+            ("square", True),
+            ("circular", False),
+        ):
+            with self.subTest(method=neighbourhood_method, sum_only=sum_only):
+                result = NeighbourhoodProcessing(
+                    neighbourhood_method, 2000, sum_only=sum_only, land_and_sea=True
+                )(self.cube, mask_cube=land)
+                plugin = NeighbourhoodProcessing(
+                    neighbourhood_method, 2000, sum_only=sum_only
+                )
+                expected = np.ma.where(
+                    land.data, plugin(self.cube, land).data, plugin(self.cube, sea).data
+                )
+                self.assertEqual(result.metadata, self.cube.metadata)
+                self.assertArrayAlmostEqual(result.data, expected)
+                self.assertArrayEqual(result.data.mask, self.cube.data.mask)
+
+    def test_land_and_sea_without_mask(self):
+        """Test that an error is raised if no land-sea mask is given."""
+        plugin = NeighbourhoodProcessing("square", 2000, land_and_sea=True)
+        with self.assertRaisesRegex(ValueError, "land-sea mask cube is required"):
+            plugin(self.cube)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,8 +4,10 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the nbhood.RecursiveFilter plugin."""
 
+import importlib
 import unittest
 from datetime import timedelta
+from unittest import mock, skipIf
 
 import iris
 import numpy as np
@@ -21,6 +23,13 @@ from improver.synthetic_data.set_up_test_cubes import (
 from improver.utilities.cube_manipulation import enforce_coordinate_ordering
 from improver.utilities.pad_spatial import pad_cube_with_halo
 
+numba_installed = True
+try:
+    importlib.util.find_spec("numba")
+    from improver.nbhood.numba_utilities import fast_recursive_filter  # noqa: F401
+except ImportError:
+    numba_installed = False
+
 
 def _mean_points(points):
     """Create an array of the mean of adjacent points in original array"""
@@ -565,5 +574,34 @@ class Test_process(Test_RecursiveFilter):
             )
 
 
+    @mock.patch.dict("sys.modules", numba=None)
+    @mock.patch.object(RecursiveFilter, "_run_recursion", autospec=True)
+    def test_numpy_used_without_numba(self, run_recursion):
+        """Test that each slice is filtered by _run_recursion if numba is not
+        installed."""
+        run_recursion.side_effect = lambda cube, *args: cube
+        plugin = RecursiveFilter(iterations=self.iterations)
+        plugin(self.prob_cube, smoothing_coefficients=self.smoothing_coefficients)
+        self.assertEqual(run_recursion.call_count, 2)
+
+    @skipIf(not (numba_installed), "numba not installed")
+    def test_numba_matches_numpy(self):
+        """Test that the compiled filter gives the same result as the NumPy
+        implementation for several slices and iterations."""
+        rng = np.random.default_rng(0)
+        self.prob_cube.data = rng.random(self.prob_cube.shape).astype(np.float32)
+        plugin = RecursiveFilter(iterations=3)
+        result = plugin(
+            self.prob_cube.copy(), smoothing_coefficients=self.smoothing_coefficients
+        )
+        with mock.patch.dict("sys.modules", numba=None):
+            expected = plugin(
+                self.prob_cube.copy(),
+                smoothing_coefficients=self.smoothing_coefficients,
+            )
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result.data, expected.data, rtol=1e-6)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -397,6 +397,27 @@ class Test_process(unittest.TestCase):
         self.assertEqual(result.coords(), self.multi_threshold_cube.coords())
         self.assertEqual(result.metadata, self.multi_threshold_cube.metadata)
 
+    def test_collapse_matches_collapse_mask_coord(self):
+        """Test the weighted mean accumulated over the masks matches collapsing
+        the result of neighbourhood processing with each mask, for masked data
+        with values between 0 and 1."""
+        cube = iris.util.squeeze(self.cube)
+        data = np.random.default_rng(0).random((3, 3), dtype=np.float32)
+        cube.data = np.ma.masked_array(data, mask=data > 0.8)
+        for method in ("square", "circular"):
+            with self.subTest(method=method):
+                plugin = ApplyNeighbourhoodProcessingWithAMask(
+                    "topographic_zone", method, 2000
+                )
+                uncollapsed = plugin(cube.copy(), self.mask_cube)
+                plugin.collapse_weights = self.weights_cube
+                expected = plugin.collapse_mask_coord(uncollapsed)
+                result = plugin(cube.copy(), self.mask_cube)
+                assert_allclose(
+                    result.data.data, expected.data.data, rtol=1e-6, equal_nan=True
+                )
+                assert_array_equal(result.data.mask, expected.data.mask)
+
 
 if __name__ == "__main__":
     unittest.main()
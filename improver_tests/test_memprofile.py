@@ -0,0 +1,53 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the memory sampling utilities."""
+
+import csv
+import time
+
+from improver import BasePlugin, trace
+from improver.memprofile import memory_profile_decorator, read_memory
+
+
+class Sleeper(BasePlugin):
+    """Plugin that waits for long enough to be sampled."""
+
+    def process(self):
+        time.sleep(0.1)
+        return 1
+
+
+def test_read_memory():
+    """Test that the resident memory is positive and unique memory, where
+    available, does not exceed it."""
+    rss, uss = read_memory()
+    assert rss > 0
+    assert uss is None or 0 < uss <= rss
+
+
+def test_sampling(tmp_path):
+    """Test that samples are tagged with the running plugin, that a peak
+    report is written and that the plugin record is removed afterwards."""
+    prefix = str(tmp_path / "mem")
+
+    def run():
+        time.sleep(0.05)
+        return Sleeper()()
+
+    assert memory_profile_decorator(run, prefix, interval=0.01)() == 1
+    assert trace.ACTIVE_TRACER is None
+    with open(f"{prefix}_TIMELINE.csv") as timeline:
+        rows = list(csv.DictReader(timeline))
+    assert [float(row["time_s"]) for row in rows] == sorted(
+        float(row["time_s"]) for row in rows
+    )
+    assert {row["plugins"] for row in rows} == {"", "Sleeper"}
+    with open(f"{prefix}_PEAKS") as peaks:
+        lines = peaks.read().splitlines()
+    assert lines[0].split()[0] == "rss"
+    assert sorted(line.split(None, 4)[-1] for line in lines[1:]) == [
+        "(no plugin)",
+        "Sleeper",
+    ]
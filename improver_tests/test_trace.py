@@ -0,0 +1,85 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the plugin tracing utilities."""
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+from improver import BasePlugin, PostProcessingPlugin
+from improver import trace as trace_module
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.trace import trace_start, trace_stop
+
+
+class Inner(BasePlugin):
+    """Plugin doubling its input."""
+
+    def process(self, cube):
+        return cube * 2
+
+
+class Outer(PostProcessingPlugin):
+    """Post-processing plugin calling another plugin."""
+
+    def process(self, cube):
+        return Inner()(cube)
+
+
+@pytest.fixture
+def tracer():
+    """Active tracer, stopped at the end of the test if still active."""
+    tracer = trace_start()
+    yield tracer
+    trace_module.ACTIVE_TRACER = None
+
+
+@pytest.fixture
+def cube():
+    """Cube of 3x3 points."""
+    return set_up_variable_cube(np.ones((3, 3), dtype=np.float32))
+
+
+def test_nested_calls(tracer, cube):
+    """Test that nested plugin calls are recorded with the shapes and types
+    of their inputs and outputs, and that the outer call encloses the
+    inner one."""
+    Outer()(cube)
+    inner, outer = tracer.events
+    assert [inner["name"], outer["name"]] == ["Inner", "Outer"]
+    assert inner["args"]["inputs"] == ["air_temperature (3, 3) float32"]
+    assert outer["args"]["output"] == "air_temperature (3, 3) float32"
+    assert outer["ts"] <= inner["ts"]
+    assert outer["ts"] + outer["dur"] >= inner["ts"] + inner["dur"]
+    assert outer["args"]["self_s"] == pytest.approx(
+        (outer["dur"] - inner["dur"]) * 1e-6
+    )
+
+
+def test_not_recorded_when_inactive(cube):
+    """Test that plugins run without recording when no tracer is active."""
+    assert trace_module.ACTIVE_TRACER is None
+    result = Outer()(cube)
+    assert np.allclose(result.data, 2)
+
+
+def test_trace_stop(tracer, cube, tmp_path):
+    """Test that stopping writes a Chrome trace and prints a summary, and
+    that later calls are not recorded."""
+    Outer()(cube)
+    filename = tmp_path / "trace.json"
+    stream = io.StringIO()
+    trace_stop(tracer, dump_filename=str(filename), stream=stream)
+    Outer()(cube)
+
+    trace = json.loads(filename.read_text())
+    assert [event["name"] for event in trace["traceEvents"]] == ["Inner", "Outer"]
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
+    lines = stream.getvalue().splitlines()
+    assert lines[0].split()[:3] == ["plugin", "calls", "total"]
+    assert {line.split()[0] for line in lines[1:]} == {"Inner", "Outer"}
+    assert len(tracer.events) == 2
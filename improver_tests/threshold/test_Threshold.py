@@ -4,6 +4,7 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Unit tests for the threshold.Threshold plugin."""
 
+import dask.array as da
 import numpy as np
 import pytest
 from iris.coords import CellMethod, DimCoord
@@ -822,6 +823,52 @@ def test_percentile_collapse(custom_cube):
     assert (result.coord(var_name="threshold").points == [0.5, 1.5]).all()
 
 
+@pytest.mark.parametrize(
+    "n_realizations,n_times,data",
+    [(4, 1, np.linspace(0, 1, 36, dtype=np.float32).reshape((4, 3, 3)))],
+)
+@pytest.mark.parametrize("collapse_coord", (None, "realization"))
+def test_memory_budget(custom_cube, collapse_coord, monkeypatch):
+    """Test that processing batches of realizations within a memory budget
+    gives the same result as processing each realization in turn, including
+    where some points are masked."""
+    custom_cube.data = np.ma.masked_array(custom_cube.data)
+    custom_cube.data[:, 0, 0] = np.ma.masked
+    custom_cube.data[1:, 1, 1] = np.ma.masked
+    kwargs = {"threshold_values": [0.2, 0.5, 0.8], "collapse_coord": collapse_coord}
+    expected = Threshold(fuzzy_factor=0.5, **kwargs)(custom_cube.copy())
+    monkeypatch.setenv("IMPROVER_MAX_MEMORY", "1M")
+    result = Threshold(fuzzy_factor=0.5, **kwargs)(custom_cube)
+    assert result == expected
+    np.testing.assert_array_equal(result.data.mask, expected.data.mask)
+
+
+@pytest.mark.parametrize(
+    "n_realizations,n_times,data",
+    [(4, 1, np.linspace(0, 1, 36, dtype=np.float32).reshape((4, 3, 3)))],
+)
+@pytest.mark.parametrize("max_memory", (None, "1M"))
+@pytest.mark.parametrize("fill_masked", (None, 0.6))
+def test_lazy_collapse(custom_cube, max_memory, fill_masked, monkeypatch):
+    """Test that a lazy cube is thresholded and collapsed slice by slice,
+    giving the same result as a realised cube, without realising the data
+    of the input cube."""
+    custom_cube.data = np.ma.masked_array(custom_cube.data)
+    custom_cube.data[1:, 1, 1] = np.ma.masked
+    kwargs = {
+        "threshold_values": [0.2, 0.5, 0.8],
+        "collapse_coord": "realization",
+        "fill_masked": fill_masked,
+    }
+    expected = Threshold(**kwargs)(custom_cube.copy())
+    if max_memory:
+        monkeypatch.setenv("IMPROVER_MAX_MEMORY", max_memory)
+    lazy_cube = custom_cube.copy(data=da.from_array(custom_cube.data, chunks=1))
+    result = Threshold(**kwargs)(lazy_cube)
+    assert lazy_cube.has_lazy_data()
+    assert result == expected
+
+
 def test_threshold_unit_conversion(default_cube):
     """Test threshold coordinate points after undergoing unit conversion.
     Specifically ensuring that small floating point values have no floating
@@ -837,3 +884,36 @@ def test_threshold_unit_conversion(default_cube):
         == np.array([3e-5, 9.0e-05, 1e-4], dtype="float32")
     ).all()
     assert result.coord(var_name="threshold").units == "mm hr-1"
+
+
+@pytest.mark.parametrize(
+    "n_realizations,n_times,data",
+    [(4, 1, np.linspace(0, 1, 36, dtype=np.float32).reshape((4, 3, 3)))],
+)
+@pytest.mark.parametrize("comparison_operator", (">", ">=", "<", "<="))
+def test_truth_values_match_each_threshold(custom_cube, comparison_operator):
+    """Test that the truth values calculated for all thresholds at once match
+    those calculated for each threshold in turn, for unsorted thresholds with
+    and without fuzzy bounds, data values equal to thresholds, and masked
+    points."""
+    custom_cube.data[0, 0, :] = [0.2, 0.5, 0.8]
+    custom_cube.data = np.ma.masked_less(custom_cube.data, 0.1)
+    threshold_config = {
+        "0.8": [0.6, 1.0],
+        "0.2": [0.2, 0.2],
+        "0.5": [0.5, 0.5],
+        "0.4": [0.3, 0.6],
+    }
+    plugin = Threshold(
+        threshold_config=threshold_config, comparison_operator=comparison_operator
+    )
+    result = plugin._calculate_truth_values(custom_cube, slice(None))
+    assert result.dtype == np.float32
+    for index, (threshold, bounds) in enumerate(
+        zip(plugin.thresholds, plugin.fuzzy_bounds)
+    ):
+        expected = plugin._calculate_truth_value(custom_cube, threshold, bounds)
+        np.testing.assert_array_equal(result[index].mask, expected.mask)
+        np.testing.assert_array_equal(
+            result[index][~expected.mask], expected[~expected.mask]
+        )
@@ -31,6 +31,7 @@ from improver.utilities.spatial import (
     distance_to_number_of_grid_cells,
     get_grid_y_x_values,
     lat_lon_determine,
+    maxima_within_vicinity,
     maximum_within_vicinity,
     number_of_grid_cells_to_distance,
     rename_vicinity_cube,
@@ -777,3 +778,36 @@ def test_maximum_within_vicinity(grid, radius, landmask, expected_result):
     assert result.dtype == np.float64
     if np.ma.is_masked(reference):
         assert_array_equal(reference.mask, result.mask)
+
+
+@pytest.mark.parametrize("landmask", (False, True))
+@pytest.mark.parametrize("circular", (False, True))
+def test_maxima_within_vicinity(circular, landmask):
+    """Test that maxima_within_vicinity matches the maximum over a square or
+    circular footprint for each of several radii, applied to each y-x slice
+    of the grid in turn, with land and sea points processed separately if a
+    land mask is given."""
+    rng = np.random.default_rng(0)
+    grid = rng.random((2, 9, 11)).astype(np.float32)
+    mask = rng.random((9, 11)) > 0.5 if landmask else None
+    radii = [3, 0, 2]
+    result = maxima_within_vicinity(grid, radii, mask, circular=circular)
+
+    for radius, radius_result in zip(radii, result):
+        offsets = np.arange(-radius, radius + 1)
+        footprint = np.ones((offsets.size, offsets.size), dtype=bool)
+        if circular:
+            footprint = offsets[:, None] ** 2 + offsets**2 <= radius**2
+        expected = np.empty_like(grid)
+        for index in np.ndindex(grid.shape):
+            y, x = index[-2:]
+            y0, y1 = max(y - radius, 0), min(y + radius + 1, grid.shape[-2])
+            x0, x1 = max(x - radius, 0), min(x + radius + 1, grid.shape[-1])
+            within = footprint[
+                y0 - y + radius : y1 - y + radius, x0 - x + radius : x1 - x + radius
+            ].copy()
+            if landmask:
+                within &= mask[y0:y1, x0:x1] == mask[y, x]
+            expected[index] = grid[index[0], y0:y1, x0:x1][within].max()
+        assert radius_result.dtype == np.float32
+        assert_array_equal(radius_result, expected)
@@ -202,6 +202,28 @@ def test_different_distance(cube, kwargs):
     assert np.allclose(result.data, expected)
 
 
+def test_circular(cube):
+    """Test for binary events to determine where there is an occurrence
+    within a circular vicinity."""
+    expected = np.array(
+        [
+            [1.0, 1.0, 1.0, 1.0, 0.0],
+            [1.0, 1.0, 1.0, 1.0, 1.0],
+            [0.0, 1.0, 1.0, 1.0, 1.0],
+            [0.0, 0.0, 1.0, 1.0, 1.0],
+            [0.0, 0.0, 0.0, 1.0, 0.0],
+        ]
+    )
+    cube.data[0, 1] = 1.0
+    cube.data[2, 3] = 1.0
+    plugin = OccurrenceWithinVicinity(
+        grid_point_radii=[2 * GRID_POINT_RADIUS], circular=True
+    )
+    result = plugin.process(cube)
+    assert isinstance(result, Cube)
+    assert np.allclose(result.data, expected)
+
+
 def test_masked_data(cube):
     """Test masked values are ignored in OccurrenceWithinVicinity."""
     expected = np.array(
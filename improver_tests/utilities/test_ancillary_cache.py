@@ -0,0 +1,109 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for utilities.ancillary_cache."""
+
+import os
+
+import numpy as np
+import pytest
+
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.ancillary_cache import (
+    CACHE_DIR_ENV,
+    AncillaryCache,
+    cache_key,
+    cached_arrays,
+    get_ancillary_cache,
+)
+
+
+@pytest.fixture
+def cube():
+    """Cube on a 4x5 equal area grid."""
+    return set_up_variable_cube(
+        np.zeros((4, 5), dtype=np.float32), spatial_grid="equalarea"
+    )
+
+
+def test_cache_key(cube):
+    """Test that keys depend on the grid, array contents and parameters but
+    not on cube data."""
+    key = cache_key("name", cube, np.arange(3), 1)
+    other = cube.copy(data=np.ones_like(cube.data))
+    assert cache_key("name", other, np.arange(3), 1) == key
+    assert cache_key("name", cube, np.arange(3), 2) != key
+    assert cache_key("name", cube, np.arange(1, 4), 1) != key
+    assert cache_key("name", cube[1:], np.arange(3), 1) != key
+
+
+def test_put_get(tmp_path):
+    """Test that stored arrays are returned read-only and memory mapped."""
+    cache = AncillaryCache(tmp_path)
+    assert cache.get("key") is None
+    arrays = {"a": np.arange(4), "b": np.ones((2, 2), dtype=np.float32)}
+    result = cache.put("key", arrays)
+    for name, array in arrays.items():
+        assert isinstance(result[name], np.memmap)
+        np.testing.assert_array_equal(result[name], array)
+        assert result[name].dtype == array.dtype
+        assert not result[name].flags.writeable
+    assert set(cache.get("key")) == {"a", "b"}
+    assert not [path for path in tmp_path.iterdir() if path.name.startswith(".")]
+
+
+def test_evict_least_recently_used(tmp_path):
+    """Test that the least recently used entries are removed when the cache
+    exceeds its maximum size."""
+    array = np.zeros(1000, dtype=np.float64)
+    cache = AncillaryCache(tmp_path, max_size=2.5 * array.nbytes)
+    for i, key in enumerate(["first", "second"]):
+        cache.put(key, {"a": array})
+        os.utime(tmp_path / key, (i, i))
+    cache.get("first")
+    cache.put("third", {"a": array})
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
+    assert cache.size() <= cache.max_size
+
+
+def test_cached_arrays(tmp_path, cube):
+    """Test that arrays are calculated once and then read from the cache."""
+    calls = []
+
+    def calculate():
+        calls.append(1)
+        return {"a": np.arange(3)}
+
+    cache = AncillaryCache(tmp_path)
+    for _ in range(2):
+        result = cached_arrays("name", [cube, 1], calculate, cache=cache)
+        np.testing.assert_array_equal(result["a"], np.arange(3))
+    assert len(calls) == 1
+
+
+def test_cached_arrays_disabled(monkeypatch, cube):
+    """Test that arrays are calculated every time when no cache is configured."""
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+    assert get_ancillary_cache() is None
+    calls = []
+
+    def calculate():
+        calls.append(1)
+        return {"a": np.arange(3)}
+
+    for _ in range(2):
+        cached_arrays("name", [cube], calculate)
+    assert len(calls) == 2
+
+
+def test_get_ancillary_cache(monkeypatch, tmp_path):
+    """Test the cache is configured from the environment."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    monkeypatch.setenv("IMPROVER_ANCILLARY_CACHE_SIZE", "1000")
+    cache = get_ancillary_cache()
+    assert cache.directory == tmp_path / "cache"
+    assert cache.max_size == 1000
+    assert cache.directory.is_dir()
@@ -0,0 +1,102 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for utilities.batch."""
+
+import numpy as np
+import pytest
+
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.batch import output_path_from_template, run_batch
+from improver.utilities.load import load_cube
+from improver.utilities.save import save_netcdf
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    """Three temperature files differing by value, and an additive
+    field shared between items."""
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    for i in range(3):
+        data = np.full((1, 3, 3), 270 + i, dtype=np.float32)
+        save_netcdf(
+            set_up_variable_cube(data, spatial_grid="equalarea"),
+            str(in_dir / f"t{i}.nc"),
+        )
+    data = np.ones((1, 3, 3), dtype=np.float32)
+    shared = str(tmp_path / "shared.nc")
+    save_netcdf(set_up_variable_cube(data, spatial_grid="equalarea"), shared)
+    return in_dir, shared
+
+
+@pytest.mark.parametrize(
+    "template, expected",
+    (
+        ("out/{stem}_clip.nc", "out/t0_clip.nc"),
+        ("{parent}/out_{name}", "in/out_t0.nc"),
+    ),
+)
+def test_output_path_from_template(template, expected):
+    """Test the fields available in output templates."""
+    assert output_path_from_template(template, "in/t0.nc") == expected
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_run_batch(inputs, tmp_path, workers):
+    """Test that the command is run for each input, with the input passed as
+    the first argument if there is no placeholder."""
+    in_dir, _ = inputs
+    template = str(tmp_path / "{stem}_clip.nc")
+    results = run_batch(
+        "clip", ["--max-value", "271"], str(in_dir / "*.nc"), template, workers
+    )
+    assert [result.ok for result in results] == [True] * 3
+    for i, result in enumerate(results):
+        assert result.output_path == str(tmp_path / f"t{i}_clip.nc")
+        assert result.elapsed > 0
+        expected = min(270 + i, 271)
+        np.testing.assert_array_equal(load_cube(result.output_path).data, expected)
+
+
+def test_run_batch_shared(inputs, tmp_path):
+    """Test that the input placeholder is replaced and shared ancillaries
+    are passed to every item."""
+    in_dir, shared = inputs
+    results = run_batch(
+        "combine",
+        [shared, "{input}", "--operation", "+"],
+        str(in_dir / "*.nc"),
+        str(tmp_path / "{stem}_sum.nc"),
+        workers=2,
+        shared=[shared],
+    )
+    for i, result in enumerate(results):
+        assert result.ok
+        np.testing.assert_array_equal(load_cube(result.output_path).data, 271 + i)
+
+
+def test_run_batch_failure(inputs, tmp_path):
+    """Test that a failing item is reported without stopping the others."""
+    in_dir, _ = inputs
+    (in_dir / "t1.nc").write_text("not netCDF")
+    results = run_batch(
+        "clip", [], str(in_dir / "*.nc"), str(tmp_path / "{stem}.nc"), workers=2
+    )
+    assert [result.ok for result in results] == [True, False, True]
+    assert str(results[1]).startswith("FAILED")
+    assert not (tmp_path / "t1.nc").exists()
+
+
+@pytest.mark.parametrize(
+    "pattern, template, message",
+    (
+        ("missing/*.nc", "{stem}.nc", "No input files match"),
+        ("in/*.nc", "out.nc", "different output path"),
+    ),
+)
+def test_run_batch_errors(inputs, tmp_path, pattern, template, message):
+    """Test errors for unmatched inputs and clashing outputs."""
+    with pytest.raises(ValueError, match=message):
+        run_batch("clip", [], str(tmp_path / pattern), template)
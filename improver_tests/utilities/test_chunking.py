@@ -0,0 +1,87 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for running plugins over chunks of a leading dimension."""
+
+import dask.array as da
+import iris
+import numpy as np
+import pytest
+
+from improver import BasePlugin
+from improver.nbhood.nbhood import NeighbourhoodProcessing
+from improver.synthetic_data.set_up_test_cubes import set_up_probability_cube
+from improver.utilities.chunking import ChunkedExecution
+from improver.utilities.spatial import OccurrenceWithinVicinity
+
+
+class CollapseThreshold(BasePlugin):
+    """Plugin which wrongly declares that it can be chunked."""
+
+    def chunk_coords(self, cube):
+        return ["air_temperature"]
+
+    def process(self, cube):
+        return cube.collapsed("air_temperature", iris.analysis.MAX)
+
+
+@pytest.fixture(name="cube")
+def cube_fixture():
+    """Probability cube with lazy data on a 2 km equal area grid."""
+    rng = np.random.default_rng(0)
+    data = (rng.random((5, 20, 20)) > 0.7).astype(np.float32)
+    cube = set_up_probability_cube(
+        data,
+        np.array([273.0, 274.0, 275.0, 276.0, 277.0], dtype=np.float32),
+        spatial_grid="equalarea",
+        x_grid_spacing=2000,
+        y_grid_spacing=2000,
+    )
+    cube.data = da.from_array(cube.data, chunks=(1, 20, 20))
+    return cube
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 5))
+@pytest.mark.parametrize(
+    "plugin",
+    (
+        NeighbourhoodProcessing("square", 4000),
+        OccurrenceWithinVicinity(grid_point_radii=[1, 2]),
+    ),
+)
+def test_matches_unchunked(cube, plugin, chunk_size):
+    """Test the chunked result is lazy and matches the unchunked result."""
+    expected = plugin(cube.copy())
+    result = ChunkedExecution(plugin, chunk_size)(cube)
+    if chunk_size < 5:
+        assert result.has_lazy_data()
+    assert result.metadata == expected.metadata
+    assert result.coords() == expected.coords()
+    np.testing.assert_allclose(result.data, expected.data)
+
+
+def test_environment(cube, monkeypatch):
+    """Test plugins which declare their chunk coordinates are chunked when
+    enabled by the environment."""
+    plugin = NeighbourhoodProcessing("square", 4000)
+    expected = plugin(cube.copy())
+    monkeypatch.setenv("IMPROVER_CHUNKED_EXECUTION", "2")
+    result = plugin(cube)
+    assert result.has_lazy_data()
+    np.testing.assert_allclose(result.data, expected.data)
+    # realised inputs are processed as normal
+    result = plugin(cube.copy(data=cube.data))
+    assert not result.has_lazy_data()
+
+
+def test_dimension_removed_error(cube):
+    """Test an error is raised if the plugin removes the chunked dimension."""
+    with pytest.raises(ValueError, match="does not keep the air_temperature"):
+        ChunkedExecution(CollapseThreshold())(cube)
+
+
+def test_chunk_size_error():
+    """Test an error is raised for a chunk size which is not positive."""
+    with pytest.raises(ValueError, match="Chunk size must be positive"):
+        ChunkedExecution(CollapseThreshold(), 0)
@@ -0,0 +1,137 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for utilities.cli_server."""
+
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from improver.utilities.cli_server import (
+    CommandServer,
+    client_main,
+    run_command,
+    send_command,
+)
+
+
+def _pid_job(argv, cwd=None):
+    """Job reporting the worker process id and the arguments received."""
+    return 0, f"{os.getpid()} {' '.join(argv)} {cwd}", ""
+
+
+@pytest.fixture
+def server_factory(tmp_path):
+    """Start servers running in a background thread, shutting them down
+    at the end of the test."""
+    servers = []
+
+    def _start(**kwargs):
+        socket_path = str(tmp_path / f"server{len(servers)}.sock")
+        server = CommandServer(socket_path, **kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append((server, thread))
+        return socket_path
+
+    yield _start
+    for server, thread in servers:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_run_command_help():
+    """Test that a command is run and its output captured."""
+    status, out, err = run_command(["help"])
+    assert status == 0
+    assert "IMPROVER NWP post-processing toolbox" in out
+    assert err == ""
+
+
+def test_run_command_unknown():
+    """Test that an argument error gives status 2 and an error message."""
+    status, out, err = run_command(["no-such-command"])
+    assert status == 2
+    assert out == ""
+    assert 'Unknown command "no-such-command"' in err
+
+
+def test_run_command_exception(tmp_path):
+    """Test that an exception raised by the command gives status 1 and
+    a traceback."""
+    status, _, err = run_command(["threshold", str(tmp_path / "missing.nc")])
+    assert status == 1
+    assert "Traceback" in err
+
+
+def test_round_trip(server_factory, tmp_path):
+    """Test that a command is sent to the server, run in the client's
+    working directory and its output returned."""
+    socket_path = server_factory(workers=1)
+    status, out, err = send_command(socket_path, ["help"], cwd=str(tmp_path))
+    assert status == 0
+    assert "IMPROVER NWP post-processing toolbox" in out
+    assert err == ""
+
+
+def test_concurrent_jobs(server_factory):
+    """Test that several commands can be sent at once and each gets
+    its own response."""
+    socket_path = server_factory(workers=2, job=_pid_job)
+    with ThreadPoolExecutor(4) as executor:
+        results = list(
+            executor.map(lambda i: send_command(socket_path, [str(i)], "/"), range(8))
+        )
+    for i, (status, out, _) in enumerate(results):
+        assert status == 0
+        assert out.split()[1:] == [str(i), "/"]
+    assert os.getpid() not in {int(out.split()[0]) for _, out, _ in results}
+
+
+def test_workers_recycled(server_factory):
+    """Test that workers are replaced after max_jobs_per_worker jobs."""
+    socket_path = server_factory(workers=1, max_jobs_per_worker=1, job=_pid_job)
+    pids = [int(send_command(socket_path, ["x"])[1].split()[0]) for _ in range(3)]
+    assert len(set(pids)) == 3
+
+
+def test_workers_reused(server_factory):
+    """Test that workers are kept for several jobs without recycling."""
+    socket_path = server_factory(workers=1, max_jobs_per_worker=None, job=_pid_job)
+    pids = [int(send_command(socket_path, ["x"])[1].split()[0]) for _ in range(3)]
+    assert len(set(pids)) == 1
+
+
+def test_client_main(server_factory, capsys):
+    """Test that the client echoes output and returns the exit status."""
+    socket_path = server_factory(workers=1)
+    status = client_main([socket_path, "no-such-command"])
+    assert status == 2
+    captured = capsys.readouterr()
+    assert 'Unknown command "no-such-command"' in captured.err
+
+
+def test_client_main_no_args(capsys):
+    """Test that the client reports usage when given no arguments."""
+    assert client_main([]) == 2
+    assert "usage" in capsys.readouterr().err
+
+
+def test_stale_socket_replaced(tmp_path):
+    """Test that a socket file left by a server no longer running is replaced,
+    while one in use raises an error."""
+    socket_path = str(tmp_path / "stale.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(socket_path)
+    server = CommandServer(socket_path, workers=1, job=_pid_job)
+    try:
+        with pytest.raises(OSError, match="Address already in use"):
+            CommandServer(socket_path, workers=1, job=_pid_job)
+    finally:
+        server.server_close()
+    assert not os.path.exists(socket_path)
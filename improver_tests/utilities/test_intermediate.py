@@ -0,0 +1,87 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the intermediate file format."""
+
+import numpy as np
+import pytest
+from iris.cube import CubeList
+
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.intermediate import (
+    is_intermediate,
+    load_intermediate,
+    save_intermediate,
+)
+from improver.utilities.load import load_cube, load_cubelist
+
+
+@pytest.fixture(name="cube")
+def cube_fixture():
+    """Temperature cube with realizations."""
+    data = np.arange(27, dtype=np.float32).reshape((3, 3, 3)) + 273.15
+    return set_up_variable_cube(data)
+
+
+def test_is_intermediate():
+    """Test intermediate files are identified by their extension."""
+    assert is_intermediate("scratch/temperature.imp")
+    assert not is_intermediate("scratch/temperature.nc")
+
+
+def test_round_trip(tmp_path, cube):
+    """Test a cube is loaded lazily and unchanged."""
+    filepath = tmp_path / "temperature.imp"
+    save_intermediate(cube, filepath)
+    (result,) = load_intermediate(filepath)
+    assert result.has_lazy_data()
+    assert result == cube
+    assert result.dtype == np.float32
+
+
+def test_masked_cubelist(tmp_path, cube):
+    """Test a list of cubes including masked data is loaded in order."""
+    masked = cube.copy(data=np.ma.masked_greater(cube.data, 290))
+    masked.rename("masked_temperature")
+    filepath = tmp_path / "temperature.imp"
+    save_intermediate(CubeList([cube, masked]), filepath)
+    result = load_intermediate(filepath)
+    assert [item.name() for item in result] == ["air_temperature", "masked_temperature"]
+    assert np.ma.is_masked(result[1].data)
+    np.testing.assert_array_equal(result[1].data.mask, masked.data.mask)
+    assert not np.ma.is_masked(result[0].data)
+
+
+def test_realised_data_copy_on_write(tmp_path, cube):
+    """Test realised data can be modified without changing the file."""
+    filepath = tmp_path / "temperature.imp"
+    save_intermediate(cube, filepath)
+    (result,) = load_intermediate(filepath)
+    result.data += 1
+    (reloaded,) = load_intermediate(filepath)
+    np.testing.assert_array_equal(reloaded.data, cube.data)
+
+
+def test_replace_existing(tmp_path, cube):
+    """Test saving over an existing file replaces it, leaving no temporary
+    files behind."""
+    filepath = tmp_path / "temperature.imp"
+    save_intermediate(cube, filepath)
+    save_intermediate(cube.copy(data=cube.data + 1), filepath)
+    (result,) = load_intermediate(filepath)
+    np.testing.assert_array_equal(result.data, cube.data + 1)
+    assert [path.name for path in tmp_path.iterdir()] == ["temperature.imp"]
+
+
+def test_load_cube(tmp_path, cube):
+    """Test intermediate files are loaded by load_cube and load_cubelist,
+    with constraints applied."""
+    other = cube.copy()
+    other.rename("dew_point_temperature")
+    filepath = tmp_path / "temperature.imp"
+    save_intermediate(CubeList([cube, other]), filepath)
+    result = load_cube(str(filepath), "air_temperature")
+    assert result.name() == "air_temperature"
+    assert result.has_lazy_data()
+    assert len(load_cubelist(str(filepath))) == 2
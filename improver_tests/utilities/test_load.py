@@ -20,7 +20,7 @@ from improver.synthetic_data.set_up_test_cubes import (
     set_up_probability_cube,
     set_up_variable_cube,
 )
-from improver.utilities.load import load_cube, load_cubelist
+from improver.utilities.load import clear_load_cache, load_cube, load_cubelist
 from improver.utilities.save import save_netcdf
 
 
@@ -410,6 +410,58 @@ class Test_load_cubelist(IrisTest):
         result = load_cubelist([self.filepath, self.filepath])
         self.assertArrayEqual([True, True], [_.has_lazy_data() for _ in result])
 
+    def test_workers_preserve_order(self):
+        """Test that loading with several threads returns the cubes in the
+        order of the filepaths."""
+        low_cloud_cube = self.cube.copy()
+        low_cloud_cube.rename("low_type_cloud_area_fraction")
+        low_cloud_cube.units = 1
+        save_netcdf(low_cloud_cube, self.low_cloud_filepath)
+        filepaths = [self.low_cloud_filepath, self.filepath] * 3
+        result = load_cubelist(filepaths, workers=4)
+        self.assertEqual(
+            [cube.name() for cube in result],
+            ["low_type_cloud_area_fraction", "air_temperature"] * 3,
+        )
+
+    def test_name_constraint(self):
+        """Test that a name constraint selects cubes from a list of files."""
+        low_cloud_cube = self.cube.copy()
+        low_cloud_cube.rename("low_type_cloud_area_fraction")
+        low_cloud_cube.units = 1
+        save_netcdf(low_cloud_cube, self.low_cloud_filepath)
+        result = load_cubelist(
+            [self.low_cloud_filepath, self.filepath],
+            constraints="air_temperature",
+            workers=2,
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].name(), "air_temperature")
+
+    def test_repeated_load_independent(self):
+        """Test that cubes loaded again from the cache are copies which can
+        be modified without affecting later loads."""
+        clear_load_cache()
+        first = load_cubelist(self.filepath)
+        first[0].rename("modified")
+        first[0].attributes["test"] = "modified"
+        second = load_cubelist(self.filepath)
+        self.assertEqual(second[0].name(), "air_temperature")
+        self.assertNotIn("test", second[0].attributes)
+        self.assertTrue(second[0].has_lazy_data())
+
+    def test_modified_file_reloaded(self):
+        """Test that a file which is rewritten is loaded again rather than
+        taken from the cache."""
+        load_cubelist(self.filepath)
+        cube = self.cube.copy()
+        cube.rename("low_type_cloud_area_fraction")
+        cube.units = 1
+        os.remove(self.filepath)
+        save_netcdf(cube, self.filepath)
+        result = load_cubelist(self.filepath)
+        self.assertEqual(result[0].name(), "low_type_cloud_area_fraction")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,60 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the process-wide memory budget."""
+
+import pytest
+
+from improver.utilities.memory_budget import (
+    MAX_MEMORY_ENV,
+    batch_size,
+    batches,
+    memory_budget,
+    parse_memory_size,
+)
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    (
+        ("1024", 1024),
+        ("2K", 2048),
+        ("1.5M", 1536 * 1024),
+        ("4GiB", 4 * 1024**3),
+        ("1tb", 1024**4),
+    ),
+)
+def test_parse_memory_size(size, expected):
+    """Test memory sizes are converted to bytes."""
+    assert parse_memory_size(size) == expected
+
+
+@pytest.mark.parametrize("size", ("", "G", "4X", "-1G"))
+def test_parse_memory_size_error(size):
+    """Test an error is raised for invalid memory sizes."""
+    with pytest.raises(ValueError, match="Invalid memory size"):
+        parse_memory_size(size)
+
+
+def test_no_budget(monkeypatch):
+    """Test the default batch size is used if no budget is set."""
+    monkeypatch.delenv(MAX_MEMORY_ENV, raising=False)
+    assert memory_budget() is None
+    assert batch_size(100, 10) == 1
+    assert batch_size(100, 10, default=20) == 10
+
+
+@pytest.mark.parametrize(
+    "item_bytes, expected", ((100, 10), (300, 3), (2000, 1), (0, 10))
+)
+def test_batch_size(monkeypatch, item_bytes, expected):
+    """Test the batch size fits within the budget, is at least 1 and is at
+    most the number of items."""
+    monkeypatch.setenv(MAX_MEMORY_ENV, "1K")
+    assert batch_size(item_bytes, 10) == expected
+
+
+def test_batches():
+    """Test items are split into consecutive batches covering them all."""
+    assert list(batches(7, 3)) == [slice(0, 3), slice(3, 6), slice(6, 7)]
@@ -6,12 +6,17 @@
 
 import numpy as np
 import pytest
+from scipy.ndimage import correlate, maximum_filter1d
 
+from improver.nbhood.nbhood import circular_kernel
 from improver.utilities.neighbourhood_tools import (
     boxsum,
+    chord_sum,
+    multi_boxsum,
     pad_and_roll,
     pad_boxsum,
     rolling_window,
+    running_maximum,
 )
 
 
@@ -185,3 +190,66 @@ def test_boxsum_exception_not_odd(array_size_5):
     with pytest.raises(ValueError) as exc_info:
         boxsum(array_size_5, (1, 2))
     assert msg in str(exc_info.value)
+
+
+def test_multi_boxsum_with_padding(array_size_5):
+    """Test that multi_boxsum gives the same neighbourhood sums as boxsum
+    for each neighbourhood size."""
+    boxsizes = [1, 5, 3, (3, 5)]
+    result = multi_boxsum(array_size_5, boxsizes, mode="constant", constant_values=0)
+    assert len(result) == len(boxsizes)
+    for boxsize, sums in zip(boxsizes, result):
+        expected = boxsum(array_size_5, boxsize, mode="constant", constant_values=0)
+        np.testing.assert_array_equal(sums, expected)
+
+
+def test_multi_boxsum_without_padding(array_size_5):
+    """Test that without padding the sums for each neighbourhood size are
+    centred on the points of the sums for the largest."""
+    small, large = multi_boxsum(array_size_5, [1, 3])
+    np.testing.assert_array_equal(large, boxsum(array_size_5, 3))
+    np.testing.assert_array_equal(small, array_size_5[2:4, 2:4])
+
+
+def test_multi_boxsum_exception_not_odd(array_size_5):
+    """Test that an exception is raised if any size is not an odd number."""
+    msg = "The size of the neighbourhood must be an odd number."
+    with pytest.raises(ValueError, match=msg):
+        multi_boxsum(array_size_5, [3, 4])
+
+
+@pytest.mark.parametrize("ranges", (1, 3, 6))
+@pytest.mark.parametrize(
+    "pad_options, mode",
+    (({"mode": "edge"}, "nearest"), ({"mode": "constant"}, "constant")),
+)
+def test_chord_sum(ranges, pad_options, mode):
+    """Test that chord_sum matches correlation with a circular kernel."""
+    rng = np.random.default_rng(0)
+    data = rng.random((2, 15, 12)).astype(np.float32)
+    kernel = circular_kernel(ranges, weighted_mode=False)
+    result = chord_sum(data, kernel, **pad_options)
+    expected = correlate(data, kernel[np.newaxis], mode=mode)
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
+def test_chord_sum_exception_weighted_kernel(array_size_5):
+    """Test that an exception is raised if the kernel rows are not runs of
+    ones."""
+    msg = "Each row of the kernel must be a run of ones centred on the kernel."
+    with pytest.raises(ValueError, match=msg):
+        chord_sum(array_size_5, circular_kernel(2, weighted_mode=True))
+
+
+@pytest.mark.parametrize("half_width", (0, 1, 4, 20))
+@pytest.mark.parametrize("axis", (-1, 1))
+def test_running_maximum(half_width, axis):
+    """Test that running_maximum matches a maximum filter which reflects the
+    data at its edges, for windows smaller and larger than the data."""
+    rng = np.random.default_rng(0)
+    data = rng.random((2, 15, 12)).astype(np.float32)
+    result = running_maximum(data, half_width, axis=axis)
+    expected = maximum_filter1d(data, 2 * half_width + 1, axis=axis)
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, expected)
@@ -0,0 +1,129 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for utilities.pipeline."""
+
+import json
+
+import numpy as np
+import pytest
+
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.load import load_cube
+from improver.utilities.pipeline import load_pipeline, parse_pipeline, run_pipeline
+
+
+@pytest.fixture
+def cube():
+    """Temperature cube with values 270 to 278 K."""
+    data = np.arange(270, 279, dtype=np.float32).reshape(1, 3, 3)
+    return set_up_variable_cube(data, spatial_grid="equalarea")
+
+
+@pytest.fixture
+def pipeline(cube, tmp_path):
+    """Pipeline with a clipped result shared by two further steps, one of
+    which is written to file."""
+    return {
+        "steps": {
+            "sum": {
+                "command": "combine",
+                "args": ["@clipped", "@clipped", "--operation", "+"],
+                "output": str(tmp_path / "sum.nc"),
+            },
+            "clipped": {"command": "clip", "args": [cube, "--max-value", 275]},
+            "max": {
+                "command": "combine",
+                "args": ["@clipped", cube, "--operation", "max"],
+            },
+        }
+    }
+
+
+def test_parse_pipeline_order(pipeline):
+    """Test that steps are ordered after their dependencies."""
+    result = parse_pipeline(pipeline)
+    assert list(result) == ["clipped", "sum", "max"]
+    assert result["sum"] == ["clipped"]
+    assert result["clipped"] == []
+
+
+@pytest.mark.parametrize(
+    "steps, message",
+    (
+        ({}, "at least one step"),
+        ({"a": {"args": []}}, "has no command"),
+        ({"a": {"command": "clip", "args": ["@b"]}}, "unknown step 'b'"),
+        (
+            {
+                "a": {"command": "clip", "args": ["@b"]},
+                "b": {"command": "clip", "args": ["@a"]},
+                "c": {"command": "clip", "args": ["c.nc"]},
+            },
+            "cycle involving steps: a, b$",
+        ),
+    ),
+)
+def test_parse_pipeline_errors(steps, message):
+    """Test errors for invalid pipelines."""
+    with pytest.raises(ValueError, match=message):
+        parse_pipeline({"steps": steps})
+
+
+@pytest.mark.parametrize("workers", (1, 3))
+def test_run_pipeline(pipeline, tmp_path, workers):
+    """Test that steps are run with shared results passed in memory, that
+    only the declared output is written and that unused results without an
+    output are returned."""
+    result = run_pipeline(pipeline, workers=workers)
+    expected = np.minimum(np.arange(270, 279), 275).reshape(1, 3, 3)
+    saved = load_cube(str(tmp_path / "sum.nc"))
+    np.testing.assert_array_almost_equal(saved.data, 2 * expected)
+    assert list(result) == ["max"]
+    np.testing.assert_array_almost_equal(
+        result["max"].data, np.arange(270, 279).reshape(1, 3, 3)
+    )
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["sum.nc"]
+
+
+def test_run_pipeline_error(cube):
+    """Test that an error in a step is raised."""
+    pipeline = {
+        "steps": {
+            "a": {"command": "clip", "args": [cube]},
+            "b": {"command": "combine", "args": ["@a", "--operation", "nonsense"]},
+        }
+    }
+    with pytest.raises(ValueError, match="Unknown operation"):
+        run_pipeline(pipeline, workers=2)
+
+
+def test_run_pipeline_dry_run(pipeline, tmp_path, capsys):
+    """Test that a dry run prints the commands in order without running them."""
+    assert run_pipeline(pipeline, dry_run=True) == {}
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(":")[0] for line in lines] == ["clipped", "sum", "max"]
+    assert lines[1] == (
+        f"sum: improver combine <clipped> <clipped> --operation + "
+        f"--output {tmp_path / 'sum.nc'}"
+    )
+    assert not list(tmp_path.iterdir())
+
+
+def test_load_pipeline_json(tmp_path):
+    """Test loading a pipeline from a JSON file."""
+    definition = {"steps": {"a": {"command": "clip", "args": ["in.nc"]}}}
+    path = tmp_path / "pipeline.json"
+    path.write_text(json.dumps(definition))
+    assert load_pipeline(path) == definition
+
+
+def test_load_pipeline_yaml(tmp_path):
+    """Test loading a pipeline from a YAML file."""
+    pytest.importorskip("yaml")
+    path = tmp_path / "pipeline.yaml"
+    path.write_text("steps:\n  a:\n    command: clip\n    args: [in.nc]\n")
+    assert load_pipeline(path) == {
+        "steps": {"a": {"command": "clip", "args": ["in.nc"]}}
+    }
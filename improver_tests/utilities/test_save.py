@@ -18,7 +18,12 @@ from netCDF4 import Dataset
 
 from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
 from improver.utilities.load import load_cube
-from improver.utilities.save import _order_cell_methods, save_netcdf
+from improver.utilities.save import (
+    _order_cell_methods,
+    save_netcdf,
+    save_netcdf_async,
+    wait_for_saves,
+)
 
 
 def set_up_test_cube():
@@ -229,6 +234,43 @@ class Test_save_netcdf(IrisTest):
         self.assertNotIn("least_significant_digit", cube.attributes)
 
 
+def test_save_netcdf_async(tmp_path):
+    """Test a background save writes the same file as a synchronous save,
+    with no temporary file left behind"""
+    cube = set_up_test_cube()
+    future = save_netcdf_async(cube, tmp_path / "async.nc", copy=True)
+    save_netcdf(cube, tmp_path / "sync.nc")
+    wait_for_saves()
+    assert future.done()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "async.nc",
+        "sync.nc",
+    ]
+    assert load_cube(str(tmp_path / "async.nc")) == load_cube(
+        str(tmp_path / "sync.nc")
+    )
+
+
+def test_save_netcdf_async_metadata_error(tmp_path):
+    """Test metadata errors are raised before a background save starts"""
+    cube = set_up_test_cube()
+    cube.units = "unknown"
+    with pytest.raises(ValueError, match="unknown units"):
+        save_netcdf_async(cube, tmp_path / "temp.nc")
+    wait_for_saves()
+    assert not list(tmp_path.iterdir())
+
+
+def test_wait_for_saves_error(tmp_path):
+    """Test an error writing in the background is raised by wait_for_saves"""
+    cube = set_up_test_cube()
+    save_netcdf_async(cube, tmp_path / "missing" / "temp.nc")
+    with pytest.raises(OSError):
+        wait_for_saves()
+    # errors are only raised once
+    wait_for_saves()
+
+
 @pytest.fixture(name="bitshaving_cube")
 def bitshaving_cube_fixture():
     """Sets up a cube with a recurring decimal for bitshaving testing"""
@@ -0,0 +1,97 @@
+# (C) Crown Copyright, Met Office. All rights reserved.
+#
+# This file is part of 'IMPROVER' and is released under the BSD 3-Clause license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for running plugins over spatial tiles."""
+
+import numpy as np
+import pytest
+
+from improver import BasePlugin
+from improver.nbhood.nbhood import NeighbourhoodProcessing
+from improver.synthetic_data.set_up_test_cubes import set_up_probability_cube
+from improver.utilities.spatial import OccurrenceWithinVicinity
+from improver.utilities.tiling import SpatialTiling, tile_bounds
+
+
+class AddOne(BasePlugin):
+    """Plugin which does not declare a halo."""
+
+    def process(self, cube):
+        return cube.copy(data=cube.data + 1)
+
+
+@pytest.fixture(name="cube")
+def cube_fixture():
+    """Probability cube on a 2 km equal area grid with random data."""
+    rng = np.random.default_rng(0)
+    data = (rng.random((2, 30, 40)) > 0.7).astype(np.float32)
+    return set_up_probability_cube(
+        data,
+        np.array([273.0, 275.0], dtype=np.float32),
+        spatial_grid="equalarea",
+        x_grid_spacing=2000,
+        y_grid_spacing=2000,
+    )
+
+
+@pytest.mark.parametrize(
+    "size, tile_size, expected",
+    (
+        (10, 10, [(0, 10)]),
+        (10, 4, [(0, 3), (3, 7), (7, 10)]),
+        (3, 5, [(0, 3)]),
+    ),
+)
+def test_tile_bounds(size, tile_size, expected):
+    """Test dimensions are split into tiles of near equal size."""
+    assert tile_bounds(size, tile_size) == expected
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.parametrize(
+    "plugin",
+    (
+        NeighbourhoodProcessing("square", 6000),
+        NeighbourhoodProcessing("circular", 6000),
+        OccurrenceWithinVicinity(grid_point_radii=[2]),
+    ),
+)
+def test_matches_whole_domain(cube, plugin, workers):
+    """Test the tiled result matches the result on the whole domain."""
+    expected = plugin(cube.copy())
+    result = SpatialTiling(plugin, tile_size=12, workers=workers)(cube)
+    assert result.coord(axis="x") == expected.coord(axis="x")
+    assert result.coord(axis="y") == expected.coord(axis="y")
+    assert result.name() == expected.name()
+    np.testing.assert_allclose(result.data, expected.data, atol=1e-6)
+
+
+def test_mask_cube_tiled(cube):
+    """Test a mask cube argument on the same grid is tiled with the input."""
+    mask = cube[0].copy(data=np.ones(cube.shape[1:], dtype=np.float32))
+    mask.data[:, :10] = 0
+    plugin = NeighbourhoodProcessing("square", 4000)
+    expected = plugin(cube.copy(), mask_cube=mask)
+    result = SpatialTiling(plugin, tile_size=16, workers=2)(cube, mask_cube=mask)
+    np.testing.assert_array_equal(result.data.mask, expected.data.mask)
+    np.testing.assert_allclose(result.data, expected.data, atol=1e-6)
+
+
+def test_halo_argument(cube):
+    """Test a halo can be given for plugins which do not declare one."""
+    result = SpatialTiling(AddOne(), tile_size=16, halo=0, workers=1)(cube)
+    np.testing.assert_array_equal(result.data, cube.data + 1)
+
+
+def test_no_halo_error(cube):
+    """Test an error is raised if the plugin does not declare its halo."""
+    with pytest.raises(ValueError, match="AddOne does not declare the halo"):
+        SpatialTiling(AddOne())(cube)
+
+
+def test_yx_not_last_error(cube):
+    """Test an error is raised if the y and x dimensions are not last."""
+    cube.transpose([1, 0, 2])
+    with pytest.raises(ValueError, match="y and x dimensions to be the last"):
+        SpatialTiling(AddOne(), halo=0)(cube)